@@ -21,6 +21,20 @@ class SearchRequest(BaseModel):
     category: str | None = Field(default=None, description="Filter by category")
     text_only: bool = Field(default=False, description="Use text search only")
     min_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Minimum similarity score")
+    include_documents: bool = Field(
+        default=True,
+        description="Fetch indexed skill text from the vector store (semantic search only)",
+    )
+
+
+class BatchSearchRequest(BaseModel):
+    """Request for running several skill searches at once."""
+
+    queries: list[str] = Field(min_length=1, max_length=50, description="Search queries")
+    limit: int = Field(default=10, ge=1, le=50, description="Maximum results per query")
+    tags: list[str] | None = Field(default=None, description="Filter by tags")
+    category: str | None = Field(default=None, description="Filter by category")
+    min_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Minimum similarity score")
 
 
 class ReadRequest(BaseModel):
@@ -154,6 +168,12 @@ class SearchResponse(BaseModel):
     total: int
 
 
+class BatchSearchResponse(BaseModel):
+    """Response for a batch of skill searches, one entry per query."""
+
+    results: list[SearchResponse]
+
+
 class ReadResponse(BaseModel):
     """Response for reading a skill."""
 
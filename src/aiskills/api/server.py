@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .models import (
+    BatchSearchRequest,
+    BatchSearchResponse,
     BrowseRequest,
     BrowseResponse,
     ErrorResponse,
@@ -36,6 +38,11 @@ from .models import (
     UseResponse,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from ..models.skill import SkillIndex
+
 
 def create_app():
     """Create the FastAPI application."""
@@ -225,6 +232,7 @@ def create_app():
                     tags=request.tags,
                     category=request.category,
                     min_score=request.min_score,
+                    include_documents=request.include_documents,
                 )
                 return SearchResponse(
                     query=request.query,
@@ -270,6 +278,66 @@ def create_app():
                     )
                 raise
 
+    @app.post("/skills/search/batch", response_model=BatchSearchResponse)
+    async def search_skills_batch(request: BatchSearchRequest) -> BatchSearchResponse:
+        """Run several semantic searches with one vector store query."""
+        from ..core.registry import get_registry
+
+        registry = get_registry()
+
+        def to_response(
+            query: str, search_type: str, results: Sequence[tuple[SkillIndex, float | None]]
+        ) -> SearchResponse:
+            return SearchResponse(
+                query=query,
+                type=search_type,
+                results=[
+                    SearchResult(
+                        skill=SkillInfo(
+                            name=idx.name,
+                            version=idx.version,
+                            description=idx.description,
+                            tags=idx.tags,
+                            category=idx.category,
+                            source=idx.source,
+                        ),
+                        score=None if score is None else round(score, 3),
+                    )
+                    for idx, score in results
+                ],
+                total=len(results),
+            )
+
+        try:
+            batch = registry.search_batch(
+                request.queries,
+                limit=request.limit,
+                tags=request.tags,
+                category=request.category,
+                min_score=request.min_score,
+            )
+        except Exception as e:
+            if "not installed" not in str(e).lower():
+                raise
+            # Fallback to text search
+            return BatchSearchResponse(
+                results=[
+                    to_response(
+                        query,
+                        "text",
+                        [(idx, None) for idx in registry.search_text(query, limit=request.limit)],
+                    )
+                    for query in request.queries
+                ]
+            )
+
+        return BatchSearchResponse(
+            results=[
+                to_response(query, "semantic", results)
+                for query, results in zip(request.queries, batch)
+            ]
+        )
+
     @app.post("/skills/suggest", response_model=SuggestResponse)
     async def suggest_skills(request: SuggestRequest):
         """Suggest relevant skills based on context."""
@@ -71,7 +71,7 @@ def info(
     lock_mgr = LockFileManager(paths)
     locked_skill = None
     try:
-        lock_mgr.load(global_install=global_skill, create=False)
+        lock_mgr.open(global_install=global_skill, create=False)
         locked_skill = lock_mgr.get_locked_skill(name)
     except FileNotFoundError:
         pass
@@ -59,9 +59,8 @@ def list_skills(
 
     search_dirs = paths.get_search_dirs()
 
-    for skills_dir, location_type in search_dirs:
-        # Determine if this is project or global
-        is_global = str(skills_dir).startswith(str(paths.global_base))
+    for skills_dir, source, location_type in search_dirs:
+        is_global = source == "global"
 
         if global_only and not is_global:
             continue
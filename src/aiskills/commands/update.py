@@ -105,7 +105,7 @@ def update(
         # Also check lock file for source-specific updates
         lock_mgr = LockFileManager(paths)
         try:
-            lock_mgr.load(global_install=global_only, create=False)
+            lock_mgr.open(global_install=global_only, create=False)
             for skill in installed:
                 name = skill.manifest.name
                 if name in updates_available:
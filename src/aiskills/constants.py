@@ -11,7 +11,9 @@ VARIABLES_FILE = "variables.yaml"
 # Directory names
 SKILLS_DIR = "skills"
 CACHE_DIR = "cache"
+OBJECTS_DIR = "objects"  # Content-addressed store inside the cache
 REGISTRY_DIR = "registry"
+TEMPLATE_CACHE_DIR = "templates"  # Compiled Jinja2 bytecode
 REFERENCES_DIR = "references"
 SCRIPTS_DIR = "scripts"
 ASSETS_DIR = "assets"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -13,7 +14,7 @@ from ..constants import (
     SKILL_FILE,
 )
 from ..models.skill import Skill, SkillManifest, SkillPrecedence
-from .parser import ParseError, YAMLParser, get_parser
+from .parser import ParseError, ParseResult, YAMLParser, get_parser
 
 
 # Local override file name
@@ -48,8 +49,34 @@ class SkillLoader:
     - Validating skill structure
     """
 
+    # Parsed files kept for reuse while their mtime and size are unchanged
+    PARSE_CACHE_SIZE = 256
+
     def __init__(self, parser: YAMLParser | None = None):
         self.parser = parser or get_parser()
+        self._parse_cache: dict[str, tuple[int, int, ParseResult]] = {}
+
+    def _parse_file(self, file: Path, st: os.stat_result) -> ParseResult:
+        """Parse a skill file, reusing the last result if it has not changed.
+
+        Args:
+            file: Absolute path of the file
+            st: Its current stat result
+
+        Returns:
+            Parse result for the file's current content
+        """
+        key = str(file)
+        cached = self._parse_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        result = self.parser.parse(file.read_text(encoding="utf-8"))
+        if key not in self._parse_cache and len(self._parse_cache) >= self.PARSE_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._parse_cache[next(iter(self._parse_cache))]
+        self._parse_cache[key] = (st.st_mtime_ns, st.st_size, result)
+        return result
 
     def load(
         self,
@@ -81,12 +108,15 @@ class SkillLoader:
         if not path.is_dir():
             raise LoadError("Path is not a directory", str(path))
 
-        skill_file = path / SKILL_FILE
+        # Absolute paths key the parse cache and become Skill.path
+        abs_path = path.absolute()
+        skill_file = abs_path / SKILL_FILE
         if not skill_file.exists():
             raise LoadError(f"No {SKILL_FILE} found in directory", str(path))
 
         # Check file size
-        size_kb = skill_file.stat().st_size / 1024
+        st = skill_file.stat()
+        size_kb = st.st_size / 1024
         if size_kb > MAX_SKILL_SIZE_KB:
             raise LoadError(
                 f"{SKILL_FILE} is too large ({size_kb:.1f}KB > {MAX_SKILL_SIZE_KB}KB)",
@@ -94,22 +124,21 @@ class SkillLoader:
             )
 
         # Read and parse base skill
-        raw_content = skill_file.read_text(encoding="utf-8")
-
         try:
-            result = self.parser.parse(raw_content)
+            result = self._parse_file(skill_file, st)
         except ParseError as e:
             raise LoadError(str(e), str(skill_file)) from e
 
         manifest = result.manifest
         content = result.content
+        raw_content = result.raw_content
 
         # Check for local overrides
-        local_file = path / SKILL_LOCAL_FILE
+        local_file = abs_path / SKILL_LOCAL_FILE
         if apply_local_overrides and local_file.exists():
             try:
-                local_content = local_file.read_text(encoding="utf-8")
-                local_result = self.parser.parse(local_content)
+                local_result = self._parse_file(local_file, local_file.stat())
+                local_content = local_result.raw_content
 
                 # Merge local overrides into manifest
                 manifest = self._merge_manifest(manifest, local_result.manifest)
@@ -130,7 +159,7 @@ class SkillLoader:
             manifest=manifest,
             content=content,
             raw_content=raw_content,
-            path=str(path.absolute()),
+            path=str(abs_path),
             source=source,
             location_type=location_type,
         )
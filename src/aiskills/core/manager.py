@@ -53,7 +53,7 @@ class SkillManager:
         key = "global" if global_install else "project"
         if key not in self._lock_managers:
             manager = LockFileManager(self.paths)
-            manager.load(global_install=global_install)
+            manager.open(global_install=global_install)
             self._lock_managers[key] = manager
         return self._lock_managers[key]
 
@@ -128,8 +128,8 @@ class SkillManager:
         """
         seen_names: set[str] = set()
 
-        for skills_dir, location_type in self.paths.get_search_dirs():
-            is_global = str(skills_dir).startswith(str(self.paths.global_base))
+        for skills_dir, source, location_type in self.paths.get_search_dirs():
+            is_global = source == "global"
 
             if not include_global and is_global:
                 continue
@@ -346,6 +346,7 @@ class SkillManager:
 
         # Invalidate cache for this skill
         self._invalidate_skill_cache(skill.manifest.name)
+        self.paths.clear_cache()
 
         # Update lock file
         lock = self._get_lock_manager(global_install)
@@ -426,6 +427,7 @@ class SkillManager:
 
         # Invalidate cache
         self._invalidate_skill_cache(name)
+        self.paths.clear_cache()
 
         # Update lock file
         is_global = source == "global"
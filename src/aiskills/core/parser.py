@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
+from typing import Any
 
 import yaml
 
@@ -22,10 +24,102 @@ from ..models.skill import (
 )
 from ..models.variable import SkillVariable
 
+# Prefer the libyaml-backed loader; pure-Python PyYAML builds fall back to SafeLoader.
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YAMLLoader  # type: ignore[assignment, unused-ignore]
 
-@dataclass
+_STR_TAG = "tag:yaml.org,2002:str"
+_MAP_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+
+class _NotPlainYAMLError(Exception):
+    """Raised when a document needs PyYAML's full constructor."""
+
+
+class _FrontmatterLoader(_YAMLLoader):  # type: ignore[misc, unused-ignore]
+    """Safe loader with a direct path for plain mapping/sequence/string trees.
+
+    PyYAML's generic constructor drives every node through generator-based
+    two-phase construction. Frontmatter is almost always plain maps, lists and
+    strings, so those are built recursively in one pass; other scalars go
+    through the regular constructor. Merge keys, recursive anchors, non-scalar
+    keys and other node types fall back to ``SafeConstructor.construct_document``.
+    """
+
+    def construct_document(self, node: yaml.Node) -> Any:
+        try:
+            return self._construct_plain(node, {})
+        except _NotPlainYAMLError:
+            pass
+        finally:
+            self.constructed_objects: dict[yaml.Node, Any] = {}
+            self.recursive_objects: dict[yaml.Node, None] = {}
+        return super().construct_document(node)
+
+    def _construct_plain(self, node: yaml.Node, memo: dict[int, Any]) -> Any:
+        key = id(node)
+        if key in memo:
+            value = memo[key]
+            if value is memo:  # Still under construction: recursive alias
+                raise _NotPlainYAMLError
+            return value
+
+        tag = node.tag
+        if tag == _STR_TAG:
+            return node.value
+        if tag == _MAP_TAG:
+            memo[key] = memo
+            mapping: dict[Any, Any] = {}
+            for key_node, value_node in node.value:
+                # Non-scalar keys are unhashable; let PyYAML report them
+                if not isinstance(key_node, yaml.ScalarNode) or key_node.tag == _MERGE_TAG:
+                    raise _NotPlainYAMLError
+                mapping[self._construct_plain(key_node, memo)] = self._construct_plain(
+                    value_node, memo
+                )
+            memo[key] = mapping
+            return mapping
+        if tag == _SEQ_TAG:
+            memo[key] = memo
+            sequence = [self._construct_plain(item, memo) for item in node.value]
+            memo[key] = sequence
+            return sequence
+        if isinstance(node, yaml.ScalarNode):
+            return self.construct_object(node)
+        raise _NotPlainYAMLError
+
+
+# Matches ---\n<yaml>\n--- at the first non-whitespace character of the file.
+# No ^ anchor: match() anchors at the given start position, where ^ would not.
+_FRONTMATTER_RE = re.compile(
+    rf"{FRONTMATTER_DELIMITER}\s*\n(.*?)\n{FRONTMATTER_DELIMITER}\s*\n?", re.DOTALL
+)
+_LEADING_WHITESPACE_RE = re.compile(r"\s*")
+_CLOSING_DELIMITER = f"\n{FRONTMATTER_DELIMITER}"
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings that repeat across manifests (versions, tags, tool names)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_list(values: Any) -> Any:
+    """Intern every string in a list; other values pass through for validation."""
+    if not isinstance(values, list):
+        return values
+    return [_intern(v) for v in values]
+
+
+@dataclass(slots=True, frozen=True)
 class ParseResult:
-    """Result of parsing a SKILL.md file."""
+    """Result of parsing a SKILL.md file.
+
+    Frozen because parse results are memoized and shared between callers.
+    """
 
     manifest: SkillManifest
     content: str
@@ -36,11 +130,16 @@ class ParseError(Exception):
     """Error parsing SKILL.md file."""
 
     def __init__(self, message: str, line: int | None = None):
+        self.message = message
         self.line = line
-        if line:
-            message = f"Line {line}: {message}"
         super().__init__(message)
 
+    def __str__(self) -> str:
+        # Formatted on demand so errors that are caught and discarded cost nothing extra
+        if self.line:
+            return f"Line {self.line}: {self.message}"
+        return self.message
+
 
 class YAMLParser:
     """Parser for SKILL.md YAML frontmatter.
@@ -52,9 +151,21 @@ class YAMLParser:
     - Custom types (dependencies, variables, etc.)
     """
 
+    _loader: type[yaml.SafeLoader] = _FrontmatterLoader
+
+    # Results are memoized by file content; larger files are always re-parsed.
+    PARSE_CACHE_SIZE = 1024
+    PARSE_CACHE_MAX_CONTENT = 64 * 1024
+
+    def __init__(self) -> None:
+        self._cache: dict[str, ParseResult] = {}
+
     def parse(self, content: str) -> ParseResult:
         """Parse a SKILL.md file into manifest and content.
 
+        Identical content returns the same ParseResult instance, so callers
+        must treat the result as read-only.
+
         Args:
             content: Full content of SKILL.md file
 
@@ -64,6 +175,22 @@ class YAMLParser:
         Raises:
             ParseError: If parsing fails
         """
+        if len(content) > self.PARSE_CACHE_MAX_CONTENT:
+            return self._parse(content)
+
+        cached = self._cache.get(content)
+        if cached is not None:
+            return cached
+
+        result = self._parse(content)
+        if len(self._cache) >= self.PARSE_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[content] = result
+        return result
+
+    def _parse(self, content: str) -> ParseResult:
+        """Parse content without consulting the cache."""
         raw_content = content
         frontmatter_str, markdown_content = self._split_frontmatter(content)
 
@@ -71,7 +198,7 @@ class YAMLParser:
             raise ParseError("Missing YAML frontmatter (file must start with ---)")
 
         try:
-            frontmatter_data = yaml.safe_load(frontmatter_str)
+            frontmatter_data = yaml.load(frontmatter_str, Loader=self._loader)
         except yaml.YAMLError as e:
             raise ParseError(f"Invalid YAML: {e}") from e
 
@@ -93,19 +220,18 @@ class YAMLParser:
             Tuple of (frontmatter_string, content_string)
             frontmatter_string is None if no frontmatter found
         """
-        content = content.strip()
+        # Skip leading whitespace by offset rather than copying a stripped string
+        leading = _LEADING_WHITESPACE_RE.match(content)
+        start = leading.end() if leading else 0
 
-        if not content.startswith(FRONTMATTER_DELIMITER):
+        if not content.startswith(FRONTMATTER_DELIMITER, start):
             return None, content
 
-        # Find the closing delimiter
-        # The pattern matches: ---\n<yaml>\n---
-        pattern = rf"^{FRONTMATTER_DELIMITER}\s*\n(.*?)\n{FRONTMATTER_DELIMITER}\s*\n?"
-        match = re.match(pattern, content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content, start)
 
         if not match:
             # Check if frontmatter is never closed
-            if content.count(f"\n{FRONTMATTER_DELIMITER}") == 0:
+            if content.find(_CLOSING_DELIMITER, start) == -1:
                 raise ParseError("Unclosed frontmatter (missing closing ---)")
             return None, content
 
@@ -144,14 +270,14 @@ class YAMLParser:
         precedence = self._parse_precedence(data.get("precedence", "project"))
 
         return SkillManifest(
-            name=data["name"],
+            name=_intern(data["name"]),
             description=data["description"],
-            version=data.get("version", "1.0.0"),
+            version=_intern(data.get("version", "1.0.0")),
             authors=authors,
-            license=data.get("license"),
+            license=_intern(data.get("license")),
             allowed_tools=allowed_tools,
-            tags=data.get("tags", []),
-            category=data.get("category"),
+            tags=_intern_list(data.get("tags", [])),
+            category=_intern(data.get("category")),
             dependencies=dependencies,
             conflicts=conflicts,
             extends=data.get("extends"),
@@ -193,9 +319,9 @@ class YAMLParser:
                 # Parse "name@version" format
                 if "@" in item:
                     name, version = item.rsplit("@", 1)
-                    deps.append(SkillDependency(name=name, version=version))
+                    deps.append(SkillDependency(name=_intern(name), version=_intern(version)))
                 else:
-                    deps.append(SkillDependency(name=item))
+                    deps.append(SkillDependency(name=_intern(item)))
             elif isinstance(item, dict):
                 deps.append(SkillDependency(**item))
         return deps
@@ -205,7 +331,7 @@ class YAMLParser:
         conflicts = []
         for item in data:
             if isinstance(item, str):
-                conflicts.append(SkillConflict(name=item))
+                conflicts.append(SkillConflict(name=_intern(item)))
             elif isinstance(item, dict):
                 conflicts.append(SkillConflict(**item))
         return conflicts
@@ -254,9 +380,9 @@ class YAMLParser:
         if not data:
             return []
         if isinstance(data, list):
-            return data
+            return [_intern(tool) for tool in data]
         if isinstance(data, str):
-            return data.split()
+            return [_intern(tool) for tool in data.split()]
         return []
 
     def _parse_scope(self, data: dict) -> SkillScope:
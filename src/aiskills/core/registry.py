@@ -10,6 +10,7 @@ from ..storage.paths import PathResolver, get_path_resolver
 
 if TYPE_CHECKING:
     from ..embeddings.base import EmbeddingProvider
+    from ..vector_stores.base import SearchResult as VectorSearchResult
     from ..vector_stores.base import VectorStoreProvider
 
 from ..search.bm25 import BM25Index
@@ -228,6 +229,7 @@ class SkillRegistry:
         tags: list[str] | None = None,
         category: str | None = None,
         min_score: float = 0.0,
+        include_documents: bool = True,
     ) -> list[tuple[SkillIndex, float]]:
         """Search for skills semantically.
 
@@ -237,15 +239,53 @@ class SkillRegistry:
             tags: Filter by tags (any match)
             category: Filter by category
             min_score: Minimum similarity score (0-1)
+            include_documents: Fetch indexed skill text from the vector store.
+                Only needed to describe hits missing from the local index.
 
         Returns:
             List of (SkillIndex, score) tuples sorted by relevance
         """
+        return self.search_batch(
+            [query],
+            limit=limit,
+            tags=tags,
+            category=category,
+            min_score=min_score,
+            include_documents=include_documents,
+        )[0]
+
+    def search_batch(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        tags: list[str] | None = None,
+        category: str | None = None,
+        min_score: float = 0.0,
+        include_documents: bool = True,
+    ) -> list[list[tuple[SkillIndex, float]]]:
+        """Search for skills semantically with several queries at once.
+
+        The vector store receives all query embeddings in a single call.
+
+        Args:
+            queries: Search queries
+            limit: Maximum results per query
+            tags: Filter by tags (any match)
+            category: Filter by category
+            min_score: Minimum similarity score (0-1)
+            include_documents: Fetch indexed skill text (see search())
+
+        Returns:
+            One list of (SkillIndex, score) tuples per query, sorted by relevance
+        """
+        if not queries:
+            return []
+
         embedder = self._get_embedding_provider()
         store = self._get_vector_store()
 
-        # Generate query embedding
-        query_embedding = embedder.embed_query(query)
+        # Generate query embeddings
+        query_embeddings = [embedder.embed_query(query) for query in queries]
 
         # Build filter
         where = None
@@ -253,12 +293,26 @@ class SkillRegistry:
             where = {"category": category}
 
         # Query vector store
-        results = store.query(
-            embedding=query_embedding,
+        batch_results = store.query_batch(
+            query_embeddings,
             n_results=limit * 2,  # Get extra for post-filtering
             where=where,
+            include_documents=include_documents,
         )
 
+        return [
+            self._filter_matches(results, limit, tags, min_score)
+            for results in batch_results
+        ]
+
+    def _filter_matches(
+        self,
+        results: list[VectorSearchResult],
+        limit: int,
+        tags: list[str] | None,
+        min_score: float,
+    ) -> list[tuple[SkillIndex, float]]:
+        """Post-filter vector store hits into sorted (SkillIndex, score) tuples."""
         # Post-filter and build results
         matches: list[tuple[SkillIndex, float]] = []
 
@@ -278,11 +332,12 @@ class SkillRegistry:
             if name in self._index:
                 matches.append((self._index[name], result.score))
             else:
-                # Reconstruct from metadata
+                # Reconstruct from metadata (document is "" if not fetched)
+                lines = result.document.split("\n")
                 index = SkillIndex(
                     id=result.id,
                     name=name,
-                    description=result.document.split("\n")[1].replace("Description: ", ""),
+                    description=lines[1].replace("Description: ", "") if len(lines) > 1 else "",
                     version=result.metadata.get("version", ""),
                     tags=result.metadata.get("tags", "").split(",") if result.metadata.get("tags") else [],
                     category=result.metadata.get("category") or None,
@@ -501,8 +556,8 @@ class SkillRegistry:
         skills: list[Skill] = []
 
         # Load all installed skills
-        for skills_dir, location_type in self.paths.get_search_dirs():
-            is_global = str(skills_dir).startswith(str(self.paths.global_base))
+        for skills_dir, source, location_type in self.paths.get_search_dirs():
+            is_global = source == "global"
 
             for skill_dir in loader.list_skill_dirs(skills_dir):
                 try:
@@ -2,16 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Any
-
-from jinja2 import Environment, BaseLoader, TemplateSyntaxError, UndefinedError, Undefined
+import re
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, TextIO, TypeVar
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    Template,
+    TemplateSyntaxError,
+    Undefined,
+    UndefinedError,
+    meta,
+)
 
 from ..models.skill import Skill
 from ..models.variable import SkillVariable, VariableContext
+from ..storage.paths import get_path_resolver
+
+T = TypeVar("T")
+
+# Anything Jinja would treat specially: {{ / {% / {# delimiters or a carriage return
+_TEMPLATE_MARKERS_RE = re.compile(r"\{[{%#]|\r")
+
+# One pass over the template finds variables in each supported position:
+# {{ variable }} / {{ variable | filter }}, {% if variable %}, {% for item in variable %}
+_VARIABLE_RE = re.compile(
+    r"\{\{\s*(\w+)(?:\s*\||\s*\}\})"
+    r"|\{%\s*if\s+(\w+)"
+    r"|\{%\s*for\s+\w+\s+in\s+(\w+)"
+)
 
 
 class SilentUndefined(Undefined):
-    """Jinja2 undefined that returns empty string instead of raising."""
+    """Jinja2 undefined that returns empty string instead of raising.
+
+    It never reports the hint, object or name Jinja passes in, so every
+    undefined lookup shares one instance instead of allocating a new one.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> SilentUndefined:
+        # Looked up in the class's own namespace so subclasses get their own instance
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            Undefined.__init__(instance)
+            cls._instance = instance
+        return instance
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
 
     def _fail_with_undefined_error(self, *args, **kwargs):
         return ""
@@ -50,7 +94,20 @@ class SkillRenderer:
     - Filters: {{ value | upper }}, {{ value | default('fallback') }}
     """
 
-    def __init__(self):
+    TEMPLATE_CACHE_SIZE = 256
+
+    def __init__(self, bytecode_cache_dir: Path | str | None = None):
+        """Initialize renderer.
+
+        Args:
+            bytecode_cache_dir: Directory for persisting compiled template
+                bytecode across processes. Disabled when None.
+        """
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+
         self.env = Environment(
             loader=BaseLoader(),
             # Keep default Jinja2 delimiters for better compatibility
@@ -64,11 +121,65 @@ class SkillRenderer:
             autoescape=False,
             # Keep undefined variables as-is instead of erroring
             undefined=SilentUndefined,
+            bytecode_cache=bytecode_cache,
         )
 
         # Add custom filters
         self.env.filters["default"] = lambda v, d: d if v is None else v
 
+        # Compiled templates and the context names they read, keyed by source text
+        self._template_cache: dict[str, Template] = {}
+        self._referenced_cache: dict[str, frozenset[str]] = {}
+        # Default variable values keyed by id() of a manifest's variables dict
+        self._defaults_cache: dict[int, tuple[dict[str, SkillVariable], dict[str, Any]]] = {}
+
+    def _get_template(self, content: str, name: str | None = None) -> Template:
+        """Compile template content, reusing a previous compilation if available.
+
+        Args:
+            content: Template source
+            name: Stable template name (e.g. the skill path). Enables the
+                bytecode cache; anonymous templates are compiled in memory only.
+        """
+        template = self._template_cache.get(content)
+        if template is None:
+            template = self._compile(content, name)
+            self._cache_put(self._template_cache, content, template)
+        return template
+
+    def _referenced_names(self, content: str) -> frozenset[str]:
+        """Names a template may read from its render context."""
+        names = self._referenced_cache.get(content)
+        if names is None:
+            names = frozenset(meta.find_undeclared_variables(self.env.parse(content)))
+            self._cache_put(self._referenced_cache, content, names)
+        return names
+
+    def _cache_put(self, cache: dict[Any, Any], key: Any, value: Any) -> None:
+        """Insert into one of the renderer's bounded caches."""
+        if len(cache) >= self.TEMPLATE_CACHE_SIZE:
+            # Evict the oldest entry
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+    def _compile(self, content: str, name: str | None) -> Template:
+        """Compile a template, going through the bytecode cache when possible.
+
+        Mirrors ``BaseLoader.load``: ``from_string`` never consults the bytecode
+        cache, so named templates look up their bucket directly.
+        """
+        bcc = self.env.bytecode_cache
+        if bcc is None or not name:
+            return self.env.from_string(content)
+
+        bucket = bcc.get_bucket(self.env, name, None, content)
+        code = bucket.code
+        if code is None:
+            code = self.env.compile(content, name)
+            bucket.code = code
+            bcc.set_bucket(bucket)
+        return self.env.template_class.from_code(self.env, code, self.env.make_globals(None))
+
     def render(
         self,
         skill: Skill,
@@ -88,10 +199,40 @@ class SkillRenderer:
         Raises:
             RenderError: If rendering fails
         """
-        context = context or VariableContext()
+        return self._render(skill, context, strict, "".join)
+
+    def render_to(
+        self,
+        skill: Skill,
+        writer: TextIO,
+        context: VariableContext | None = None,
+        strict: bool = False,
+    ) -> None:
+        """Render skill content straight into a writer.
 
-        # Build variable dict: defaults + provided
-        variables = self._build_variables(skill.manifest.variables, context)
+        Output is streamed chunk by chunk, so large skills can be written to a
+        file or response without building the full string first.
+
+        Args:
+            skill: Skill to render
+            writer: Text stream receiving the rendered content
+            context: Variable context with provided values
+            strict: If True, raise error on undefined variables
+
+        Raises:
+            RenderError: If rendering fails
+        """
+        self._render(skill, context, strict, writer.writelines)
+
+    def _render(
+        self,
+        skill: Skill,
+        context: VariableContext | None,
+        strict: bool,
+        emit: Callable[[Iterable[str]], T],
+    ) -> T:
+        """Validate variables, then hand the rendered chunks to ``emit``."""
+        context = context or VariableContext()
 
         # Validate required variables in strict mode
         if strict:
@@ -99,13 +240,27 @@ class SkillRenderer:
             if errors:
                 raise RenderError(f"Variable validation failed: {'; '.join(errors)}")
 
-        # Render content
         content = skill.rendered_content or skill.content
 
+        # Plain markdown: skip Jinja but match its output, which drops a
+        # single trailing newline
+        if not _TEMPLATE_MARKERS_RE.search(content):
+            try:
+                return emit((content.removesuffix("\n"),))
+            except Exception as e:
+                raise RenderError(f"Render error: {e}") from e
+
         try:
-            template = self.env.from_string(content)
-            rendered = template.render(**variables)
-            return rendered
+            template = self._get_template(content, skill.path)
+
+            # Build variable dict: defaults + provided. Environment and project
+            # info are only merged if the template reads any of their names.
+            referenced = None
+            if context.environment or context.project_info:
+                referenced = self._referenced_names(content)
+            variables = self._build_variables(skill.manifest.variables, context, referenced)
+
+            return emit(template.generate(**variables))
 
         except TemplateSyntaxError as e:
             raise RenderError(f"Template syntax error at line {e.lineno}: {e.message}") from e
@@ -118,30 +273,50 @@ class SkillRenderer:
         self,
         definitions: dict[str, SkillVariable],
         context: VariableContext,
+        referenced: frozenset[str] | None = None,
     ) -> dict[str, Any]:
-        """Build final variable dict from definitions and context."""
-        variables: dict[str, Any] = {}
-
-        # Start with defaults from definitions
-        for name, var_def in definitions.items():
-            variables[name] = var_def.get_value(context.variables.get(name))
+        """Build final variable dict from definitions and context.
 
-        # Add any extra variables from context not in definitions
-        for name, value in context.variables.items():
-            if name not in variables:
-                variables[name] = value
+        Priority: definitions (provided value or default) > other provided
+        variables > environment > project info.
 
-        # Add environment variables
-        for name, value in context.environment.items():
-            if name not in variables:
-                variables[name] = value
-
-        # Add project info
-        for name, value in context.project_info.items():
-            if name not in variables:
-                variables[name] = value
+        Args:
+            definitions: Skill's variable definitions
+            context: Variable context with provided values
+            referenced: Names the template reads, if known. Environment and
+                project info are skipped when they share no name with it.
+        """
+        environment = context.environment
+        project_info = context.project_info
+        if referenced is not None:
+            if environment and referenced.isdisjoint(environment):
+                environment = {}
+            if project_info and referenced.isdisjoint(project_info):
+                project_info = {}
+
+        provided = context.variables
+        if not (provided or environment or project_info):
+            return self._default_variables(definitions)
+
+        resolved = {
+            name: var_def.get_value(provided.get(name)) for name, var_def in definitions.items()
+        }
+        # Later dicts win, so unpack from lowest to highest priority
+        return {**project_info, **environment, **provided, **resolved}
+
+    def _default_variables(self, definitions: dict[str, SkillVariable]) -> dict[str, Any]:
+        """Defaults for a manifest's variables, computed once per definitions dict.
+
+        The returned dict is shared between renders and must not be mutated.
+        """
+        cached = self._defaults_cache.get(id(definitions))
+        # The entry holds a reference to definitions, so a matching id cannot be reused
+        if cached is not None and cached[0] is definitions:
+            return cached[1]
 
-        return variables
+        defaults = {name: var_def.default for name, var_def in definitions.items()}
+        self._cache_put(self._defaults_cache, id(definitions), (definitions, defaults))
+        return defaults
 
     def validate_variables(
         self,
@@ -184,18 +359,7 @@ class SkillRenderer:
         Returns:
             List of variable names found
         """
-        import re
-
-        # Find {{ variable }} patterns
-        simple_vars = re.findall(r"\{\{\s*(\w+)(?:\s*\||\s*\}\})", content)
-
-        # Find {% if variable %} patterns
-        condition_vars = re.findall(r"\{%\s*if\s+(\w+)", content)
-
-        # Find {% for item in variable %} patterns
-        loop_vars = re.findall(r"\{%\s*for\s+\w+\s+in\s+(\w+)", content)
-
-        all_vars = set(simple_vars + condition_vars + loop_vars)
+        all_vars = {name for match in _VARIABLE_RE.findall(content) for name in match if name}
         return sorted(all_vars)
 
     def preview_variables(self, skill: Skill) -> dict[str, dict[str, Any]]:
@@ -229,5 +393,5 @@ def get_renderer() -> SkillRenderer:
     """Get the singleton renderer instance."""
     global _renderer
     if _renderer is None:
-        _renderer = SkillRenderer()
+        _renderer = SkillRenderer(bytecode_cache_dir=get_path_resolver().get_template_cache_dir())
     return _renderer
@@ -11,6 +11,7 @@ Also integrates declarative scoping for more accurate matching.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -57,35 +58,32 @@ class SkillRouter:
     This is the primary interface for all integrations (MCP, REST, CLI).
     """
 
-    def __init__(self):
-        self._manager = None
-        self._registry = None
-        self._scope_matcher = None
+    # Dependencies are resolved on first access and cached in the instance
+    # dict; assign to the attribute to inject a replacement.
 
-    @property
+    # Whether semantic search works: None until first tried, False once the
+    # embeddings extra turned out to be missing so later calls skip straight
+    # to text search instead of raising and catching again.
+    _semantic_available: bool | None = None
+
+    @cached_property
     def manager(self):
         """Lazy load manager to avoid circular imports."""
-        if self._manager is None:
-            from .manager import get_manager
+        from .manager import get_manager
 
-            self._manager = get_manager()
-        return self._manager
+        return get_manager()
 
-    @property
+    @cached_property
     def registry(self):
         """Lazy load registry to avoid circular imports."""
-        if self._registry is None:
-            from .registry import get_registry
+        from .registry import get_registry
 
-            self._registry = get_registry()
-        return self._registry
+        return get_registry()
 
-    @property
+    @cached_property
     def scope_matcher(self) -> ScopeMatcher:
         """Lazy load scope matcher."""
-        if self._scope_matcher is None:
-            self._scope_matcher = get_scope_matcher()
-        return self._scope_matcher
+        return get_scope_matcher()
 
     def browse(
         self,
@@ -208,20 +206,25 @@ class SkillRouter:
 
         # Try semantic search first
         semantic_scores: dict[str, float] = {}
-        try:
-            results = self.registry.search(
-                query=context,
-                limit=limit * 3,  # Get extra for scope filtering
-                min_score=min_score,
-            )
-            semantic_scores = {idx.name: score for idx, score in results}
-            skill_indices = [idx for idx, _ in results]
-        except Exception as e:
-            # Fallback to text search if semantic fails
-            if "not installed" in str(e).lower():
-                skill_indices = self.registry.search_text(context, limit=limit * 3)
-            else:
-                raise
+        if self._semantic_available is False:
+            skill_indices = self.registry.search_text(context, limit=limit * 3)
+        else:
+            try:
+                results = self.registry.search(
+                    query=context,
+                    limit=limit * 3,  # Get extra for scope filtering
+                    min_score=min_score,
+                )
+                semantic_scores = {idx.name: score for idx, score in results}
+                skill_indices = [idx for idx, _ in results]
+                self._semantic_available = True
+            except Exception as e:
+                # Fallback to text search if semantic fails
+                if "not installed" in str(e).lower():
+                    self._semantic_available = False
+                    skill_indices = self.registry.search_text(context, limit=limit * 3)
+                else:
+                    raise
 
         if not skill_indices:
             return UseResult(
@@ -431,13 +434,20 @@ class SkillRouter:
             )
 
 
-# Singleton instance
-_router: SkillRouter | None = None
+# Module-level `router` resolves to the get_router() singleton (PEP 562)
+router: SkillRouter
 
 
+@lru_cache(maxsize=1)
 def get_router() -> SkillRouter:
-    """Get the singleton router instance."""
-    global _router
-    if _router is None:
-        _router = SkillRouter()
-    return _router
+    """Get the singleton router instance.
+
+    Use ``get_router.cache_clear()`` to reset it (e.g. in tests).
+    """
+    return SkillRouter()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "router":
+        return get_router()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
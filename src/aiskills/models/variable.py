@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
 VariableType = Literal["string", "integer", "float", "boolean", "array", "object"]
 
+# Type checks shared by every SkillVariable.validate_value call
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+}
+
+# Enum lookup sets, keyed by id() of the enum list and kept outside the
+# model so they never reach equality, copies or dumps. Each entry holds its
+# list, so the id can't be reused while cached; an entry whose list is
+# replaced is rebuilt on the next check.
+ENUM_LOOKUP_CACHE_SIZE = 1024
+_ENUM_LOOKUPS: dict[int, tuple[list[Any], frozenset[Any] | None]] = {}
+
 
 class SkillVariable(BaseModel):
     """Definition of a skill variable with validation rules."""
@@ -40,20 +58,12 @@ class SkillVariable(BaseModel):
             return True, None
 
         # Type validation
-        type_checks = {
-            "string": lambda v: isinstance(v, str),
-            "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
-            "float": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-            "boolean": lambda v: isinstance(v, bool),
-            "array": lambda v: isinstance(v, list),
-            "object": lambda v: isinstance(v, dict),
-        }
-
-        if not type_checks.get(self.type, lambda _: True)(value):
+        type_check = _TYPE_CHECKS.get(self.type)
+        if type_check is not None and not type_check(value):
             return False, f"Expected {self.type}, got {type(value).__name__}"
 
         # Enum validation
-        if self.enum is not None and value not in self.enum:
+        if self.enum is not None and not self._in_enum(self.enum, value):
             return False, f"Value must be one of: {self.enum}"
 
         # Range validation for numbers
@@ -72,6 +82,28 @@ class SkillVariable(BaseModel):
 
         return True, None
 
+    @staticmethod
+    def _in_enum(enum: list[Any], value: Any) -> bool:
+        """Check enum membership through a frozenset built once per enum list."""
+        cached = _ENUM_LOOKUPS.get(id(enum))
+        if cached is None or cached[0] is not enum:
+            lookup: frozenset[Any] | None
+            try:
+                lookup = frozenset(enum)
+            except TypeError:  # Unhashable enum values
+                lookup = None
+            if len(_ENUM_LOOKUPS) >= ENUM_LOOKUP_CACHE_SIZE:
+                # Evict the oldest entry
+                del _ENUM_LOOKUPS[next(iter(_ENUM_LOOKUPS))]
+            cached = _ENUM_LOOKUPS[id(enum)] = (enum, lookup)
+
+        if cached[1] is not None:
+            try:
+                return value in cached[1]
+            except TypeError:  # Unhashable value; compare against the list
+                pass
+        return value in enum
+
     def get_value(self, provided: Any = None) -> Any:
         """Get the effective value, using default if not provided."""
         if provided is not None:
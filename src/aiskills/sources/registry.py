@@ -10,9 +10,10 @@ import json
 import os
 import tempfile
 import zipfile
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin
 
 from ..core.loader import SkillLoader, get_loader
@@ -20,6 +21,9 @@ from ..storage.cache import CacheManager, get_cache_manager
 from ..utils.version import SemanticVersion, VersionConstraint, find_latest, is_newer
 from .base import FetchedSkill, FetchError, SkillSource
 
+if TYPE_CHECKING:
+    import httpx
+
 
 @dataclass
 class RegistrySkillInfo:
@@ -76,9 +80,10 @@ class RegistryClient:
         )
         self.api_key = api_key or os.environ.get("AISKILLS_REGISTRY_KEY")
         self.timeout = timeout
-        self._http_client = None
+        self._http_client: httpx.Client | None = None
+        self._parsed_versions: dict[str, list[tuple[SemanticVersion, str]]] = {}
 
-    def _get_client(self):
+    def _get_client(self) -> httpx.Client:
         """Get or create HTTP client."""
         if self._http_client is None:
             try:
@@ -114,6 +119,38 @@ class RegistryClient:
         except Exception as e:
             raise FetchError(f"Registry request failed: {e}")
 
+    @staticmethod
+    def _search_params(
+        query: str,
+        limit: int,
+        category: str | None,
+        tags: list[str] | None,
+    ) -> dict[str, Any]:
+        """Build query parameters for the search endpoint."""
+        params: dict[str, Any] = {"q": query, "limit": limit}
+        if category:
+            params["category"] = category
+        if tags:
+            params["tags"] = ",".join(tags)
+        return params
+
+    @staticmethod
+    def _search_skill_info(s: dict[str, Any]) -> RegistrySkillInfo:
+        """Build a RegistrySkillInfo from a search result entry."""
+        return RegistrySkillInfo(
+            name=s["name"],
+            slug=s["slug"],
+            description=s.get("description", ""),
+            version=s.get("version", "1.0.0"),
+            versions=s.get("versions", []),
+            tags=s.get("tags", []),
+            category=s.get("category"),
+            author=s.get("author"),
+            downloads=s.get("downloads", 0),
+            stars=s.get("stars", 0),
+            updated_at=s.get("updated_at"),
+        )
+
     def search(
         self,
         query: str,
@@ -132,30 +169,10 @@ class RegistryClient:
         Returns:
             Search results
         """
-        params = {"q": query, "limit": limit}
-        if category:
-            params["category"] = category
-        if tags:
-            params["tags"] = ",".join(tags)
-
+        params = self._search_params(query, limit, category, tags)
         data = self._request("GET", "/api/skills/search", params=params)
 
-        skills = [
-            RegistrySkillInfo(
-                name=s["name"],
-                slug=s["slug"],
-                description=s.get("description", ""),
-                version=s.get("version", "1.0.0"),
-                versions=s.get("versions", []),
-                tags=s.get("tags", []),
-                category=s.get("category"),
-                author=s.get("author"),
-                downloads=s.get("downloads", 0),
-                stars=s.get("stars", 0),
-                updated_at=s.get("updated_at"),
-            )
-            for s in data.get("skills", [])
-        ]
+        skills = [self._search_skill_info(s) for s in data.get("skills", [])]
 
         return RegistrySearchResult(
             skills=skills,
@@ -164,6 +181,64 @@ class RegistryClient:
             per_page=data.get("per_page", limit),
         )
 
+    def search_iter(
+        self,
+        query: str,
+        limit: int = 10,
+        category: str | None = None,
+        tags: list[str] | None = None,
+    ) -> Iterator[RegistrySkillInfo]:
+        """Search for skills, yielding results as the response streams in.
+
+        Uses ijson to parse the body incrementally so the first results are
+        available before the whole response has been received. Falls back
+        to a buffered request when ijson isn't installed.
+
+        Args:
+            query: Search query
+            limit: Maximum results
+            category: Filter by category
+            tags: Filter by tags
+
+        Yields:
+            Skill information, in registry order
+        """
+        params = self._search_params(query, limit, category, tags)
+
+        try:
+            import ijson
+        except ImportError:
+            data = self._request("GET", "/api/skills/search", params=params)
+            for s in data.get("skills", [])[:limit]:
+                yield self._search_skill_info(s)
+            return
+
+        client = self._get_client()
+        url = urljoin(self.base_url, "/api/skills/search")
+        items: list[dict[str, Any]] = ijson.sendable_list()
+        parser = ijson.items_coro(items, "skills.item", use_float=True)
+        count = 0
+
+        try:
+            with client.stream("GET", url, headers=self._headers(), params=params) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes():
+                    parser.send(chunk)
+                    for s in items:
+                        yield self._search_skill_info(s)
+                        count += 1
+                        if count >= limit:
+                            return
+                    del items[:]
+            parser.close()
+        except FetchError:
+            raise
+        except Exception as e:
+            raise FetchError(f"Registry request failed: {e}")
+
+        for s in items[: limit - count]:
+            yield self._search_skill_info(s)
+
     def get_skill(self, slug: str) -> RegistrySkillInfo:
         """Get skill details by slug.
 
@@ -203,6 +278,29 @@ class RegistryClient:
         data = self._request("GET", f"/api/skills/{slug}/versions")
         return data.get("versions", [])
 
+    def get_parsed_versions(self, slug: str) -> list[tuple[SemanticVersion, str]]:
+        """Get all valid versions for a skill, parsed and sorted newest first.
+
+        Versions are fetched and parsed once per slug; entries that aren't
+        valid semantic versions are dropped at that point.
+
+        Args:
+            slug: Skill slug
+
+        Returns:
+            List of (parsed version, original string) tuples, newest first
+        """
+        parsed = self._parsed_versions.get(slug)
+        if parsed is None:
+            parsed = []
+            for v in self.get_versions(slug):
+                sv = SemanticVersion.try_parse(v)
+                if sv is not None:
+                    parsed.append((sv, v))
+            parsed.sort(key=lambda item: item[0], reverse=True)
+            self._parsed_versions[slug] = parsed
+        return parsed
+
     def download(
         self,
         slug: str,
@@ -381,16 +479,11 @@ class RegistrySource(SkillSource):
                 # Try to parse as constraint
                 try:
                     constraint = VersionConstraint.parse(version_constraint)
-                    # Get all versions and find matching
-                    versions = self.client.get_versions(slug)
-                    for v in versions:
-                        try:
-                            sv = SemanticVersion.parse(v)
-                            if constraint.satisfies(sv):
-                                target_version = v
-                                break
-                        except ValueError:
-                            continue
+                    # Newest matching version wins
+                    for sv, v in self.client.get_parsed_versions(slug):
+                        if constraint.satisfies(sv):
+                            target_version = v
+                            break
 
                     if target_version is None:
                         raise FetchError(
@@ -417,6 +510,9 @@ class RegistrySource(SkillSource):
         cache_dir = self.cache.set("registry", cache_key)
         skill_path = self.client.download(slug, target_version, cache_dir)
 
+        # Deduplicate identical content cached under other identifiers
+        skill_path = self.cache.store_object(skill_path)
+
         return [
             FetchedSkill(
                 name=slug,
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import shutil
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+from ..constants import OBJECTS_DIR, SKILL_FILE
 from .paths import PathResolver, get_path_resolver
 
 
@@ -19,14 +24,23 @@ class CacheManager:
     │   └── <hash>/           # Hash of repo URL
     │       ├── .timestamp    # When cached
     │       └── <skill-dirs>/ # Cloned content
-    └── git/
-        └── <hash>/
-            └── ...
+    ├── git/
+    │   └── <hash>/
+    │       └── ...
+    ├── registry/
+    │   └── <hash>/
+    │       ├── .timestamp
+    │       └── <slug> -> ../../objects/<content_hash>
+    └── objects/
+        └── <content_hash>/   # Shared skill content, deduplicated
     """
 
     # Cache TTL in seconds (24 hours)
     DEFAULT_TTL = 86400
 
+    # Upper bound on concurrent rmtree workers for bulk removals
+    MAX_REMOVE_WORKERS = 16
+
     def __init__(self, paths: PathResolver | None = None, ttl: int | None = None):
         self.paths = paths or get_path_resolver()
         self.ttl = ttl or self.DEFAULT_TTL
@@ -36,6 +50,11 @@ class CacheManager:
         """Get cache directory."""
         return self.paths.get_cache_dir()
 
+    @property
+    def objects_dir(self) -> Path:
+        """Get content-addressed object store directory."""
+        return self.cache_dir / OBJECTS_DIR
+
     def _hash_source(self, source: str) -> str:
         """Create a hash for a source URL."""
         return hashlib.sha256(source.encode()).hexdigest()[:12]
@@ -108,6 +127,92 @@ class CacheManager:
 
         return cache_path
 
+    def store_object(self, skill_path: Path) -> Path:
+        """Move a fetched skill into the object store and link it back.
+
+        Skills are keyed by a hash of their whole directory (see
+        ``_tree_hash``), so identical content fetched under different source
+        identifiers is stored only once, while skills that share a SKILL.md
+        but differ in scripts, references or assets stay separate.
+
+        Args:
+            skill_path: Skill directory inside a cache entry
+
+        Returns:
+            The skill path (now a symlink into the object store, or the
+            original directory if linking isn't supported)
+        """
+        skill_file = skill_path / SKILL_FILE
+        if skill_path.is_symlink() or not skill_file.exists():
+            return skill_path
+
+        object_path = self.objects_dir / self._tree_hash(skill_path)
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            if object_path.exists():
+                shutil.rmtree(skill_path)
+            else:
+                shutil.move(str(skill_path), str(object_path))
+            skill_path.symlink_to(object_path, target_is_directory=True)
+        except OSError:
+            # Symlinks unavailable (e.g. restricted Windows); keep a real copy
+            if not skill_path.exists():
+                shutil.copytree(object_path, skill_path)
+
+        return skill_path
+
+    @staticmethod
+    def _tree_hash(root: Path) -> str:
+        """Hash every file under root: sorted relative paths plus raw bytes."""
+        digest = hashlib.sha256()
+        files = sorted(
+            (path.relative_to(root).as_posix(), path)
+            for path in root.rglob("*")
+            if path.is_file()
+        )
+        for rel, path in files:
+            data = path.read_bytes()
+            # Length-prefix each field so path/content boundaries can't collide
+            digest.update(f"{len(rel)}:{rel}:{len(data)}:".encode())
+            digest.update(data)
+        return digest.hexdigest()[:16]
+
+    def prune_objects(self) -> int:
+        """Remove objects no longer referenced by any cache entry.
+
+        Returns:
+            Number of objects removed
+        """
+        objects_dir = self.objects_dir
+        if not objects_dir.exists():
+            return 0
+
+        # Object links only ever sit at registry/<hash>/<slug>; scanning just
+        # those two levels keeps clones under other source types unvisited
+        referenced: set[str] = set()
+        try:
+            with os.scandir(self.cache_dir / "registry") as entries:
+                entry_dirs = [e.path for e in entries if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            entry_dirs = []
+        for entry_dir in entry_dirs:
+            try:
+                with os.scandir(entry_dir) as it:
+                    for item in it:
+                        if item.is_symlink():
+                            referenced.add(os.path.basename(os.readlink(item.path)))
+            except OSError:
+                continue
+
+        count = 0
+        for obj in objects_dir.iterdir():
+            if obj.is_dir() and obj.name not in referenced:
+                shutil.rmtree(obj)
+                count += 1
+
+        return count
+
     def invalidate(self, source_type: str, source: str) -> bool:
         """Invalidate (remove) a cache entry.
 
@@ -125,6 +230,35 @@ class CacheManager:
             return True
         return False
 
+    def _remove_entries(self, entries: list[Path]) -> int:
+        """Remove cache entry directories, in parallel when there are several.
+
+        rmtree is dominated by unlink/rmdir syscalls, so running it across
+        entries concurrently lets the filesystem service them in parallel.
+
+        Args:
+            entries: Entry directories to remove
+
+        Returns:
+            Number of entries removed
+        """
+        if len(entries) <= 1:
+            results = [self._remove_entry(entry) for entry in entries]
+        else:
+            workers = min(self.MAX_REMOVE_WORKERS, (os.cpu_count() or 1) * 2, len(entries))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._remove_entry, entries))
+        return sum(results)
+
+    @staticmethod
+    def _remove_entry(entry: Path) -> bool:
+        """Remove a single entry, tolerating concurrent removal."""
+        try:
+            shutil.rmtree(entry)
+        except FileNotFoundError:
+            return False
+        return True
+
     def clear(self, source_type: str | None = None) -> int:
         """Clear cache entries.
 
@@ -134,76 +268,115 @@ class CacheManager:
         Returns:
             Number of entries cleared
         """
-        count = 0
+        entries: list[Path] = []
 
         if source_type:
             type_dir = self.cache_dir / source_type
             if type_dir.exists():
-                for entry in type_dir.iterdir():
-                    if entry.is_dir():
-                        shutil.rmtree(entry)
-                        count += 1
+                entries.extend(entry for entry in type_dir.iterdir() if entry.is_dir())
         else:
             for type_dir in self.cache_dir.iterdir():
-                if type_dir.is_dir():
-                    for entry in type_dir.iterdir():
-                        if entry.is_dir():
-                            shutil.rmtree(entry)
-                            count += 1
+                if type_dir.is_dir() and type_dir.name != OBJECTS_DIR:
+                    entries.extend(entry for entry in type_dir.iterdir() if entry.is_dir())
 
+        count = self._remove_entries(entries)
+        self.prune_objects()
         return count
 
+    def _walk_entries(self) -> Iterator[tuple[Path, bool]]:
+        """Walk all cache entries once (the object store is skipped).
+
+        Yields:
+            Tuples of (entry path, is_expired)
+        """
+        with os.scandir(self.cache_dir) as type_dirs:
+            for type_dir in type_dirs:
+                if not type_dir.is_dir() or type_dir.name == OBJECTS_DIR:
+                    continue
+                with os.scandir(type_dir.path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            path = Path(entry.path)
+                            yield path, self._is_expired(path)
+
+    @staticmethod
+    def _walk_size(path: Path | str) -> int:
+        """Total size in bytes of the files under a directory (symlinks not followed)."""
+        total = 0
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir():
+                        total += CacheManager._walk_size(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+        except OSError:
+            pass
+        return total
+
     def prune_expired(self) -> int:
         """Remove all expired cache entries.
 
         Returns:
             Number of entries pruned
         """
-        count = 0
-
-        for type_dir in self.cache_dir.iterdir():
-            if not type_dir.is_dir():
-                continue
-
-            for entry in type_dir.iterdir():
-                if entry.is_dir() and self._is_expired(entry):
-                    shutil.rmtree(entry)
-                    count += 1
+        expired = [entry for entry, is_expired in self._walk_entries() if is_expired]
 
+        count = self._remove_entries(expired)
+        self.prune_objects()
         return count
 
-    def get_stats(self) -> dict:
-        """Get cache statistics.
+    def maintenance(self, prune: bool = True) -> dict[str, Any]:
+        """Optionally prune expired entries and report stats in a single walk.
+
+        Args:
+            prune: Remove expired entries before computing stats
 
         Returns:
-            Dict with cache stats
+            Dict with cache stats (as get_stats), plus "pruned_entries"
         """
         total_entries = 0
-        expired_entries = 0
+        expired: list[Path] = []
         total_size = 0
 
-        for type_dir in self.cache_dir.iterdir():
-            if not type_dir.is_dir():
-                continue
+        for entry, is_expired in self._walk_entries():
+            if is_expired:
+                expired.append(entry)
+                if prune:
+                    continue
+            total_entries += 1
+            total_size += self._walk_size(entry)
 
-            for entry in type_dir.iterdir():
-                if entry.is_dir():
-                    total_entries += 1
-                    if self._is_expired(entry):
-                        expired_entries += 1
-                    # Calculate size
-                    for file in entry.rglob("*"):
-                        if file.is_file():
-                            total_size += file.stat().st_size
+        pruned = 0
+        if prune:
+            pruned = self._remove_entries(expired)
+            self.prune_objects()
+            expired = []
+
+        # Shared content is counted in the size, but isn't an entry
+        total_size += self._walk_size(self.objects_dir)
 
         return {
             "total_entries": total_entries,
-            "expired_entries": expired_entries,
-            "valid_entries": total_entries - expired_entries,
+            "expired_entries": len(expired),
+            "valid_entries": total_entries - len(expired),
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
+            "pruned_entries": pruned,
         }
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with cache stats
+        """
+        stats = self.maintenance(prune=False)
+        del stats["pruned_entries"]
+        return stats
+
 
 # Singleton instance
 _cache: CacheManager | None = None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -23,11 +24,17 @@ class LockFileManager:
 
     def __init__(self, paths: PathResolver | None = None):
         self.paths = paths or get_path_resolver()
-        self._lock: LockFile | None = None
+        self._header: dict[str, Any] = {}
+        self._skills_raw: dict[str, dict[str, Any]] | None = None
+        self._skills_cache: dict[str, LockedSkill] = {}
         self._lock_path: Path | None = None
 
     def load(self, global_install: bool = False, create: bool = True) -> LockFile:
-        """Load lock file from disk.
+        """Load lock file from disk and build the full LockFile.
+
+        The returned LockFile is a snapshot: edit through add_skill() and
+        remove_skill(), which save() writes. Callers that only query entries
+        should use open() instead.
 
         Args:
             global_install: Load global lock file if True
@@ -36,47 +43,100 @@ class LockFileManager:
         Returns:
             Loaded or new LockFile
         """
+        self.open(global_install, create)
+        return self.to_lock_file()
+
+    def open(self, global_install: bool = False, create: bool = True) -> None:
+        """Load lock file from disk without building its entries.
+
+        Only the YAML document is parsed here; ``LockedSkill`` entries are
+        built lazily on first access, so membership queries never pay for
+        constructing every entry.
+
+        Args:
+            global_install: Open global lock file if True
+            create: Start an empty lock file if it doesn't exist
+        """
         lock_path = self.paths.get_lock_file_path(global_install)
         self._lock_path = lock_path
+        self._skills_cache = {}
 
         if lock_path.exists():
             with open(lock_path) as f:
                 data = yaml.safe_load(f) or {}
 
-            # Parse skills
-            skills_data = data.get("skills", {})
-            skills = {}
-            for name, skill_data in skills_data.items():
-                skills[name] = LockedSkill(**skill_data)
-
-            self._lock = LockFile(
-                version=data.get("version", "1"),
-                generated_at=data.get("generated_at", 0),
-                aiskills_version=data.get("aiskills_version", "unknown"),
-                skills=skills,
-            )
+            self._header = {
+                "version": data.get("version", "1"),
+                "generated_at": data.get("generated_at", 0),
+                "aiskills_version": data.get("aiskills_version", "unknown"),
+            }
+            self._skills_raw = dict(data.get("skills") or {})
         elif create:
-            self._lock = LockFile()
+            self._header = {}
+            self._skills_raw = {}
         else:
             raise FileNotFoundError(f"Lock file not found: {lock_path}")
 
-        return self._lock
+    def _ensure_loaded(self) -> bool:
+        """Load the lock file if needed, returning False if it doesn't exist."""
+        if self._skills_raw is None:
+            try:
+                self.open(create=False)
+            except FileNotFoundError:
+                return False
+        return True
+
+    def _materialize(self, name: str) -> LockedSkill | None:
+        """Build (and cache) the LockedSkill for a raw entry."""
+        assert self._skills_raw is not None
+
+        locked = self._skills_cache.get(name)
+        if locked is None:
+            skill_data = self._skills_raw.get(name)
+            if skill_data is None:
+                return None
+            locked = self._build_entry(name, skill_data)
+        return locked
+
+    def _build_entry(self, name: str, skill_data: dict[str, Any]) -> LockedSkill:
+        """Build the LockedSkill for a raw entry and cache it."""
+        locked = self._skills_cache[name] = LockedSkill(**skill_data)
+        return locked
+
+    def to_lock_file(self) -> LockFile:
+        """Build the full LockFile model, materializing every entry.
+
+        Returns:
+            LockFile with all locked skills
+        """
+        if self._skills_raw is None:
+            self.open()
+
+        assert self._skills_raw is not None
+        cache = self._skills_cache
+        skills = {
+            name: cache.get(name) or self._build_entry(name, data)
+            for name, data in self._skills_raw.items()
+        }
+        return LockFile(skills=skills, **self._header)
 
     def save(self) -> None:
         """Save lock file to disk."""
-        if self._lock is None:
+        if self._skills_raw is None:
             raise RuntimeError("No lock file loaded")
         if self._lock_path is None:
             raise RuntimeError("No lock path set")
 
+        lock = self.to_lock_file()
+
         # Ensure directory exists
         self._lock_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Convert to serializable dict
         data = {
-            "version": self._lock.version,
-            "generated_at": self._lock.generated_at,
-            "aiskills_version": self._lock.aiskills_version,
+            "version": lock.version,
+            "generated_at": lock.generated_at,
+            "aiskills_version": lock.aiskills_version,
             "skills": {
                 name: {
                     "name": s.name,
@@ -86,9 +146,9 @@ class LockFileManager:
                     "resolved_dependencies": s.resolved_dependencies,
                     "installed_at": s.installed_at,
                 }
-                for name, s in self._lock.skills.items()
+                for name, s in lock.skills.items()
             },
-            "checksum": self._lock.checksum,
+            "checksum": lock.checksum,
         }
 
         with open(self._lock_path, "w") as f:
@@ -101,10 +161,10 @@ class LockFileManager:
             skill: Skill to add
             source: Source string (e.g., "github:owner/repo")
         """
-        if self._lock is None:
-            self.load()
+        if self._skills_raw is None:
+            self.open()
 
-        assert self._lock is not None
+        assert self._skills_raw is not None
 
         # Build resolved dependencies list
         deps = [f"{d.name}@{d.version}" for d in skill.manifest.dependencies]
@@ -117,7 +177,8 @@ class LockFileManager:
             resolved_dependencies=deps,
         )
 
-        self._lock.add_skill(locked)
+        self._skills_raw[locked.name] = locked.model_dump()
+        self._skills_cache[locked.name] = locked
 
     def remove_skill(self, name: str) -> bool:
         """Remove a skill from the lock file.
@@ -128,11 +189,12 @@ class LockFileManager:
         Returns:
             True if skill was removed, False if not found
         """
-        if self._lock is None:
-            self.load()
+        if self._skills_raw is None:
+            self.open()
 
-        assert self._lock is not None
-        return self._lock.remove_skill(name)
+        assert self._skills_raw is not None
+        self._skills_cache.pop(name, None)
+        return self._skills_raw.pop(name, None) is not None
 
     def has_skill(self, name: str, version: str | None = None) -> bool:
         """Check if a skill is in the lock file.
@@ -144,14 +206,14 @@ class LockFileManager:
         Returns:
             True if skill is locked (at version if specified)
         """
-        if self._lock is None:
-            try:
-                self.load(create=False)
-            except FileNotFoundError:
-                return False
+        if not self._ensure_loaded():
+            return False
 
-        assert self._lock is not None
-        return self._lock.has_skill(name, version)
+        assert self._skills_raw is not None
+        skill_data = self._skills_raw.get(name)
+        if skill_data is None:
+            return False
+        return version is None or skill_data.get("version") == version
 
     def get_locked_skill(self, name: str) -> LockedSkill | None:
         """Get locked skill info.
@@ -162,14 +224,10 @@ class LockFileManager:
         Returns:
             LockedSkill or None if not found
         """
-        if self._lock is None:
-            try:
-                self.load(create=False)
-            except FileNotFoundError:
-                return None
+        if not self._ensure_loaded():
+            return None
 
-        assert self._lock is not None
-        return self._lock.get_skill(name)
+        return self._materialize(name)
 
     def verify_integrity(self, skill: Skill) -> bool:
         """Verify a skill matches its locked hash.
@@ -191,11 +249,8 @@ class LockFileManager:
         Returns:
             List of (name, version) tuples
         """
-        if self._lock is None:
-            try:
-                self.load(create=False)
-            except FileNotFoundError:
-                return []
+        if not self._ensure_loaded():
+            return []
 
-        assert self._lock is not None
-        return self._lock.list_skills()
+        assert self._skills_raw is not None
+        return [(name, data["version"]) for name, data in sorted(self._skills_raw.items())]
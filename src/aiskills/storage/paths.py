@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+import os
+import time
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 from ..config import AppConfig, get_config
-from ..constants import GLOBAL_BASE, PROJECT_DIRS, SKILLS_DIR
+from ..constants import (
+    CACHE_DIR,
+    GLOBAL_BASE,
+    LOCK_FILE,
+    PROJECT_DIRS,
+    REGISTRY_DIR,
+    SKILL_FILE,
+    SKILLS_DIR,
+    TEMPLATE_CACHE_DIR,
+)
+
+# (path, source, location_type) entry returned by PathResolver.get_search_dirs
+_SearchDir = tuple[Path, Literal["project", "global"], Literal[".aiskills", ".claude", ".agent"]]
 
 
 class PathResolver:
@@ -19,9 +35,71 @@ class PathResolver:
     4. Global ~/.aiskills/skills/
     """
 
+    # Seconds a directory listing or a failed lookup stays cached
+    LISTING_TTL = 1.0
+
+    __slots__ = (
+        "config",
+        "cwd",
+        "_cwd_str",
+        "_search_dirs_cache",
+        "_dir_listing_cache",
+        "_neg_cache",
+        "_ensured_dirs",
+    )
+
     def __init__(self, config: AppConfig | None = None, cwd: Path | None = None):
         self.config = config or get_config()
         self.cwd = cwd or Path.cwd()
+        # Hot paths join and stat with os.path on the plain string
+        self._cwd_str = str(self.cwd)
+        # (watched directories, their mtimes, search dirs)
+        self._search_dirs_cache: (
+            tuple[tuple[str, ...], tuple[int, ...], list[_SearchDir]] | None
+        ) = None
+        # skills dir -> (expiry, names of subdirectories)
+        self._dir_listing_cache: dict[Path, tuple[float, frozenset[str]]] = {}
+        # skill name -> expiry of a "not found" result
+        self._neg_cache: dict[str, float] = {}
+        # Directories already created by this process
+        self._ensured_dirs: set[Path] = set()
+
+    @staticmethod
+    def _mtime(path: str | Path) -> int:
+        """Get a directory's mtime in ns, or -1 if it doesn't exist."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return -1
+
+    def clear_cache(self) -> None:
+        """Drop cached directory lookups (call after installing/removing skills)."""
+        self._search_dirs_cache = None
+        self._dir_listing_cache.clear()
+        self._neg_cache.clear()
+
+    def _ensure(self, path: Path) -> Path:
+        """Create a directory once per process; later calls skip the mkdir."""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+        return path
+
+    def _list_dir(self, path: Path) -> frozenset[str]:
+        """List subdirectory names of a skills directory, cached for LISTING_TTL."""
+        now = time.monotonic()
+        cached = self._dir_listing_cache.get(path)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        try:
+            with os.scandir(path) as it:
+                names = frozenset(entry.name for entry in it if entry.is_dir())
+        except OSError:
+            names = frozenset()
+
+        self._dir_listing_cache[path] = (now + self.LISTING_TTL, names)
+        return names
 
     @property
     def global_base(self) -> Path:
@@ -41,37 +119,79 @@ class PathResolver:
         """Get project-level skills directory."""
         return self.get_project_base(location) / SKILLS_DIR
 
-    def get_search_dirs(self) -> list[tuple[Path, Literal[".aiskills", ".claude", ".agent"]]]:
+    def get_search_dirs(
+        self,
+    ) -> list[tuple[Path, Literal["project", "global"], Literal[".aiskills", ".claude", ".agent"]]]:
         """Get all directories to search for skills, in priority order.
 
+        The result is cached and revalidated by stat()ing only the directories
+        whose mtime changes when a new search location appears: the project
+        root, project directories (.aiskills, .claude, .agent) that have no
+        skills/ yet, and the global base while it has no skills/. A location
+        removed later stays listed (and simply yields no skills) until one of
+        those changes or clear_cache() is called.
+
         Returns:
-            List of (path, location_type) tuples, highest priority first
+            List of (path, source, location_type) tuples, highest priority first
         """
-        dirs: list[tuple[Path, Literal[".aiskills", ".claude", ".agent"]]] = []
-
-        # Project directories (highest priority)
+        cached = self._search_dirs_cache
+        if cached is not None and tuple(map(self._mtime, cached[0])) == cached[1]:
+            return list(cached[2])
+
+        # Each mtime is read before its directory is listed, so a change that
+        # races the scan invalidates the cache on the next call
+        watched_paths = [self._cwd_str]
+        mtimes = [self._mtime(self._cwd_str)]
+        dirs: list[_SearchDir] = []
+
+        try:
+            with os.scandir(self._cwd_str) as it:
+                present = {e.name for e in it if e.name in PROJECT_DIRS and e.is_dir()}
+        except OSError:
+            present = set()
+
+        # Project directories (highest priority); DirEntry carries the file
+        # type, so listing each candidate needs no extra stat()
         for location in PROJECT_DIRS:
-            project_path = self.cwd / location / SKILLS_DIR
-            if project_path.exists():
-                location_type: Literal[".aiskills", ".claude", ".agent"]
-                if location == ".aiskills":
-                    location_type = ".aiskills"
-                elif location == ".claude":
-                    location_type = ".claude"
-                else:
-                    location_type = ".agent"
-                dirs.append((project_path, location_type))
+            if location not in present:
+                continue
+            base = os.path.join(self._cwd_str, location)
+            mtime = self._mtime(base)
+            try:
+                with os.scandir(base) as it:
+                    has_skills = any(e.name == SKILLS_DIR and e.is_dir() for e in it)
+            except OSError:
+                has_skills = False
+            if not has_skills:
+                watched_paths.append(base)
+                mtimes.append(mtime)
+                continue
+
+            location_type: Literal[".aiskills", ".claude", ".agent"]
+            if location == ".aiskills":
+                location_type = ".aiskills"
+            elif location == ".claude":
+                location_type = ".claude"
+            else:
+                location_type = ".agent"
+            dirs.append((Path(os.path.join(base, SKILLS_DIR)), "project", location_type))
 
         # Global directory (lowest priority)
+        global_base = str(self.global_base)
+        mtime = self._mtime(global_base)
         global_path = self.global_skills_dir
-        if global_path.exists():
-            dirs.append((global_path, ".aiskills"))
+        if os.path.exists(global_path):
+            dirs.append((global_path, "global", ".aiskills"))
+        else:
+            watched_paths.append(global_base)
+            mtimes.append(mtime)
 
-        return dirs
+        self._search_dirs_cache = (tuple(watched_paths), tuple(mtimes), dirs)
+        return list(dirs)
 
     def get_all_search_paths(self) -> list[Path]:
         """Get all search paths without location type info."""
-        return [path for path, _ in self.get_search_dirs()]
+        return [path for path, _, _ in self.get_search_dirs()]
 
     def find_skill(
         self, name: str
@@ -84,19 +204,60 @@ class PathResolver:
         Returns:
             Tuple of (path, source, location_type) or None if not found
         """
-        for skills_dir, location_type in self.get_search_dirs():
-            skill_path = skills_dir / name
-            if skill_path.exists() and (skill_path / "SKILL.md").exists():
-                # Determine source based on path
-                source: Literal["project", "global"]
-                if str(skills_dir).startswith(str(self.cwd)):
-                    source = "project"
-                else:
-                    source = "global"
-                return skill_path, source, location_type
-
+        expiry = self._neg_cache.get(name)
+        if expiry is not None:
+            if expiry > time.monotonic():
+                return None
+            del self._neg_cache[name]
+
+        for skills_dir, source, location_type in self.get_search_dirs():
+            if name not in self._list_dir(skills_dir):
+                continue
+            if os.path.exists(os.path.join(skills_dir, name, SKILL_FILE)):
+                return skills_dir / name, source, location_type
+
+        self._neg_cache[name] = time.monotonic() + self.LISTING_TTL
         return None
 
+    def find_skills(
+        self, names: Iterable[str]
+    ) -> dict[
+        str,
+        tuple[Path, Literal["project", "global"], Literal[".aiskills", ".claude", ".agent"]]
+        | None,
+    ]:
+        """Find several skills by name with one pass over the search paths.
+
+        Each search directory is listed once for the whole batch instead of
+        once per name as repeated find_skill() calls would.
+
+        Args:
+            names: Skill names to find
+
+        Returns:
+            Mapping of name to (path, source, location_type), or None if not found
+        """
+        found: dict[
+            str,
+            tuple[Path, Literal["project", "global"], Literal[".aiskills", ".claude", ".agent"]]
+            | None,
+        ] = dict.fromkeys(names)
+        now = time.monotonic()
+        pending = {name for name in found if self._neg_cache.get(name, 0.0) <= now}
+
+        for skills_dir, source, location_type in self.get_search_dirs():
+            if not pending:
+                break
+            for name in pending & self._list_dir(skills_dir):
+                if os.path.exists(os.path.join(skills_dir, name, SKILL_FILE)):
+                    found[name] = (skills_dir / name, source, location_type)
+                    pending.discard(name)
+
+        expiry = now + self.LISTING_TTL
+        for name in pending:
+            self._neg_cache[name] = expiry
+        return found
+
     def get_install_path(
         self,
         name: str,
@@ -133,7 +294,10 @@ class PathResolver:
         else:
             skills_dir = self.get_project_skills_dir(location)
 
-        skills_dir.mkdir(parents=True, exist_ok=True)
+        if skills_dir not in self._ensured_dirs:
+            self._ensure(skills_dir)
+            # A new skills dir changes the search dirs
+            self.clear_cache()
         return skills_dir
 
     def get_lock_file_path(self, global_install: bool = False) -> Path:
@@ -145,27 +309,21 @@ class PathResolver:
         Returns:
             Path to aiskills.lock
         """
-        from ..constants import LOCK_FILE
-
         if global_install:
             return self.global_base / LOCK_FILE
         return self.cwd / ".aiskills" / LOCK_FILE
 
     def get_cache_dir(self) -> Path:
         """Get cache directory for remote skills."""
-        from ..constants import CACHE_DIR
-
-        cache_dir = self.global_base / CACHE_DIR
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
+        return self._ensure(self.global_base / CACHE_DIR)
 
     def get_registry_dir(self) -> Path:
         """Get registry directory for index and vectors."""
-        from ..constants import REGISTRY_DIR
+        return self._ensure(self.global_base / REGISTRY_DIR)
 
-        registry_dir = self.global_base / REGISTRY_DIR
-        registry_dir.mkdir(parents=True, exist_ok=True)
-        return registry_dir
+    def get_template_cache_dir(self) -> Path:
+        """Get directory for compiled template bytecode."""
+        return self._ensure(self.global_base / TEMPLATE_CACHE_DIR)
 
     def expand_path(self, path: str) -> Path:
         """Expand a path string, handling ~ and relative paths.
@@ -193,32 +351,26 @@ class PathResolver:
         - GitHub shorthand: owner/repo
         - Git URLs: git@github.com:..., https://github.com/...
         """
-        # Git URLs
-        if source.startswith(("git@", "https://", "http://", "ssh://")):
-            return False
-
-        # Explicit local paths
-        if source.startswith(("/", "./", "../", "~")):
+        # Explicit local paths, decided from the first character(s)
+        first = source[:1]
+        if first == "/" or first == "~":
+            return True
+        if first == "." and source.startswith(("./", "../")):
             return True
 
-        # Check if it looks like a GitHub shorthand (owner/repo with no slashes after)
-        # vs a local path with subdirectories
-        parts = source.split("/")
-        if len(parts) == 2 and not Path(source).exists():
-            # Likely GitHub shorthand if path doesn't exist
+        # Git URLs
+        if source.startswith(("git@", "https://", "http://", "ssh://")):
             return False
 
-        # If path exists locally, it's local
-        return Path(source).expanduser().exists()
-
-
-# Singleton instance
-_resolver: PathResolver | None = None
+        # Ambiguous (e.g. owner/repo vs a local subdirectory): local only if
+        # it exists. GitHub shorthand that doesn't exist locally is remote.
+        return Path(source).exists()
 
 
+@lru_cache(maxsize=1)
 def get_path_resolver() -> PathResolver:
-    """Get the singleton path resolver instance."""
-    global _resolver
-    if _resolver is None:
-        _resolver = PathResolver()
-    return _resolver
+    """Get the singleton path resolver instance.
+
+    Use ``get_path_resolver.cache_clear()`` to reset it (e.g. in tests).
+    """
+    return PathResolver()
@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import total_ordering
-from typing import Literal
+from typing import Any, ClassVar, Literal
+
+ConstraintOperator = Literal["=", ">=", "<=", ">", "<", "^", "~", "*"]
+
+
+def _is_numeric_identifier(part: str) -> bool:
+    """Check for a semver numeric identifier (ASCII digits, no leading zero)."""
+    return part.isascii() and part.isdigit() and (part[0] != "0" or part == "0")
 
 
 class VersionBump(str, Enum):
@@ -17,9 +26,16 @@ class VersionBump(str, Enum):
     PATCH = "patch"
     PRERELEASE = "prerelease"
 
+    @classmethod
+    def _missing_(cls, value: object) -> VersionBump | None:
+        """Accept bump names case-insensitively, e.g. ``VersionBump("PATCH")``."""
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower())  # type: ignore[return-value]
+        return None
+
 
 @total_ordering
-@dataclass
+@dataclass(slots=True)
 class SemanticVersion:
     """Semantic version representation (semver 2.0.0).
 
@@ -35,6 +51,11 @@ class SemanticVersion:
     prerelease: str | None = None
     build: str | None = None
 
+    # Total-order key, computed on first comparison
+    _sort_key: tuple[Any, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # Regex for parsing semver
     PATTERN = re.compile(
         r"^(?P<major>0|[1-9]\d*)"
@@ -62,16 +83,31 @@ class SemanticVersion:
         if version_str.startswith("v"):
             version_str = version_str[1:]
 
+        # Fast path: plain "X.Y.Z" without prerelease/build skips the regex
+        if "-" not in version_str and "+" not in version_str:
+            parts = version_str.split(".")
+            if len(parts) == 3:
+                major, minor, patch = parts
+                if (
+                    _is_numeric_identifier(major)
+                    and _is_numeric_identifier(minor)
+                    and _is_numeric_identifier(patch)
+                ):
+                    return cls(major=int(major), minor=int(minor), patch=int(patch))
+
         match = cls.PATTERN.match(version_str)
         if not match:
             raise ValueError(f"Invalid semantic version: {version_str}")
 
+        # Intern labels so the many versions sharing "beta"/"rc.1" share one string
+        prerelease = match.group("prerelease")
+        build = match.group("build")
         return cls(
             major=int(match.group("major")),
             minor=int(match.group("minor")),
             patch=int(match.group("patch")),
-            prerelease=match.group("prerelease"),
-            build=match.group("build"),
+            prerelease=sys.intern(prerelease) if prerelease else None,
+            build=sys.intern(build) if build else None,
         )
 
     @classmethod
@@ -102,107 +138,89 @@ class SemanticVersion:
             and self.prerelease == other.prerelease
         )
 
+    @property
+    def sort_key(self) -> tuple[Any, ...]:
+        """Key whose natural tuple ordering matches semver precedence.
+
+        Releases sort after their prereleases; prerelease identifiers compare
+        numerically when numeric, lexically otherwise, and numeric < alpha.
+        Build metadata is ignored.
+        """
+        key = self._sort_key
+        if key is None:
+            if self.prerelease is None:
+                key = (self.major, self.minor, self.patch, 1, ())
+            else:
+                identifiers = tuple(
+                    (0, int(part), "") if part.isdigit() else (1, 0, part)
+                    for part in self.prerelease.split(".")
+                )
+                key = (self.major, self.minor, self.patch, 0, identifiers)
+            self._sort_key = key
+        return key
+
     def __lt__(self, other: "SemanticVersion") -> bool:
         """Compare versions (build metadata ignored per semver spec)."""
         if not isinstance(other, SemanticVersion):
             return NotImplemented
-
-        # Compare major.minor.patch
-        self_tuple = (self.major, self.minor, self.patch)
-        other_tuple = (other.major, other.minor, other.patch)
-
-        if self_tuple != other_tuple:
-            return self_tuple < other_tuple
-
-        # Prerelease has lower precedence than release
-        if self.prerelease is None and other.prerelease is None:
-            return False
-        if self.prerelease is None:
-            return False  # Release > prerelease
-        if other.prerelease is None:
-            return True  # Prerelease < release
-
-        # Compare prerelease identifiers
-        return self._compare_prerelease(self.prerelease, other.prerelease) < 0
-
-    @staticmethod
-    def _compare_prerelease(a: str, b: str) -> int:
-        """Compare prerelease strings per semver spec."""
-        a_parts = a.split(".")
-        b_parts = b.split(".")
-
-        for i in range(max(len(a_parts), len(b_parts))):
-            if i >= len(a_parts):
-                return -1  # Fewer parts = lower precedence
-            if i >= len(b_parts):
-                return 1
-
-            a_part = a_parts[i]
-            b_part = b_parts[i]
-
-            # Numeric identifiers compare as integers
-            a_num = a_part.isdigit()
-            b_num = b_part.isdigit()
-
-            if a_num and b_num:
-                diff = int(a_part) - int(b_part)
-                if diff != 0:
-                    return diff
-            elif a_num:
-                return -1  # Numeric < alphanumeric
-            elif b_num:
-                return 1
-            else:
-                # Compare as strings
-                if a_part < b_part:
-                    return -1
-                if a_part > b_part:
-                    return 1
-
-        return 0
+        return self.sort_key < other.sort_key
 
     def __hash__(self) -> int:
         """Hash for use in sets/dicts."""
         return hash((self.major, self.minor, self.patch, self.prerelease))
 
-    def bump(self, bump_type: VersionBump) -> "SemanticVersion":
+    def bump(self, bump_type: VersionBump | str) -> "SemanticVersion":
         """Create a new version with the specified bump.
 
         Args:
-            bump_type: Type of version increment
+            bump_type: Type of version increment (or its name, e.g. "minor")
 
         Returns:
             New SemanticVersion with incremented version
         """
-        if bump_type == VersionBump.MAJOR:
-            return SemanticVersion(self.major + 1, 0, 0)
-        elif bump_type == VersionBump.MINOR:
-            return SemanticVersion(self.major, self.minor + 1, 0)
-        elif bump_type == VersionBump.PATCH:
-            return SemanticVersion(self.major, self.minor, self.patch + 1)
-        elif bump_type == VersionBump.PRERELEASE:
-            # Increment prerelease or add .1
-            if self.prerelease:
-                parts = self.prerelease.split(".")
-                # Try to increment last numeric part
-                for i in range(len(parts) - 1, -1, -1):
-                    if parts[i].isdigit():
-                        parts[i] = str(int(parts[i]) + 1)
-                        return SemanticVersion(
-                            self.major, self.minor, self.patch,
-                            prerelease=".".join(parts)
-                        )
-                # No numeric part, append .1
-                return SemanticVersion(
-                    self.major, self.minor, self.patch,
-                    prerelease=f"{self.prerelease}.1"
-                )
-            else:
-                return SemanticVersion(
-                    self.major, self.minor, self.patch + 1,
-                    prerelease="alpha.1"
-                )
-        raise ValueError(f"Unknown bump type: {bump_type}")
+        fn = self._BUMP_FNS.get(bump_type)
+        if fn is None:
+            fn = self._BUMP_FNS[VersionBump(bump_type)]
+        return fn(self)
+
+    def _bump_major(self) -> SemanticVersion:
+        return SemanticVersion(self.major + 1, 0, 0)
+
+    def _bump_minor(self) -> SemanticVersion:
+        return SemanticVersion(self.major, self.minor + 1, 0)
+
+    def _bump_patch(self) -> SemanticVersion:
+        return SemanticVersion(self.major, self.minor, self.patch + 1)
+
+    def _bump_prerelease(self) -> SemanticVersion:
+        # Increment prerelease or add .1
+        if self.prerelease:
+            parts = self.prerelease.split(".")
+            # Try to increment last numeric part
+            for i in range(len(parts) - 1, -1, -1):
+                if parts[i].isdigit():
+                    parts[i] = str(int(parts[i]) + 1)
+                    return SemanticVersion(
+                        self.major, self.minor, self.patch,
+                        prerelease=".".join(parts)
+                    )
+            # No numeric part, append .1
+            return SemanticVersion(
+                self.major, self.minor, self.patch,
+                prerelease=f"{self.prerelease}.1"
+            )
+        return SemanticVersion(
+            self.major, self.minor, self.patch + 1,
+            prerelease="alpha.1"
+        )
+
+    # Keyed by VersionBump, which is a str, so plain names look up directly
+    _BUMP_FNS: ClassVar[dict[str, Callable[[SemanticVersion], SemanticVersion]]] = {
+        VersionBump.MAJOR: _bump_major,
+        VersionBump.MINOR: _bump_minor,
+        VersionBump.PATCH: _bump_patch,
+        VersionBump.PRERELEASE: _bump_prerelease,
+    }
 
     @property
     def is_prerelease(self) -> bool:
@@ -215,7 +233,17 @@ class SemanticVersion:
         return self.major >= 1 and not self.is_prerelease
 
 
-@dataclass
+# First character of a constraint -> (operator, operator when followed by "=")
+_OPERATOR_PREFIXES: dict[str, tuple[ConstraintOperator, ConstraintOperator | None]] = {
+    "^": ("^", None),  # Caret (compatible with)
+    "~": ("~", None),  # Tilde (patch-level changes)
+    ">": (">", ">="),
+    "<": ("<", "<="),
+    "=": ("=", None),
+}
+
+
+@dataclass(slots=True)
 class VersionConstraint:
     """Version constraint for dependency resolution.
 
@@ -228,7 +256,7 @@ class VersionConstraint:
     - Latest: * or latest
     """
 
-    operator: Literal["=", ">=", "<=", ">", "<", "^", "~", "*"]
+    operator: ConstraintOperator
     version: SemanticVersion | None
     upper_bound: SemanticVersion | None = None  # For ranges
 
@@ -248,21 +276,16 @@ class VersionConstraint:
         if constraint_str in ("*", "latest", ""):
             return cls(operator="*", version=None)
 
-        # Caret (compatible with)
-        if constraint_str.startswith("^"):
-            version = SemanticVersion.parse(constraint_str[1:])
-            return cls(operator="^", version=version)
-
-        # Tilde (patch-level changes)
-        if constraint_str.startswith("~"):
-            version = SemanticVersion.parse(constraint_str[1:])
-            return cls(operator="~", version=version)
-
-        # Comparison operators
-        for op in (">=", "<=", ">", "<", "="):
-            if constraint_str.startswith(op):
-                version = SemanticVersion.parse(constraint_str[len(op):])
-                return cls(operator=op, version=version)
+        # Operator prefixes (^, ~, >=, <=, >, <, =): one dict lookup
+        prefix = _OPERATOR_PREFIXES.get(constraint_str[0])
+        if prefix is not None:
+            operator, operator_eq = prefix
+            if operator_eq is not None and constraint_str[1:2] == "=":
+                operator, offset = operator_eq, 2
+            else:
+                offset = 1
+            version = SemanticVersion.parse(constraint_str[offset:])
+            return cls(operator=operator, version=version)
 
         # Wildcard (1.2.*)
         if "*" in constraint_str:
@@ -287,46 +310,42 @@ class VersionConstraint:
         Returns:
             True if version satisfies the constraint
         """
-        if self.operator == "*":
-            return True
-
         if self.version is None:
             return True
 
-        if self.operator == "=":
-            return version == self.version
-
-        if self.operator == ">=":
-            return version >= self.version
-
-        if self.operator == "<=":
-            return version <= self.version
-
-        if self.operator == ">":
-            return version > self.version
-
-        if self.operator == "<":
-            return version < self.version
-
-        if self.operator == "^":
-            # ^1.2.3 means >=1.2.3 <2.0.0 (for major > 0)
-            # ^0.2.3 means >=0.2.3 <0.3.0 (for major = 0)
-            if version < self.version:
-                return False
-            if self.version.major == 0:
-                return version.major == 0 and version.minor == self.version.minor
-            return version.major == self.version.major
-
-        if self.operator == "~":
-            # ~1.2.3 means >=1.2.3 <1.3.0
-            if version < self.version:
-                return False
-            return (
-                version.major == self.version.major
-                and version.minor == self.version.minor
-            )
+        check = self._SATISFIES.get(self.operator)
+        return check is not None and check(self, version)
+
+    def _satisfies_caret(self, version: SemanticVersion) -> bool:
+        """^1.2.3 means >=1.2.3 <2.0.0; ^0.2.3 means >=0.2.3 <0.3.0."""
+        assert self.version is not None
+        if version.sort_key < self.version.sort_key:
+            return False
+        if self.version.major == 0:
+            return version.major == 0 and version.minor == self.version.minor
+        return version.major == self.version.major
+
+    def _satisfies_tilde(self, version: SemanticVersion) -> bool:
+        """~1.2.3 means >=1.2.3 <1.3.0."""
+        assert self.version is not None
+        if version.sort_key < self.version.sort_key:
+            return False
+        return (
+            version.major == self.version.major
+            and version.minor == self.version.minor
+        )
 
-        return False
+    # Operator -> check(constraint, version); version is never None here
+    _SATISFIES: ClassVar[dict[str, Callable[[VersionConstraint, SemanticVersion], bool]]] = {
+        "*": lambda c, v: True,
+        "=": lambda c, v: v == c.version,
+        ">=": lambda c, v: v.sort_key >= c.version.sort_key,  # type: ignore[union-attr]
+        "<=": lambda c, v: v.sort_key <= c.version.sort_key,  # type: ignore[union-attr]
+        ">": lambda c, v: v.sort_key > c.version.sort_key,  # type: ignore[union-attr]
+        "<": lambda c, v: v.sort_key < c.version.sort_key,  # type: ignore[union-attr]
+        "^": _satisfies_caret,
+        "~": _satisfies_tilde,
+    }
 
     def __str__(self) -> str:
         """String representation."""
@@ -378,23 +397,18 @@ def find_latest(versions: list[str], include_prerelease: bool = False) -> str |
     Returns:
         Latest version string or None if list is empty
     """
-    if not versions:
-        return None
-
-    parsed = []
+    # Single pass keeping the max; ties keep the first occurrence
+    best_key: tuple[Any, ...] | None = None
+    best_raw: str | None = None
     for v in versions:
-        try:
-            sv = SemanticVersion.parse(v)
-            if include_prerelease or not sv.is_prerelease:
-                parsed.append((sv, v))
-        except ValueError:
+        sv = SemanticVersion.try_parse(v)
+        if sv is None or (sv.is_prerelease and not include_prerelease):
             continue
+        key = sv.sort_key
+        if best_key is None or key > best_key:
+            best_key, best_raw = key, v
 
-    if not parsed:
-        return None
-
-    parsed.sort(key=lambda x: x[0], reverse=True)
-    return parsed[0][1]
+    return best_raw
 
 
 def satisfies_constraint(version: str, constraint: str) -> bool:
@@ -1,7 +1,34 @@
 """Vector store backends for semantic search."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .base import SearchResult, VectorStoreError, VectorStoreProvider
-from .chroma import ChromaVectorStore, get_chroma_store
+
+if TYPE_CHECKING:
+    from .chroma import ChromaVectorStore, configure_hnsw_params, get_chroma_store
+
+# Backends are imported on first access so `import aiskills.vector_stores`
+# stays cheap for commands that never touch them.
+_LAZY_ATTRS = {
+    "ChromaVectorStore": ".chroma",
+    "get_chroma_store": ".chroma",
+    "configure_hnsw_params": ".chroma",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "VectorStoreProvider",
@@ -9,4 +36,5 @@ __all__ = [
     "SearchResult",
     "ChromaVectorStore",
     "get_chroma_store",
+    "configure_hnsw_params",
 ]
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
-class SearchResult:
+
+class SearchResult(NamedTuple):
     """A single search result from vector store."""
 
     id: str
@@ -22,13 +24,33 @@ class VectorStoreProvider(ABC):
     """Abstract base class for vector stores.
 
     Vector stores persist embeddings and enable similarity search.
+    Embeddings are passed as float32 numpy arrays; plain lists are still
+    accepted and converted with ``_coerce``.
     """
 
+    @staticmethod
+    def _coerce(x: np.ndarray | Sequence[Any]) -> np.ndarray:
+        """Convert embeddings to a contiguous float32 array.
+
+        Args:
+            x: Embedding (shape (d,)) or batch of embeddings (shape (n, d))
+
+        Returns:
+            Array view of ``x``; no copy if it already is float32
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise VectorStoreError(
+                "numpy not installed. Install with: pip install aiskills[search]"
+            ) from e
+        return np.ascontiguousarray(x, dtype=np.float32)
+
     @abstractmethod
     def add(
         self,
         ids: list[str],
-        embeddings: list[list[float]],
+        embeddings: np.ndarray | Sequence[Sequence[float]],
         documents: list[str],
         metadatas: list[dict[str, Any]] | None = None,
     ) -> None:
@@ -36,7 +58,7 @@ class VectorStoreProvider(ABC):
 
         Args:
             ids: Unique identifiers for each embedding
-            embeddings: Vector embeddings
+            embeddings: Vector embeddings, shape (n, d)
             documents: Original text documents
             metadatas: Optional metadata for each document
         """
@@ -45,22 +67,56 @@ class VectorStoreProvider(ABC):
     @abstractmethod
     def query(
         self,
-        embedding: list[float],
+        embedding: np.ndarray | Sequence[float],
         n_results: int = 10,
         where: dict[str, Any] | None = None,
+        include_documents: bool = True,
     ) -> list[SearchResult]:
         """Query for similar embeddings.
 
         Args:
-            embedding: Query embedding vector
+            embedding: Query embedding vector, shape (d,)
             n_results: Maximum number of results
             where: Optional metadata filter
+            include_documents: Fetch stored documents; if False, results
+                carry "" as their document
 
         Returns:
             List of search results sorted by similarity
         """
         ...
 
+    def query_batch(
+        self,
+        embeddings: np.ndarray | Sequence[Sequence[float]],
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+        include_documents: bool = True,
+    ) -> list[list[SearchResult]]:
+        """Query for several embeddings at once.
+
+        The default runs one query() per embedding; backends that support
+        multi-vector queries should override it.
+
+        Args:
+            embeddings: Query embedding vectors, shape (q, d)
+            n_results: Maximum number of results per query
+            where: Optional metadata filter applied to every query
+            include_documents: Fetch stored documents (see query())
+
+        Returns:
+            One list of search results per query, in input order
+        """
+        return [
+            self.query(
+                embedding,
+                n_results=n_results,
+                where=where,
+                include_documents=include_documents,
+            )
+            for embedding in embeddings
+        ]
+
     @abstractmethod
     def delete(self, ids: list[str]) -> None:
         """Delete embeddings by ID.
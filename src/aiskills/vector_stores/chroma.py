@@ -2,14 +2,168 @@
 
 from __future__ import annotations
 
+import logging
+import threading
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
 
 from .base import SearchResult, VectorStoreError, VectorStoreProvider
 
 if TYPE_CHECKING:
-    import chromadb
+    import numpy as np
+    from chromadb.api import ClientAPI
     from chromadb.api.models.Collection import Collection
+    from chromadb.api.types import Include
+
+logger = logging.getLogger(__name__)
+
+# Metadata value types ChromaDB stores as-is
+_PRIMITIVES = (str, int, float, bool)
+
+SQLITE_FILE = "chroma.sqlite3"
+
+# Batches queued for the writer thread during a pipelined add()
+_MAX_PENDING_UPSERTS = 2
+
+# SQLite files already tuned by this process
+_tuned_paths: set[Path] = set()
+
+# One client per persist_dir (":memory:" for in-memory) for the whole process
+_CLIENT_CACHE: dict[str, ClientAPI] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# Writes made by any store in this process, per (persist_dir, collection name)
+_WRITE_VERSIONS: dict[tuple[str | None, str], int] = {}
+
+
+# chromadb module and Settings class, loaded on first use
+_chromadb: Any = None
+_Settings: Any = None
+
+
+def _ensure_chromadb() -> tuple[Any, Any]:
+    """Import chromadb once and return (chromadb, Settings)."""
+    global _chromadb, _Settings
+    if _chromadb is None:
+        try:
+            import chromadb
+            from chromadb.config import Settings
+        except ImportError as e:
+            raise VectorStoreError(
+                "ChromaDB not installed. Install with: pip install aiskills[search]"
+            ) from e
+        _chromadb, _Settings = chromadb, Settings
+    return _chromadb, _Settings
+
+
+def _create_client(persist_dir: str | None) -> ClientAPI:
+    """Create a ChromaDB client (persistent if persist_dir is given)."""
+    chromadb, settings_cls = _ensure_chromadb()
+
+    client: ClientAPI
+    if persist_dir is None:
+        client = chromadb.Client(settings=settings_cls(anonymized_telemetry=False))
+        return client
+
+    Path(persist_dir).mkdir(parents=True, exist_ok=True)
+    _tune_sqlite(Path(persist_dir) / SQLITE_FILE)
+    client = chromadb.PersistentClient(
+        path=persist_dir,
+        settings=settings_cls(anonymized_telemetry=False),
+    )
+    return client
+
+
+def _get_shared_client(persist_dir: str | None) -> ClientAPI:
+    """Return the process-wide client for persist_dir, creating it once.
+
+    Separate clients on the same path each open their own SQLite
+    connections, so all stores in a process share one.
+    """
+    key = persist_dir or ":memory:"
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = _CLIENT_CACHE[key] = _create_client(persist_dir)
+    return client
+
+
+def _tune_sqlite(db_path: Path) -> None:
+    """Switch ChromaDB's SQLite file to WAL journaling.
+
+    The journal mode is stored in the database file, so it also applies
+    to the connections ChromaDB opens itself. This runs at most once per
+    file and before ChromaDB opens it: closing a second connection to a file
+    ChromaDB already has open in this process would drop ChromaDB's POSIX
+    locks. Failures (e.g. another process holding the file) are ignored.
+    """
+    if db_path in _tuned_paths:
+        return
+    _tuned_paths.add(db_path)
+
+    import sqlite3
+
+    try:
+        conn = sqlite3.connect(str(db_path))
+    except sqlite3.Error:
+        return
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.Error:
+        pass
+    finally:
+        conn.close()
+
+
+def configure_hnsw_params(vector_count: int) -> dict[str, int]:
+    """Pick HNSW build/search parameters for an expected collection size.
+
+    Args:
+        vector_count: Number of vectors the collection is expected to hold
+
+    Returns:
+        Dict with M, construction_ef and search_ef for ``hnsw_config``
+    """
+    if vector_count < 100_000:
+        return {"M": 16, "construction_ef": 64, "search_ef": 40}
+    if vector_count < 1_000_000:
+        return {"M": 24, "construction_ef": 100, "search_ef": 100}
+    return {"M": 32, "construction_ef": 128, "search_ef": 200}
+
+
+@lru_cache(maxsize=8)
+def _build_collection(
+    persist_dir: str | None,
+    name: str,
+    hnsw_params: tuple[tuple[str, Any], ...] = (),
+) -> Collection:
+    """Open a collection once per (persist_dir, name, HNSW params) for the whole process.
+
+    get_or_create_collection queries ChromaDB's metadata tables, so stores
+    created per request (e.g. by the API server) reuse the cached handle.
+    HNSW params only take effect when the collection is created.
+    Call ``_build_collection.cache_clear()`` after deleting a collection.
+    """
+    metadata: dict[str, Any] = {"hnsw:space": "cosine"}
+    metadata.update((f"hnsw:{key}", value) for key, value in hnsw_params)
+    client = _get_shared_client(persist_dir)
+    return client.get_or_create_collection(name=name, metadata=metadata)
+
+
+class _Matrix(NamedTuple):
+    """In-memory snapshot of a collection for brute-force search."""
+
+    ids: list[str]
+    documents: list[str | None]
+    metadatas: list[dict[str, Any] | None]
+    vectors: np.ndarray  # (n, d), unit rows
 
 
 class ChromaVectorStore(VectorStoreProvider):
@@ -23,61 +177,107 @@ class ChromaVectorStore(VectorStoreProvider):
     """
 
     COLLECTION_NAME = "aiskills"
+    DEFAULT_BATCH_SIZE = 250
+    DEFAULT_DELETE_BATCH_SIZE = 1000
+    DEFAULT_BRUTE_FORCE_LIMIT = 10_000
+    # Ingests larger than this many batches pipeline cleaning and upserts
+    PIPELINE_MIN_BATCHES = 2
 
     def __init__(
         self,
         persist_dir: Path | str | None = None,
         collection_name: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        normalize: bool = True,
+        dtype: Literal["float32", "float16"] = "float32",
+        brute_force_limit: int = DEFAULT_BRUTE_FORCE_LIMIT,
+        hnsw_config: dict[str, Any] | None = None,
+        delete_batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
     ):
         """Initialize ChromaDB store.
 
         Args:
             persist_dir: Directory for persistence (None for in-memory)
             collection_name: Name of collection (default: aiskills)
+            batch_size: Maximum records sent to ChromaDB per upsert call
+            normalize: L2-normalize embeddings before storing and querying.
+                Cosine distance is unchanged; set False if the embedding
+                model already emits unit vectors.
+            dtype: Precision embeddings are reduced to before storage.
+                ChromaDB keeps float32 internally, so "float16" only rounds
+                values to half precision (to check recall ahead of moving
+                to a half-precision index); it does not shrink the index.
+            brute_force_limit: Collections up to this size are searched with
+                an in-memory matrix product instead of the HNSW index
+                (0 disables). Filtered queries always go to ChromaDB.
+            hnsw_config: HNSW settings without the "hnsw:" prefix (e.g. M,
+                construction_ef, search_ef), applied when the collection is
+                created. See configure_hnsw_params().
+            delete_batch_size: Maximum IDs sent to ChromaDB per delete call
         """
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if delete_batch_size < 1:
+            raise ValueError(f"delete_batch_size must be positive, got {delete_batch_size}")
         self.persist_dir = Path(persist_dir) if persist_dir else None
         self.collection_name = collection_name or self.COLLECTION_NAME
-        self._client: chromadb.ClientAPI | None = None
+        self.batch_size = batch_size
+        self.delete_batch_size = delete_batch_size
+        self.normalize = normalize
+        self.dtype = dtype
+        self.brute_force_limit = brute_force_limit
+        self.hnsw_config = dict(hnsw_config) if hnsw_config else {}
+        self._client: ClientAPI | None = None
         self._collection: Collection | None = None
-
-    def _get_client(self) -> chromadb.ClientAPI:
+        # Unit-normalized copy of a small collection and the document count,
+        # each valid while the collection's _fingerprint() is unchanged
+        self._matrix: _Matrix | None = None
+        self._matrix_stamp: tuple[Any, ...] | None = None
+        self._count: int | None = None
+        self._count_stamp: tuple[Any, ...] | None = None
+
+    def _get_client(self) -> ClientAPI:
         """Get or create ChromaDB client."""
         if self._client is None:
-            try:
-                import chromadb
-                from chromadb.config import Settings
-            except ImportError as e:
-                raise VectorStoreError(
-                    "ChromaDB not installed. Install with: pip install aiskills[search]"
-                ) from e
-
-            if self.persist_dir:
-                self.persist_dir.mkdir(parents=True, exist_ok=True)
-                self._client = chromadb.PersistentClient(
-                    path=str(self.persist_dir),
-                    settings=Settings(anonymized_telemetry=False),
-                )
-            else:
-                self._client = chromadb.Client(
-                    settings=Settings(anonymized_telemetry=False),
-                )
-
+            self._client = _get_shared_client(self._persist_key)
         return self._client
 
+    @property
+    def _persist_key(self) -> str | None:
+        return str(self.persist_dir) if self.persist_dir else None
+
     def _get_collection(self) -> Collection:
-        """Get or create collection."""
+        """Get the collection, shared with other stores on the same path and name."""
         if self._collection is None:
-            client = self._get_client()
-            self._collection = client.get_or_create_collection(
-                name=self.collection_name,
-                metadata={"hnsw:space": "cosine"},
+            self._collection = _build_collection(
+                self._persist_key,
+                self.collection_name,
+                tuple(sorted(self.hnsw_config.items())),
             )
         return self._collection
 
+    def _prepare(self, x: np.ndarray | Sequence[Any]) -> np.ndarray:
+        """Coerce embeddings to float32, L2-normalize and round them as configured."""
+        arr = self._coerce(x)
+        if not self.normalize and self.dtype == "float32":
+            return arr
+
+        import numpy as np
+
+        if self.normalize:
+            norms = np.linalg.norm(arr, axis=-1, keepdims=True)
+            # New array, so the caller's embeddings are never modified
+            arr = arr / np.maximum(norms, 1e-12)
+        if self.dtype == "float16":
+            arr = arr.astype(np.float16).astype(np.float32)
+        return arr
+
     def add(
         self,
         ids: list[str],
-        embeddings: list[list[float]],
+        embeddings: np.ndarray | Sequence[Sequence[float]],
         documents: list[str],
         metadatas: list[dict[str, Any]] | None = None,
     ) -> None:
@@ -85,82 +285,277 @@ class ChromaVectorStore(VectorStoreProvider):
         if not ids:
             return
 
+        try:
+            self._add(ids, embeddings, documents, metadatas)
+        finally:
+            self._invalidate_caches()
+
+    def _add(
+        self,
+        ids: list[str],
+        embeddings: np.ndarray | Sequence[Sequence[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]] | None,
+    ) -> None:
         collection = self._get_collection()
+        vectors = self._prepare(embeddings)
+        batch_size = self.batch_size
+
+        # Upsert in fixed-size batches; slicing the array gives views, not copies
+        def batches() -> Iterator[tuple[int, dict[str, Any]]]:
+            for start in range(0, len(ids), batch_size):
+                end = start + batch_size
+                yield start // batch_size, {
+                    "ids": ids[start:end],
+                    "embeddings": vectors[start:end],
+                    "documents": documents[start:end],
+                    # ChromaDB rejects empty metadata dicts but accepts no metadata at all
+                    "metadatas": (
+                        None if metadatas is None else self._clean_metadatas(metadatas[start:end])
+                    ),
+                }
+
+        if len(ids) <= self.PIPELINE_MIN_BATCHES * batch_size:
+            for index, batch in batches():
+                self._upsert(collection, index, batch)
+            return
+
+        # Large ingests: one writer thread upserts while this thread cleans
+        # the next batch. ChromaDB releases the GIL while indexing, so the two
+        # overlap; _MAX_PENDING_UPSERTS bounds the batches held in memory.
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending: deque[Future[None]] = deque()
+            for index, batch in batches():
+                pending.append(writer.submit(self._upsert, collection, index, batch))
+                if len(pending) >= _MAX_PENDING_UPSERTS:
+                    pending.popleft().result()
+            while pending:
+                pending.popleft().result()
+
+    @staticmethod
+    def _clean_metadatas(metadatas: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Clean metadata (ChromaDB only supports str, int, float, bool).
+
+        Lists become comma-separated strings and None values are dropped.
+        """
+        return [
+            {
+                k: (
+                    v if isinstance(v, _PRIMITIVES)
+                    else ",".join(map(str, v)) if isinstance(v, list)
+                    else str(v)
+                )
+                for k, v in meta.items()
+                if v is not None
+            }
+            for meta in metadatas
+        ]
+
+    @staticmethod
+    def _upsert(collection: Collection, index: int, batch: dict[str, Any]) -> None:
+        """Upsert one batch, naming it in any error."""
+        try:
+            collection.upsert(**batch)
+        except Exception as e:
+            raise VectorStoreError(f"Failed to add to ChromaDB (batch {index}): {e}") from e
+
+    def _invalidate_caches(self) -> None:
+        """Drop this store's snapshot and mark the collection as written.
 
-        # ChromaDB doesn't like None metadata
-        if metadatas is None:
-            metadatas = [{} for _ in ids]
-
-        # Clean metadata (ChromaDB only supports str, int, float, bool)
-        cleaned_metadatas = []
-        for meta in metadatas:
-            cleaned = {}
-            for k, v in meta.items():
-                if isinstance(v, (str, int, float, bool)):
-                    cleaned[k] = v
-                elif isinstance(v, list):
-                    # Convert lists to comma-separated strings
-                    cleaned[k] = ",".join(str(x) for x in v)
-                elif v is not None:
-                    cleaned[k] = str(v)
-            cleaned_metadatas.append(cleaned)
+        Bumping the shared version invalidates the snapshots of every other
+        store on the same collection in this process as well.
+        """
+        self._matrix = None
+        self._matrix_stamp = None
+        self._count = None
+        self._count_stamp = None
+        key = (self._persist_key, self.collection_name)
+        _WRITE_VERSIONS[key] = _WRITE_VERSIONS.get(key, 0) + 1
+
+    def _fingerprint(self) -> tuple[Any, ...]:
+        """Cheap marker that changes whenever the collection may have been written.
+
+        Writes from this process bump a shared version; writes from other
+        processes (e.g. a CLI ``index`` run on the same persist_dir) change
+        the mtime of the SQLite file or its WAL, which reads leave untouched.
+        """
+        stamp: list[Any] = [_WRITE_VERSIONS.get((self._persist_key, self.collection_name), 0)]
+        if self.persist_dir is not None:
+            for name in (SQLITE_FILE, SQLITE_FILE + "-wal"):
+                try:
+                    stamp.append((self.persist_dir / name).stat().st_mtime_ns)
+                except OSError:
+                    stamp.append(None)
+        return tuple(stamp)
+
+    def _get_matrix(self, collection: Collection) -> _Matrix | None:
+        """Load the collection into memory if it is small enough for brute force."""
+        if self.brute_force_limit <= 0:
+            return None
+        # Taken before loading, so a write racing the load forces a reload
+        stamp = self._fingerprint()
+        if stamp == self._matrix_stamp:
+            return self._matrix
+
+        import numpy as np
 
         try:
-            collection.upsert(
-                ids=ids,
-                embeddings=embeddings,
-                documents=documents,
-                metadatas=cleaned_metadatas,
-            )
+            if collection.count() > self.brute_force_limit:
+                self._matrix_stamp = stamp
+                self._matrix = None
+                return None
+            data = collection.get(include=["embeddings", "documents", "metadatas"])
         except Exception as e:
-            raise VectorStoreError(f"Failed to add to ChromaDB: {e}") from e
+            raise VectorStoreError(f"Failed to load ChromaDB collection: {e}") from e
+
+        self._matrix_stamp = stamp
+        ids = data["ids"]
+        if ids:
+            vectors = np.asarray(data["embeddings"], dtype=np.float32).reshape(len(ids), -1)
+            vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        else:
+            vectors = np.empty((0, 0), dtype=np.float32)
+        self._matrix = _Matrix(
+            ids=ids,
+            documents=cast("list[str | None]", data["documents"] or [None] * len(ids)),
+            metadatas=cast("list[dict[str, Any] | None]", data["metadatas"] or [None] * len(ids)),
+            vectors=vectors,
+        )
+        self._count = len(ids)
+        self._count_stamp = stamp
+        return self._matrix
+
+    @staticmethod
+    def _brute_force(
+        matrix: _Matrix, queries: np.ndarray, n_results: int, include_documents: bool = True
+    ) -> list[list[SearchResult]]:
+        """Rank a small collection against (q, d) queries with one matrix product."""
+        import numpy as np
+
+        k = min(n_results, len(matrix.ids))
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        try:
+            # (n, q) cosine similarities
+            similarities = matrix.vectors @ (queries / np.maximum(norms, 1e-12)).T
+        except ValueError as e:
+            raise VectorStoreError(f"ChromaDB query failed: {e}") from e
+
+        ids, documents, metadatas, _ = matrix
+        if not include_documents:
+            documents = [None] * len(ids)
+        out: list[list[SearchResult]] = []
+        for column in similarities.T:
+            top = np.argpartition(-column, k - 1)[:k]
+            top = top[np.argsort(-column[top], kind="stable")]
+            # Same cosine distance and score as ChromaDB's own results
+            distances = (1.0 - column[top]).tolist()
+            # Positional (id, document, metadata, distance, score) builds the tuple directly
+            out.append([
+                SearchResult(
+                    ids[i],
+                    documents[i] or "",
+                    metadatas[i] or {},
+                    dist,
+                    1.0 - (dist if dist < 1.0 else 1.0),
+                )
+                for i, dist in zip(top.tolist(), distances)
+            ])
+        return out
 
     def query(
         self,
-        embedding: list[float],
+        embedding: np.ndarray | Sequence[float],
         n_results: int = 10,
         where: dict[str, Any] | None = None,
+        include_documents: bool = True,
     ) -> list[SearchResult]:
         """Query ChromaDB for similar documents."""
         collection = self._get_collection()
+        query_vector = self._prepare(embedding).reshape(1, -1)
+
+        if where is None:
+            matrix = self._get_matrix(collection)
+            if matrix is not None:
+                return self._brute_force(matrix, query_vector, n_results, include_documents)[0]
 
         try:
             results = collection.query(
-                query_embeddings=[embedding],
+                query_embeddings=query_vector,
                 n_results=n_results,
                 where=where,
-                include=["documents", "metadatas", "distances"],
+                include=self._query_include(include_documents),
             )
         except Exception as e:
             raise VectorStoreError(f"ChromaDB query failed: {e}") from e
 
-        # Convert to SearchResult list
-        search_results: list[SearchResult] = []
+        if not results["ids"]:
+            return []
+        return self._to_search_results(results, 0)
 
-        if not results["ids"] or not results["ids"][0]:
-            return search_results
+    def query_batch(
+        self,
+        embeddings: np.ndarray | Sequence[Sequence[float]],
+        n_results: int = 10,
+        where: dict[str, Any] | None = None,
+        include_documents: bool = True,
+    ) -> list[list[SearchResult]]:
+        """Query ChromaDB for several embeddings in one call."""
+        vectors = self._prepare(embeddings)
+        if len(vectors) == 0:
+            return []
 
-        ids = results["ids"][0]
-        documents = results["documents"][0] if results["documents"] else [""] * len(ids)
-        metadatas = results["metadatas"][0] if results["metadatas"] else [{}] * len(ids)
-        distances = results["distances"][0] if results["distances"] else [0.0] * len(ids)
+        collection = self._get_collection()
+        vectors = vectors.reshape(len(vectors), -1)
 
-        for i, doc_id in enumerate(ids):
-            # Convert distance to similarity score (cosine distance to similarity)
-            distance = distances[i]
-            score = 1.0 - min(distance, 1.0)  # Cosine distance is 0-2, but usually 0-1
+        if where is None:
+            matrix = self._get_matrix(collection)
+            if matrix is not None:
+                return self._brute_force(matrix, vectors, n_results, include_documents)
 
-            search_results.append(
-                SearchResult(
-                    id=doc_id,
-                    document=documents[i] or "",
-                    metadata=metadatas[i] or {},
-                    distance=distance,
-                    score=score,
-                )
+        try:
+            results = collection.query(
+                query_embeddings=vectors,
+                n_results=n_results,
+                where=where,
+                include=self._query_include(include_documents),
             )
+        except Exception as e:
+            raise VectorStoreError(f"ChromaDB query failed: {e}") from e
 
-        return search_results
+        if not results["ids"]:
+            return [[] for _ in range(len(vectors))]
+        return [self._to_search_results(results, i) for i in range(len(results["ids"]))]
+
+    @staticmethod
+    def _query_include(include_documents: bool) -> Include:
+        """Fields to fetch for a query; skill documents are the bulk of the payload."""
+        if include_documents:
+            return ["documents", "metadatas", "distances"]
+        return ["metadatas", "distances"]
+
+    @staticmethod
+    def _to_search_results(results: Any, query_index: int) -> list[SearchResult]:
+        """Build SearchResults for one query of a ChromaDB query response."""
+        ids = results["ids"][query_index]
+        documents = results["documents"][query_index] if results["documents"] else repeat("")
+        metadatas = results["metadatas"][query_index] if results["metadatas"] else repeat(None)
+        distances = results["distances"][query_index] if results["distances"] else repeat(0.0)
+
+        # Cosine distance is 0-2 but usually 0-1; score is the clamped similarity.
+        # Positional (id, document, metadata, distance, score) builds the tuple directly.
+        return [
+            SearchResult(
+                doc_id,
+                doc or "",
+                meta or {},
+                dist,
+                1.0 - (dist if dist < 1.0 else 1.0),
+            )
+            for doc_id, doc, meta, dist in zip(ids, documents, metadatas, distances)
+        ]
 
     def delete(self, ids: list[str]) -> None:
         """Delete documents by ID."""
@@ -168,11 +563,18 @@ class ChromaVectorStore(VectorStoreProvider):
             return
 
         collection = self._get_collection()
+        batch_size = self.delete_batch_size
 
         try:
-            collection.delete(ids=ids)
-        except Exception as e:
-            raise VectorStoreError(f"Failed to delete from ChromaDB: {e}") from e
+            for start in range(0, len(ids), batch_size):
+                try:
+                    collection.delete(ids=ids[start : start + batch_size])
+                except Exception as e:
+                    raise VectorStoreError(
+                        f"Failed to delete from ChromaDB (batch {start // batch_size}): {e}"
+                    ) from e
+        finally:
+            self._invalidate_caches()
 
     def get(self, ids: list[str]) -> list[dict[str, Any]]:
         """Get documents by ID."""
@@ -189,33 +591,54 @@ class ChromaVectorStore(VectorStoreProvider):
         except Exception as e:
             raise VectorStoreError(f"Failed to get from ChromaDB: {e}") from e
 
-        documents: list[dict[str, Any]] = []
-        for i, doc_id in enumerate(results["ids"]):
-            documents.append({
-                "id": doc_id,
-                "document": results["documents"][i] if results["documents"] else "",
-                "metadata": results["metadatas"][i] if results["metadatas"] else {},
-            })
-
-        return documents
+        doc_ids = results["ids"]
+        docs = results["documents"] or repeat("")
+        metas = results["metadatas"] or repeat(None)
+        return [
+            {"id": doc_id, "document": doc, "metadata": meta or {}}
+            for doc_id, doc, meta in zip(doc_ids, docs, metas)
+        ]
 
     def count(self) -> int:
-        """Get document count."""
-        collection = self._get_collection()
-        return collection.count()
+        """Get document count, cached until the collection is written."""
+        stamp = self._fingerprint()
+        if self._count is None or stamp != self._count_stamp:
+            self._count = self._get_collection().count()
+            self._count_stamp = stamp
+        return self._count
 
     def clear(self) -> None:
         """Clear all documents."""
         client = self._get_client()
 
+        # Skip the DROP (and its write lock) when there is nothing to clear
         try:
-            client.delete_collection(self.collection_name)
-            self._collection = None
+            # ChromaDB < 1.0 lists names, newer versions list Collection objects
+            existing = {getattr(c, "name", c) for c in client.list_collections()}
         except Exception:
-            pass  # Collection might not exist
+            existing = {self.collection_name}
+
+        if self.collection_name in existing:
+            try:
+                client.delete_collection(self.collection_name)
+            except Exception as e:
+                logger.debug("delete_collection(%r) failed: %s", self.collection_name, e)
+        self._collection = None
+        _build_collection.cache_clear()
+        self._invalidate_caches()
 
 
 # Factory function
-def get_chroma_store(persist_dir: Path | str | None = None) -> ChromaVectorStore:
-    """Create a ChromaDB vector store."""
-    return ChromaVectorStore(persist_dir=persist_dir)
+def get_chroma_store(
+    persist_dir: Path | str | None = None,
+    expected_count: int | None = None,
+) -> ChromaVectorStore:
+    """Create a ChromaDB vector store.
+
+    Args:
+        persist_dir: Directory for persistence (None for in-memory)
+        expected_count: Expected number of vectors; tunes HNSW parameters
+            via configure_hnsw_params() when the collection is created
+    """
+    hnsw_config = configure_hnsw_params(expected_count) if expected_count is not None else None
+    return ChromaVectorStore(persist_dir=persist_dir, hnsw_config=hnsw_config)
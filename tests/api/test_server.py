@@ -56,7 +56,7 @@ def populated_client(tmp_path, simple_skill_content, skill_with_variables_conten
     from aiskills.core import registry as registry_module
 
     manager_module._manager = None
-    paths_module._resolver = None
+    paths_module.get_path_resolver.cache_clear()
     if hasattr(registry_module, '_registry'):
         registry_module._registry = None
 
@@ -157,6 +157,28 @@ class TestSearchEndpoints:
         )
         assert response.status_code == 200
 
+    def test_search_without_documents(self, populated_client):
+        response = populated_client.post(
+            "/skills/search",
+            json={"query": "simple", "include_documents": False},
+        )
+        assert response.status_code == 200
+        assert "results" in response.json()
+
+    def test_search_batch(self, populated_client):
+        response = populated_client.post(
+            "/skills/search/batch",
+            json={"queries": ["simple", "variables"], "limit": 1},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["query"] for r in data["results"]] == ["simple", "variables"]
+        assert all(len(r["results"]) <= 1 for r in data["results"])
+
+    def test_search_batch_requires_queries(self, populated_client):
+        response = populated_client.post("/skills/search/batch", json={"queries": []})
+        assert response.status_code == 422
+
 
 class TestReadEndpoints:
     """Tests for read/render endpoints."""
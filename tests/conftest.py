@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -143,6 +142,10 @@ Just use it!
 """
 
 
+# SIMPLE_SKILL_MD encoded and split around its name, for building named variants
+_SIMPLE_SKILL_PREFIX, _SIMPLE_SKILL_SUFFIX = SIMPLE_SKILL_MD.encode().split(b"simple-skill", 1)
+
+
 SKILL_WITH_VARIABLES_MD = """\
 ---
 name: skill-with-variables
@@ -220,12 +223,31 @@ This skill is composed from multiple skills.
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_skill_content() -> str:
     """Return content for a simple SKILL.md."""
     return SIMPLE_SKILL_MD
 
 
+@pytest.fixture(scope="session")
+def simple_skill_bytes() -> bytes:
+    """Return simple SKILL.md content encoded once as UTF-8."""
+    return SIMPLE_SKILL_MD.encode()
+
+
+@pytest.fixture(scope="session")
+def skill_bytes_builder():
+    """Factory fixture building simple SKILL.md bytes for another skill name.
+
+    ``body_suffix`` is appended to the markdown body, e.g. to change the content hash.
+    """
+
+    def _build(name: str, body_suffix: bytes = b"") -> bytes:
+        return b"".join((_SIMPLE_SKILL_PREFIX, name.encode(), _SIMPLE_SKILL_SUFFIX, body_suffix))
+
+    return _build
+
+
 @pytest.fixture
 def skill_with_variables_content() -> str:
     """Return content for a skill with variables."""
@@ -297,6 +319,22 @@ def create_skill_file(tmp_skills_dir: Path):
     return _create
 
 
+@pytest.fixture(scope="session")
+def write_skill():
+    """Factory fixture writing pre-encoded SKILL.md bytes into a skill directory."""
+
+    def _write(skill_dir: Path, content: bytes) -> Path:
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(skill_dir / "SKILL.md", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content)
+        finally:
+            os.close(fd)
+        return skill_dir
+
+    return _write
+
+
 @pytest.fixture
 def populated_skills_dir(
     tmp_skills_dir: Path,
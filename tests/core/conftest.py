@@ -0,0 +1,69 @@
+"""Shared fixtures for core tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from aiskills.core.loader import SkillLoader
+from aiskills.core.renderer import SkillRenderer
+from aiskills.models.skill import Skill
+
+
+@pytest.fixture(scope="session")
+def loader() -> SkillLoader:
+    """Return a SkillLoader shared by the whole session (it holds no per-test state)."""
+    return SkillLoader()
+
+
+@pytest.fixture(scope="session")
+def renderer() -> SkillRenderer:
+    """Return a SkillRenderer shared by the whole session."""
+    return SkillRenderer()
+
+
+@pytest.fixture(scope="session")
+def prebuilt_simple_skill_dir(tmp_path_factory, simple_skill_bytes, write_skill) -> Path:
+    """Return a simple-skill directory built once per session.
+
+    Its parent holds no other skills. Tests must not modify it; use
+    create_skill_file for trees a test needs to change.
+    """
+    skills_dir = tmp_path_factory.mktemp("prebuilt-skills")
+    return write_skill(skills_dir / "simple-skill", simple_skill_bytes)
+
+
+@pytest.fixture(scope="session")
+def simple_skill(loader, simple_skill_content) -> Skill:
+    """Return simple_skill_content parsed once per session with load_from_content defaults.
+
+    Pydantic models are mutable; use ``model_copy(update=...)`` for variants.
+    """
+    return loader.load_from_content(simple_skill_content)
+
+
+@pytest.fixture
+def fake_skill_dir(request, simple_skill_bytes) -> Path:
+    """Return a simple-skill directory on pyfakefs's in-memory filesystem.
+
+    For loader tests that only need plain files and directories; the real
+    filesystem is unavailable while it is active. Skipped without pyfakefs.
+    """
+    pytest.importorskip("pyfakefs")
+    fs = request.getfixturevalue("fs")
+    skill_dir = Path("/skills/simple-skill")
+    fs.create_file(skill_dir / "SKILL.md", contents=simple_skill_bytes)
+    return skill_dir
+
+
+@pytest.fixture(scope="session")
+def sorted_skills_tree(tmp_path_factory, skill_bytes_builder, write_skill) -> Path:
+    """Return a project root whose .aiskills/skills holds zebra, alpha and mango.
+
+    Built once per session; tests must only read it.
+    """
+    root = tmp_path_factory.mktemp("sorted")
+    for name in ("zebra", "alpha", "mango"):
+        write_skill(root / ".aiskills" / "skills" / name, skill_bytes_builder(name))
+    return root
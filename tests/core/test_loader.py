@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -12,20 +14,22 @@ from aiskills.core.loader import (
     ValidationError,
     get_loader,
 )
-from aiskills.core.parser import ParseError
+from aiskills.core.parser import ParseError, get_parser
 from aiskills.models.skill import Skill
 
+# Error message fragments shared by the load() and validate_structure() tests
+ERR_NOT_EXIST = "does not exist"
+ERR_NOT_DIR = "not a directory"
+ERR_MISSING = "Missing SKILL.md"
+ERR_INVALID = "Invalid SKILL.md"
+
 
 class TestSkillLoader:
     """Tests for SkillLoader class."""
 
-    @pytest.fixture
-    def loader(self):
-        return SkillLoader()
-
     # load() tests
-    def test_load_simple_skill(self, loader, create_skill_file, simple_skill_content):
-        skill_dir = create_skill_file("simple-skill", simple_skill_content)
+    def test_load_simple_skill(self, loader, prebuilt_simple_skill_dir):
+        skill_dir = prebuilt_simple_skill_dir
         skill = loader.load(skill_dir)
 
         assert isinstance(skill, Skill)
@@ -34,33 +38,52 @@ class TestSkillLoader:
         assert skill.source == "project"  # Default
         assert skill.path == str(skill_dir.absolute())
 
-    def test_load_with_source_global(self, loader, create_skill_file, simple_skill_content):
-        skill_dir = create_skill_file("skill", simple_skill_content)
-        skill = loader.load(skill_dir, source="global")
+    def test_load_relative_path(self, loader, prebuilt_simple_skill_dir, monkeypatch):
+        monkeypatch.chdir(prebuilt_simple_skill_dir.parent)
+        skill = loader.load("simple-skill")
+        assert Path(skill.path).is_absolute()
+        assert Path(skill.path).resolve() == prebuilt_simple_skill_dir.resolve()
+
+    def test_load_reuses_parse_until_modified(self, create_skill_file, simple_skill_content):
+        parser = MagicMock(wraps=get_parser())
+        loader = SkillLoader(parser=parser)
+        skill_dir = create_skill_file("simple-skill", simple_skill_content)
+
+        first = loader.load(skill_dir)
+        second = loader.load(skill_dir, source="global")
+        assert parser.parse.call_count == 1
+        assert second.source == "global"
+        assert second.content_hash == first.content_hash
+
+        (skill_dir / "SKILL.md").write_text(simple_skill_content + "\nMore.\n")
+        assert loader.load(skill_dir).content_hash != first.content_hash
+        assert parser.parse.call_count == 2
+
+    def test_load_with_source_global(self, loader, prebuilt_simple_skill_dir):
+        skill = loader.load(prebuilt_simple_skill_dir, source="global")
         assert skill.source == "global"
 
-    def test_load_with_source_cache(self, loader, create_skill_file, simple_skill_content):
-        skill_dir = create_skill_file("skill", simple_skill_content)
-        skill = loader.load(skill_dir, source="cache")
+    def test_load_with_source_cache(self, loader, prebuilt_simple_skill_dir):
+        skill = loader.load(prebuilt_simple_skill_dir, source="cache")
         assert skill.source == "cache"
 
-    def test_load_with_location_types(self, loader, create_skill_file, simple_skill_content):
-        for loc_type in [".aiskills", ".claude", ".agent"]:
-            skill_dir = create_skill_file(f"skill-{loc_type}", simple_skill_content)
-            skill = loader.load(skill_dir, location_type=loc_type)
-            assert skill.location_type == loc_type
+    @pytest.mark.parametrize("loc_type", [".aiskills", ".claude", ".agent"])
+    def test_load_with_location_types(self, loader, create_skill_file, simple_skill_content, loc_type):
+        skill_dir = create_skill_file(f"skill-{loc_type}", simple_skill_content)
+        skill = loader.load(skill_dir, location_type=loc_type)
+        assert skill.location_type == loc_type
 
     def test_load_nonexistent_directory(self, loader, tmp_path):
         with pytest.raises(LoadError) as exc:
             loader.load(tmp_path / "nonexistent")
-        assert "does not exist" in str(exc.value)
+        assert ERR_NOT_EXIST in str(exc.value)
 
     def test_load_file_not_directory(self, loader, tmp_path):
         file_path = tmp_path / "not_a_dir"
         file_path.write_text("content")
         with pytest.raises(LoadError) as exc:
             loader.load(file_path)
-        assert "not a directory" in str(exc.value)
+        assert ERR_NOT_DIR in str(exc.value)
 
     def test_load_missing_skill_file(self, loader, tmp_path):
         skill_dir = tmp_path / "empty-skill"
@@ -73,32 +96,29 @@ class TestSkillLoader:
         skill_dir = tmp_path / "big-skill"
         skill_dir.mkdir()
         skill_file = skill_dir / "SKILL.md"
-        # Create a file larger than MAX_SKILL_SIZE_KB (500KB)
-        content = "---\nname: big\ndescription: big\n---\n" + "x" * (600 * 1024)
-        skill_file.write_text(content)
+        skill_file.write_text("---\nname: big\ndescription: big\n---\n")
+        # Grow it past MAX_SKILL_SIZE_KB (500KB) as a sparse file; the loader
+        # checks the size before reading
+        os.truncate(skill_file, 600 * 1024)
 
         with pytest.raises(LoadError) as exc:
             loader.load(skill_dir)
         assert "too large" in str(exc.value)
 
-    def test_load_invalid_skill_file(self, loader, tmp_path):
-        skill_dir = tmp_path / "invalid-skill"
-        skill_dir.mkdir()
-        skill_file = skill_dir / "SKILL.md"
-        skill_file.write_text("Not valid YAML frontmatter")
+    def test_load_invalid_skill_file(self, loader, fake_skill_dir):
+        (fake_skill_dir / "SKILL.md").write_text("Not valid YAML frontmatter")
 
         with pytest.raises(LoadError) as exc:
-            loader.load(skill_dir)
+            loader.load(fake_skill_dir)
         assert "Missing YAML frontmatter" in str(exc.value)
 
-    def test_load_path_as_string(self, loader, create_skill_file, simple_skill_content):
-        skill_dir = create_skill_file("skill", simple_skill_content)
-        skill = loader.load(str(skill_dir))  # Pass as string
+    def test_load_path_as_string(self, loader, prebuilt_simple_skill_dir):
+        skill = loader.load(str(prebuilt_simple_skill_dir))  # Pass as string
         assert skill.name == "simple-skill"
 
     # load_from_content() tests
-    def test_load_from_content(self, loader, simple_skill_content):
-        skill = loader.load_from_content(simple_skill_content)
+    def test_load_from_content(self, simple_skill):
+        skill = simple_skill
 
         assert skill.name == "simple-skill"
         assert skill.path == "<memory>"
@@ -120,84 +140,68 @@ class TestSkillLoader:
             loader.load_from_content("Invalid content")
 
     # validate_structure() tests
-    def test_validate_structure_valid(self, loader, create_skill_file, simple_skill_content):
-        skill_dir = create_skill_file("valid-skill", simple_skill_content)
-        errors = loader.validate_structure(skill_dir)
+    def test_validate_structure_valid(self, loader, prebuilt_simple_skill_dir):
+        errors = loader.validate_structure(prebuilt_simple_skill_dir)
         assert errors == []
 
     def test_validate_structure_nonexistent(self, loader, tmp_path):
         errors = loader.validate_structure(tmp_path / "nonexistent")
-        assert "does not exist" in errors[0]
+        assert ERR_NOT_EXIST in errors[0]
 
     def test_validate_structure_not_directory(self, loader, tmp_path):
         file_path = tmp_path / "file"
         file_path.write_text("content")
         errors = loader.validate_structure(file_path)
-        assert "not a directory" in errors[0]
+        assert ERR_NOT_DIR in errors[0]
 
     def test_validate_structure_missing_skill_file(self, loader, tmp_path):
         skill_dir = tmp_path / "empty"
         skill_dir.mkdir()
         errors = loader.validate_structure(skill_dir)
-        assert any("Missing SKILL.md" in e for e in errors)
-
-    def test_validate_structure_invalid_skill_file(self, loader, tmp_path):
-        skill_dir = tmp_path / "invalid"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("invalid yaml {{{{")
-        errors = loader.validate_structure(skill_dir)
-        assert any("Invalid SKILL.md" in e for e in errors)
+        assert ERR_MISSING in "\n".join(errors)
 
-    def test_validate_structure_suspicious_files(self, loader, create_skill_file, simple_skill_content):
-        skill_dir = create_skill_file("suspicious", simple_skill_content)
+    def test_validate_structure_invalid_skill_file(self, loader, fake_skill_dir):
+        (fake_skill_dir / "SKILL.md").write_text("invalid yaml {{{{")
+        errors = loader.validate_structure(fake_skill_dir)
+        assert ERR_INVALID in "\n".join(errors)
 
+    def test_validate_structure_suspicious_files(self, loader, fake_skill_dir):
         # Add suspicious files
-        (skill_dir / ".env").write_text("SECRET=abc")
-        (skill_dir / "credentials.json").write_text("{}")
+        (fake_skill_dir / ".env").write_text("SECRET=abc")
+        (fake_skill_dir / "credentials.json").write_text("{}")
 
-        errors = loader.validate_structure(skill_dir)
-        assert any(".env" in e for e in errors)
-        assert any("credentials" in e for e in errors)
+        errors = loader.validate_structure(fake_skill_dir)
+        blob = "\n".join(errors)
+        assert ".env" in blob
+        assert "credentials" in blob
 
-    def test_validate_structure_references_as_file(self, loader, create_skill_file, simple_skill_content):
-        skill_dir = create_skill_file("bad-refs", simple_skill_content)
-        (skill_dir / "references").write_text("not a directory")
+    def test_validate_structure_references_as_file(self, loader, fake_skill_dir):
+        (fake_skill_dir / "references").write_text("not a directory")
 
-        errors = loader.validate_structure(skill_dir)
-        assert any("'references'" in e and "not a directory" in e for e in errors)
+        errors = loader.validate_structure(fake_skill_dir)
+        assert any("'references'" in e and ERR_NOT_DIR in e for e in errors)
 
     # list_skill_dirs() tests
     def test_list_skill_dirs_empty(self, loader, tmp_path):
         dirs = loader.list_skill_dirs(tmp_path)
         assert dirs == []
 
-    def test_list_skill_dirs_single(self, loader, create_skill_file, simple_skill_content, tmp_skills_dir):
-        create_skill_file("skill-a", simple_skill_content)
-        dirs = loader.list_skill_dirs(tmp_skills_dir)
+    def test_list_skill_dirs_single(self, loader, prebuilt_simple_skill_dir):
+        dirs = loader.list_skill_dirs(prebuilt_simple_skill_dir.parent)
         assert len(dirs) == 1
-        assert dirs[0].name == "skill-a"
+        assert dirs[0].name == "simple-skill"
 
-    def test_list_skill_dirs_multiple(self, loader, tmp_skills_dir, simple_skill_content):
-        for name in ["alpha", "beta", "gamma"]:
-            skill_dir = tmp_skills_dir / name
-            skill_dir.mkdir()
-            (skill_dir / "SKILL.md").write_text(simple_skill_content.replace("simple-skill", name))
+    @pytest.fixture
+    def multi_skill_dir(self, sorted_skills_tree):
+        return sorted_skills_tree / ".aiskills" / "skills"
 
-        dirs = loader.list_skill_dirs(tmp_skills_dir)
+    def test_list_skill_dirs_multiple(self, loader, multi_skill_dir):
+        dirs = loader.list_skill_dirs(multi_skill_dir)
         assert len(dirs) == 3
-        names = [d.name for d in dirs]
-        assert "alpha" in names
-        assert "beta" in names
-        assert "gamma" in names
+        assert {d.name for d in dirs} == {"zebra", "alpha", "mango"}
 
-    def test_list_skill_dirs_returns_sorted(self, loader, tmp_skills_dir, simple_skill_content):
-        for name in ["zebra", "alpha", "mango"]:
-            skill_dir = tmp_skills_dir / name
-            skill_dir.mkdir()
-            (skill_dir / "SKILL.md").write_text(simple_skill_content)
-
-        dirs = loader.list_skill_dirs(tmp_skills_dir)
-        names = [d.name for d in dirs]
+    def test_list_skill_dirs_returns_sorted(self, loader, multi_skill_dir):
+        names = [d.name for d in loader.list_skill_dirs(multi_skill_dir)]
         assert names == sorted(names)
 
     def test_list_skill_dirs_ignores_non_skills(self, loader, tmp_skills_dir, simple_skill_content):
@@ -227,43 +231,45 @@ class TestSkillLoader:
         assert dirs == []
 
 
+@pytest.mark.xdist_group("singletons")
 class TestGetLoader:
     """Tests for get_loader singleton."""
 
-    def test_returns_loader_instance(self):
+    def test_returns_same_instance(self):
         loader = get_loader()
         assert isinstance(loader, SkillLoader)
-
-    def test_returns_same_instance(self):
-        loader1 = get_loader()
-        loader2 = get_loader()
-        assert loader1 is loader2
+        assert get_loader() is loader
 
 
 class TestLoadError:
     """Tests for LoadError exception."""
 
-    def test_error_message(self):
-        error = LoadError("File not found")
-        assert str(error) == "File not found"
-        assert error.path is None
-
-    def test_error_with_path(self):
-        error = LoadError("Invalid content", path="/path/to/skill")
-        assert "/path/to/skill" in str(error)
-        assert "Invalid content" in str(error)
-        assert error.path == "/path/to/skill"
+    @pytest.mark.parametrize(
+        "message,path,expected",
+        [
+            ("File not found", None, "File not found"),
+            ("Invalid content", "/path/to/skill", "/path/to/skill: Invalid content"),
+        ],
+        ids=["message", "with_path"],
+    )
+    def test_error_message(self, message, path, expected):
+        error = LoadError(message, path=path)
+        assert str(error) == expected
+        assert error.path == path
 
 
 class TestValidationError:
     """Tests for ValidationError exception."""
 
-    def test_error_message(self):
-        error = ValidationError("Validation failed")
-        assert str(error) == "Validation failed"
-        assert error.errors == ["Validation failed"]
-
-    def test_error_with_multiple_errors(self):
-        errors = ["Error 1", "Error 2", "Error 3"]
-        error = ValidationError("Multiple errors", errors=errors)
-        assert error.errors == errors
+    @pytest.mark.parametrize(
+        "message,errors,expected_errors",
+        [
+            ("Validation failed", None, ["Validation failed"]),
+            ("Multiple errors", ["Error 1", "Error 2", "Error 3"], ["Error 1", "Error 2", "Error 3"]),
+        ],
+        ids=["message", "multiple_errors"],
+    )
+    def test_error_message(self, message, errors, expected_errors):
+        error = ValidationError(message, errors=errors)
+        assert str(error) == message
+        assert error.errors == expected_errors
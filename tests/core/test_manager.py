@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
@@ -10,40 +11,39 @@ import pytest
 from aiskills.config import AppConfig, EmbeddingConfig, StorageConfig, VectorStoreConfig
 from aiskills.core.loader import LoadError
 from aiskills.core.manager import SkillManager, get_manager
-from aiskills.models.skill import Skill, SkillIndex
+from aiskills.models.skill import SkillIndex
 
 
 class TestSkillManager:
     """Tests for SkillManager class."""
 
     @pytest.fixture
-    def manager(self, mock_config, tmp_path):
-        """Create a manager with test configuration."""
+    def manager(self, mock_config, tmp_path, loader, renderer):
+        """Create a manager with test configuration.
+
+        Only the path-bound subsystems are built per test; the loader and
+        renderer are shared session fixtures.
+        """
         from aiskills.storage.paths import PathResolver
         from aiskills.storage.cache import CacheManager
-        from aiskills.core.loader import SkillLoader
-        from aiskills.core.renderer import SkillRenderer
 
         paths = PathResolver(config=mock_config, cwd=tmp_path)
         return SkillManager(
             config=mock_config,
             paths=paths,
-            loader=SkillLoader(),
+            loader=loader,
             cache=CacheManager(paths),  # CacheManager expects PathResolver, not AppConfig
-            renderer=SkillRenderer(),
+            renderer=renderer,
         )
 
     @pytest.fixture
-    def skill_in_project(self, tmp_path, simple_skill_content):
+    def skill_in_project(self, tmp_path, simple_skill_bytes, write_skill):
         """Create a skill in the project directory.
 
         Note: Directory name must match skill name in SKILL.md for lookup to work.
         """
-        # simple_skill_content has name: simple-skill, so directory must match
-        skill_dir = tmp_path / ".aiskills" / "skills" / "simple-skill"
-        skill_dir.mkdir(parents=True)
-        (skill_dir / "SKILL.md").write_text(simple_skill_content)
-        return skill_dir
+        # simple_skill_bytes has name: simple-skill, so directory must match
+        return write_skill(tmp_path / ".aiskills" / "skills" / "simple-skill", simple_skill_bytes)
 
     # ─────────────────────────────────────────────────────────────────
     # get() tests
@@ -60,11 +60,12 @@ class TestSkillManager:
         assert skill.name == "simple-skill"
         assert skill.source == "project"
 
-    def test_get_skill_from_global(self, manager, tmp_global_dir, simple_skill_content, tmp_path_factory):
+    def test_get_skill_from_global(self, loader, simple_skill_content, tmp_path):
         # Use separate directories to avoid project/global overlap
-        separate_global = tmp_path_factory.mktemp("global")
+        separate_global = tmp_path / "global"
         (separate_global / "skills").mkdir(parents=True)
-        cwd_path = tmp_path_factory.mktemp("project")
+        cwd_path = tmp_path / "project"
+        cwd_path.mkdir()
 
         config = AppConfig(
             storage=StorageConfig(global_dir=separate_global),
@@ -73,10 +74,9 @@ class TestSkillManager:
         )
 
         from aiskills.storage.paths import PathResolver
-        from aiskills.core.loader import SkillLoader
 
         paths = PathResolver(config=config, cwd=cwd_path)
-        test_manager = SkillManager(config=config, paths=paths, loader=SkillLoader())
+        test_manager = SkillManager(config=config, paths=paths, loader=loader)
 
         # Create skill in global - directory name must match skill name in SKILL.md
         skill_dir = separate_global / "skills" / "simple-skill"
@@ -142,89 +142,95 @@ class TestSkillManager:
         assert len(indices) >= 1
         assert all(isinstance(idx, SkillIndex) for idx in indices)
 
-    def test_list_all_sorted(self, manager, tmp_path, simple_skill_content):
-        # Create multiple skills
-        for name in ["zebra", "alpha", "mango"]:
-            skill_dir = tmp_path / ".aiskills" / "skills" / name
-            skill_dir.mkdir(parents=True)
-            content = simple_skill_content.replace("simple-skill", name)
-            (skill_dir / "SKILL.md").write_text(content)
+    def test_list_all_sorted(self, mock_config, loader, sorted_skills_tree):
+        from aiskills.storage.paths import PathResolver
+
+        # Project skills come from the shared read-only tree
+        paths = PathResolver(config=mock_config, cwd=sorted_skills_tree)
+        manager = SkillManager(config=mock_config, paths=paths, loader=loader)
 
         indices = manager.list_all()
         names = [idx.name for idx in indices]
-        assert names == sorted(names)
+        assert names == ["alpha", "mango", "zebra"]
 
     # ─────────────────────────────────────────────────────────────────
     # install_from_path() tests
     # ─────────────────────────────────────────────────────────────────
 
-    def test_install_from_path_new(self, manager, tmp_path, simple_skill_content):
-        # Create source skill
-        source_dir = tmp_path / "source-skill"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text(simple_skill_content)
+    @pytest.fixture
+    def source_skill(self, tmp_path, simple_skill_bytes, write_skill):
+        """Create a skill directory to install from."""
+        return write_skill(tmp_path / "source-skill", simple_skill_bytes)
 
-        skill, status = manager.install_from_path(source_dir)
-        assert status == "installed"
-        assert skill.name == "simple-skill"
-        assert skill.source == "project"
+    @pytest.fixture
+    def stub_copytree(self, monkeypatch):
+        """Replace the installer's recursive copy with a SKILL.md-only copy.
 
-    def test_install_from_path_already_exists(self, manager, tmp_path, simple_skill_content):
-        # Create source skill
-        source_dir = tmp_path / "source-skill"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text(simple_skill_content)
+        Status tests only depend on SKILL.md; test_install_from_path_copies_tree
+        covers the real copy.
+        """
 
-        # Install first time
-        skill1, status1 = manager.install_from_path(source_dir)
-        assert status1 == "installed"
+        def fake_copytree(src, dst, dirs_exist_ok=False):
+            os.makedirs(dst, exist_ok=dirs_exist_ok)
+            shutil.copyfile(Path(src) / "SKILL.md", Path(dst) / "SKILL.md")
+            return dst
+
+        monkeypatch.setattr("aiskills.core.manager.shutil.copytree", fake_copytree)
 
-        # Install again with same content
-        skill2, status2 = manager.install_from_path(source_dir)
-        assert status2 == "unchanged"
+    def test_install_from_path_copies_tree(self, manager, source_skill):
+        (source_skill / "references").mkdir()
+        (source_skill / "references" / "guide.md").write_text("# Guide")
 
-    def test_install_from_path_updated(self, manager, tmp_path, simple_skill_content):
-        # Create source skill
-        source_dir = tmp_path / "source-skill"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text(simple_skill_content)
+        skill, status = manager.install_from_path(source_skill)
+        assert status == "installed"
+        assert (Path(skill.path) / "references" / "guide.md").read_text() == "# Guide"
+
+    @pytest.mark.parametrize(
+        "preinstall,kwargs,expected_status,expected_source",
+        [
+            (False, {}, "installed", "project"),
+            (True, {}, "unchanged", "project"),
+            (False, {"global_install": True}, "installed", "global"),
+        ],
+        ids=["new", "already_exists", "global"],
+    )
+    @pytest.mark.usefixtures("stub_copytree")
+    def test_install_from_path_status(
+        self, manager, source_skill, preinstall, kwargs, expected_status, expected_source
+    ):
+        if preinstall:
+            manager.install_from_path(source_skill, **kwargs)
+
+        skill, status = manager.install_from_path(source_skill, **kwargs)
+        assert status == expected_status
+        assert skill.name == "simple-skill"
+        assert skill.source == expected_source
 
+    @pytest.mark.usefixtures("stub_copytree")
+    def test_install_from_path_updated(
+        self, manager, source_skill, skill_bytes_builder, write_skill
+    ):
         # Install first time
-        skill1, status1 = manager.install_from_path(source_dir)
+        skill1, status1 = manager.install_from_path(source_skill)
         assert status1 == "installed"
 
         # Update content
-        updated_content = simple_skill_content.replace("unit tests", "updated content")
-        (source_dir / "SKILL.md").write_text(updated_content)
+        write_skill(source_skill, skill_bytes_builder("simple-skill", b"\nUpdated content.\n"))
 
         # Install again
-        skill2, status2 = manager.install_from_path(source_dir)
+        skill2, status2 = manager.install_from_path(source_skill)
         assert status2 == "updated"
 
-    def test_install_from_path_force(self, manager, tmp_path, simple_skill_content):
-        # Create source skill
-        source_dir = tmp_path / "source-skill"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text(simple_skill_content)
-
+    @pytest.mark.usefixtures("stub_copytree")
+    def test_install_from_path_force(self, manager, source_skill):
         # Install first time
-        skill1, status1 = manager.install_from_path(source_dir)
+        skill1, status1 = manager.install_from_path(source_skill)
         assert status1 == "installed"
 
         # Force reinstall (should be updated even with same content)
-        skill2, status2 = manager.install_from_path(source_dir, force=True)
+        skill2, status2 = manager.install_from_path(source_skill, force=True)
         assert status2 == "updated"
 
-    def test_install_from_path_global(self, manager, tmp_path, simple_skill_content):
-        # Create source skill
-        source_dir = tmp_path / "source-skill"
-        source_dir.mkdir()
-        (source_dir / "SKILL.md").write_text(simple_skill_content)
-
-        skill, status = manager.install_from_path(source_dir, global_install=True)
-        assert status == "installed"
-        assert skill.source == "global"
-
     # ─────────────────────────────────────────────────────────────────
     # remove() tests
     # ─────────────────────────────────────────────────────────────────
@@ -295,14 +301,11 @@ class TestSkillManager:
         assert variables["language"]["default"] == "python"
 
 
+@pytest.mark.xdist_group("singletons")
 class TestGetManager:
     """Tests for get_manager singleton."""
 
-    def test_returns_manager_instance(self):
+    def test_returns_same_instance(self):
         manager = get_manager()
         assert isinstance(manager, SkillManager)
-
-    def test_returns_same_instance(self):
-        m1 = get_manager()
-        m2 = get_manager()
-        assert m1 is m2
+        assert get_manager() is manager
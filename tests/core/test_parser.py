@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
+import yaml
 
 from aiskills.core.parser import ParseError, ParseResult, YAMLParser, get_parser
 
@@ -24,6 +27,60 @@ class TestYAMLParser:
         assert "test" in result.manifest.tags
         assert "Simple Skill" in result.content
 
+    def test_uses_libyaml_loader_when_available(self, parser):
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert issubclass(parser._loader, expected)
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            "name: x\ntags: [a, b]\nvariables:\n  n: {type: integer, default: 3}",
+            "a: 2020-01-01\nb: null\nc: 1.5\nd: yes\ne: !!str 1",
+            "base: &b {a: 1}\nd:\n  <<: *b\n  c: 2",
+            "x: &s [1]\ny: *s",
+            "!!set {a, b}",
+            "",
+        ],
+    )
+    def test_frontmatter_loader_matches_safe_loader(self, parser, document):
+        assert yaml.load(document, Loader=parser._loader) == yaml.safe_load(document)
+
+    def test_frontmatter_loader_recursive_alias(self, parser):
+        data = yaml.load("a: &x [1, *x]", Loader=parser._loader)
+        assert data["a"][1] is data["a"]
+
+    def test_frontmatter_loader_rejects_unsafe_tags(self, parser):
+        with pytest.raises(yaml.YAMLError):
+            yaml.load("!!python/object/apply:os.getcwd []", Loader=parser._loader)
+
+    def test_pure_python_loader_equivalent(self, parser, simple_skill_content):
+        fallback = YAMLParser()
+        fallback._loader = yaml.SafeLoader
+        assert fallback.parse(simple_skill_content) == parser.parse(simple_skill_content)
+
+    def test_parse_memoizes_identical_content(self, parser, simple_skill_content):
+        first = parser.parse(simple_skill_content)
+        assert parser.parse(simple_skill_content) is first
+        assert parser.parse(simple_skill_content + "\n") is not first
+
+    def test_parse_skips_cache_for_large_content(self, parser, simple_skill_content):
+        content = simple_skill_content + "x" * parser.PARSE_CACHE_MAX_CONTENT
+        assert parser.parse(content) is not parser.parse(content)
+        assert parser._cache == {}
+
+    def test_parse_cache_evicts_oldest(self, parser, monkeypatch):
+        monkeypatch.setattr(parser, "PARSE_CACHE_SIZE", 2)
+        contents = [f"---\nname: s{i}\ndescription: d\n---\n" for i in range(3)]
+        for content in contents:
+            parser.parse(content)
+        assert list(parser._cache) == contents[1:]
+
+    def test_parse_result_is_frozen(self, parser, simple_skill_content):
+        result = parser.parse(simple_skill_content)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.content = "changed"
+
     def test_parse_returns_raw_content(self, parser, simple_skill_content):
         result = parser.parse(simple_skill_content)
         assert result.raw_content == simple_skill_content
@@ -59,6 +116,27 @@ description: test
             parser.parse(content)
         assert "Unclosed frontmatter" in str(exc.value)
 
+    def test_parse_leading_whitespace_before_frontmatter(self, parser):
+        result = parser.parse("\n  \n---\nname: test\ndescription: test\n---\n\nBody\n\n")
+        assert result.manifest.name == "test"
+        assert result.content == "Body"
+
+    def test_parse_unclosed_after_leading_newline(self, parser):
+        with pytest.raises(ParseError, match="Unclosed frontmatter"):
+            parser.parse("\n---\nname: test\n")
+
+    def test_parse_crlf_frontmatter(self, parser):
+        content = "---\r\nname: test\r\ndescription: test\r\n---\r\nBody\r\n"
+        result = parser.parse(content)
+        assert result.manifest.name == "test"
+        assert result.content == "Body"
+
+    def test_parse_malformed_opening_delimiter(self, parser):
+        content = "--- name: test\n---\nBody"
+        with pytest.raises(ParseError) as exc:
+            parser.parse(content)
+        assert "Missing YAML frontmatter" in str(exc.value)
+
     def test_parse_invalid_yaml(self, parser):
         content = """\
 ---
@@ -271,6 +349,13 @@ variables:
         assert vars["count"].default == 5
         assert vars["enabled"].default is True
 
+    def test_parse_interns_repeated_strings(self, parser):
+        template = "---\nname: {}\ndescription: d\nversion: 2.0.0\ntags: [python]\n---\n"
+        first = parser.parse(template.format("one")).manifest
+        second = parser.parse(template.format("two")).manifest
+        assert first.version is second.version
+        assert first.tags[0] is second.tags[0]
+
     # Triggers parsing
     def test_parse_triggers_string_list(self, parser):
         content = """\
@@ -436,6 +521,11 @@ class TestParseError:
         assert "Invalid syntax" in str(error)
         assert error.line == 42
 
+    def test_error_keeps_raw_message(self):
+        error = ParseError("Invalid syntax", line=3)
+        assert error.message == "Invalid syntax"
+        assert error.args == ("Invalid syntax",)
+
     def test_error_no_line_number(self):
         error = ParseError("General error")
         assert error.line is None
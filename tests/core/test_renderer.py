@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import io
+from unittest.mock import MagicMock
+
 import pytest
 
 from aiskills.core.renderer import RenderError, SkillRenderer, get_renderer
@@ -212,6 +215,111 @@ Max depth: {{ max_depth }}
             renderer.render(skill)
         assert "syntax error" in str(exc.value).lower()
 
+    def test_render_reuses_compiled_template(self, renderer, skill_with_vars):
+        first = renderer.render(skill_with_vars, VariableContext(variables={"language": "rust"}))
+        template = renderer._template_cache[skill_with_vars.content]
+        second = renderer.render(skill_with_vars)
+        assert renderer._template_cache[skill_with_vars.content] is template
+        assert len(renderer._template_cache) == 1
+        assert "rust" in first
+        assert "python" in second
+
+    def test_template_cache_evicts_oldest(self, renderer, monkeypatch):
+        monkeypatch.setattr(renderer, "TEMPLATE_CACHE_SIZE", 2)
+        for source in ("a", "b", "c"):
+            renderer._get_template(source)
+        assert list(renderer._template_cache) == ["b", "c"]
+
+    @pytest.mark.parametrize(
+        "content",
+        ["# Title\n\nBody.\n", "Body.\n\n", "No newline", "Braces { } %}", "a\r\nb\n"],
+    )
+    def test_render_plain_content_matches_jinja(self, renderer, tmp_path, content):
+        skill = Skill(
+            manifest=SkillManifest(name="test", description="test"),
+            content=content,
+            raw_content=content,
+            path=str(tmp_path),
+        )
+        assert renderer.render(skill) == renderer.env.from_string(content).render()
+
+    def test_render_plain_content_skips_jinja(self, renderer, sample_skill):
+        renderer.render(sample_skill)
+        assert renderer._template_cache == {}
+
+    def test_render_plain_content_still_validates_strict(self, renderer, skill_with_vars):
+        plain = skill_with_vars.model_copy(update={"content": "No template here."})
+        with pytest.raises(RenderError):
+            renderer.render(plain, strict=True)
+
+    def test_build_variables_priority(self, renderer):
+        definitions = {"a": SkillVariable(default="def"), "b": SkillVariable(default="def")}
+        context = VariableContext(
+            variables={"b": "var", "c": "var"},
+            environment={"c": "env", "d": "env"},
+            project_info={"d": "proj", "e": "proj"},
+        )
+        assert renderer._build_variables(definitions, context) == {
+            "a": "def",
+            "b": "var",
+            "c": "var",
+            "d": "env",
+            "e": "proj",
+        }
+
+    def test_build_variables_reuses_defaults(self, renderer, skill_with_vars):
+        definitions = skill_with_vars.manifest.variables
+        first = renderer._build_variables(definitions, VariableContext())
+        assert renderer._build_variables(definitions, VariableContext()) is first
+        assert first == {name: var.default for name, var in definitions.items()}
+
+    def test_build_variables_skips_unreferenced_layers(self, renderer):
+        definitions = {"a": SkillVariable(default="def")}
+        context = VariableContext(environment={"HOME": "/root"}, project_info={"lang": "py"})
+        variables = renderer._build_variables(definitions, context, frozenset({"a", "lang"}))
+        assert variables == {"a": "def", "lang": "py"}
+
+    def test_render_uses_context_layers_in_expressions(self, renderer, tmp_path):
+        skill = Skill(
+            manifest=SkillManifest(name="test", description="test"),
+            content="{{ cfg.mode | upper }} {{ other ~ '!' }}",
+            raw_content="test",
+            path=str(tmp_path),
+        )
+        context = VariableContext(
+            environment={"other": "env", "unused": "x"},
+            project_info={"cfg": {"mode": "fast"}},
+        )
+        assert renderer.render(skill, context) == "FAST env!"
+        assert renderer._referenced_cache[skill.content] == {"cfg", "other"}
+
+    def test_render_to_streams_same_output(self, renderer, skill_with_vars):
+        context = VariableContext(variables={"language": "rust"})
+        buf = io.StringIO()
+        renderer.render_to(skill_with_vars, buf, context)
+        assert buf.getvalue() == renderer.render(skill_with_vars, context)
+
+    def test_render_to_wraps_writer_errors(self, renderer, skill_with_vars):
+        closed = io.StringIO()
+        closed.close()
+        with pytest.raises(RenderError, match="Render error"):
+            renderer.render_to(skill_with_vars, closed)
+
+    def test_bytecode_cache_survives_new_renderer(self, skill_with_vars, tmp_path):
+        cache_dir = tmp_path / "bytecode"
+        expected = SkillRenderer(bytecode_cache_dir=cache_dir).render(skill_with_vars)
+        assert len(list(cache_dir.iterdir())) == 1
+
+        warm = SkillRenderer(bytecode_cache_dir=cache_dir)
+        warm.env.compile = MagicMock(side_effect=AssertionError("recompiled"))
+        assert warm.render(skill_with_vars) == expected
+
+    def test_bytecode_cache_skips_anonymous_templates(self, tmp_path):
+        cache_dir = tmp_path / "bytecode"
+        renderer = SkillRenderer(bytecode_cache_dir=cache_dir)
+        assert renderer._get_template("{{ x }}").render(x=1) == "1"
+        assert list(cache_dir.iterdir()) == []
+
     # validate_variables() tests
     def test_validate_variables_all_valid(self, renderer, skill_with_vars):
         provided = {
@@ -269,6 +377,13 @@ Max depth: {{ max_depth }}
         vars = renderer.extract_variables(content)
         assert "items" in vars
 
+    def test_extract_variables_mixed_template(self, renderer):
+        content = (
+            "{% if show %}{{ title | upper }}{% endif %}\n"
+            "{% for row in rows %}{{ row.name }}{% endfor %}{{ footer }}"
+        )
+        assert renderer.extract_variables(content) == ["footer", "rows", "show", "title"]
+
     def test_extract_variables_empty(self, renderer):
         content = "No variables here."
         vars = renderer.extract_variables(content)
@@ -335,6 +450,16 @@ class TestSilentUndefined:
         undef = SilentUndefined()
         assert len(undef) == 0
 
+    def test_undefined_is_shared(self):
+        from aiskills.core.renderer import SilentUndefined
+
+        assert SilentUndefined() is SilentUndefined(name="missing", obj=object())
+
+    def test_undefined_in_template(self):
+        renderer = SkillRenderer()
+        template = renderer.env.from_string("[{{ a }}{{ b.c }}{% for x in d %}x{% endfor %}]")
+        assert template.render() == "[]"
+
 
 class TestGetRenderer:
     """Tests for get_renderer singleton."""
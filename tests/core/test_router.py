@@ -43,8 +43,16 @@ class TestSkillRouter:
     def test_init(self):
         """Test router initialization."""
         router = SkillRouter()
-        assert router._manager is None
-        assert router._registry is None
+        assert "manager" not in vars(router)
+        assert "registry" not in vars(router)
+
+    def test_dependencies_resolved_once(self, monkeypatch):
+        """Manager is fetched on first access and then cached on the instance."""
+        get_manager = MagicMock()
+        monkeypatch.setattr("aiskills.core.manager.get_manager", get_manager)
+        router = SkillRouter()
+        assert router.manager is router.manager
+        get_manager.assert_called_once_with()
 
     def test_use_no_results(self):
         """Test use() when no skills match."""
@@ -52,7 +60,7 @@ class TestSkillRouter:
         
         mock_registry = MagicMock()
         mock_registry.search.return_value = []
-        router._registry = mock_registry
+        router.registry = mock_registry
         
         result = router.use("nonexistent skill query")
         
@@ -70,7 +78,7 @@ class TestSkillRouter:
 
         mock_registry = MagicMock()
         mock_registry.search.return_value = [(mock_skill_idx, 0.89)]
-        router._registry = mock_registry
+        router.registry = mock_registry
 
         mock_skill = MagicMock()
         mock_skill.list_resources.return_value = []
@@ -79,7 +87,7 @@ class TestSkillRouter:
         mock_manager = MagicMock()
         mock_manager.read.return_value = "# Debug Python\n\nStep 1..."
         mock_manager.get.return_value = mock_skill
-        router._manager = mock_manager
+        router.manager = mock_manager
 
         # Mock scope matcher
         from aiskills.core.scoping import ScopeMatchResult
@@ -88,7 +96,7 @@ class TestSkillRouter:
             (mock_skill_idx, ScopeMatchResult(matches=True))
         ]
         mock_scope_matcher.sort_by_priority.return_value = [(mock_skill_idx, 0.89)]
-        router._scope_matcher = mock_scope_matcher
+        router.scope_matcher = mock_scope_matcher
 
         result = router.use("help me debug python")
 
@@ -106,7 +114,7 @@ class TestSkillRouter:
 
         mock_registry = MagicMock()
         mock_registry.search.return_value = [(mock_skill_idx, 0.95)]
-        router._registry = mock_registry
+        router.registry = mock_registry
 
         mock_skill = MagicMock()
         mock_skill.list_resources.return_value = []
@@ -115,7 +123,7 @@ class TestSkillRouter:
         mock_manager = MagicMock()
         mock_manager.read.return_value = "Content for python"
         mock_manager.get.return_value = mock_skill
-        router._manager = mock_manager
+        router.manager = mock_manager
 
         # Mock scope matcher to pass through
         from aiskills.core.scoping import ScopeMatchResult
@@ -124,7 +132,7 @@ class TestSkillRouter:
             (mock_skill_idx, ScopeMatchResult(matches=True))
         ]
         mock_scope_matcher.sort_by_priority.return_value = [(mock_skill_idx, 0.95)]
-        router._scope_matcher = mock_scope_matcher
+        router.scope_matcher = mock_scope_matcher
 
         result = router.use("need help", variables={"lang": "python"})
 
@@ -146,17 +154,40 @@ class TestSkillRouter:
         # Semantic search raises "not installed" error
         mock_registry.search.side_effect = Exception("embeddings not installed")
         mock_registry.search_text.return_value = [mock_skill_idx]
-        router._registry = mock_registry
+        router.registry = mock_registry
         
         mock_manager = MagicMock()
         mock_manager.read.return_value = "Fallback content"
-        router._manager = mock_manager
+        router.manager = mock_manager
         
         result = router.use("some query")
         
         mock_registry.search_text.assert_called_once()
         assert result.skill_name == "fallback-skill"
 
+    def test_use_caches_fallback_decision(self):
+        """Test use() stops retrying semantic search once it is unavailable."""
+        router = SkillRouter()
+
+        mock_skill_idx = MagicMock()
+        mock_skill_idx.name = "fallback-skill"
+
+        mock_registry = MagicMock()
+        mock_registry.search.side_effect = Exception("embeddings not installed")
+        mock_registry.search_text.return_value = [mock_skill_idx]
+        router.registry = mock_registry
+
+        mock_manager = MagicMock()
+        mock_manager.read.return_value = "Fallback content"
+        router.manager = mock_manager
+
+        router.use("first query")
+        result = router.use("second query")
+
+        mock_registry.search.assert_called_once()
+        assert mock_registry.search_text.call_count == 2
+        assert result.skill_name == "fallback-skill"
+
     def test_use_multiple_results(self):
         """Test use() with limit > 1."""
         router = SkillRouter()
@@ -171,7 +202,7 @@ class TestSkillRouter:
             (mock_skill1, 0.9),
             (mock_skill2, 0.8),
         ]
-        router._registry = mock_registry
+        router.registry = mock_registry
 
         mock_skill_obj1 = MagicMock()
         mock_skill_obj1.list_resources.return_value = []
@@ -183,7 +214,7 @@ class TestSkillRouter:
         mock_manager = MagicMock()
         mock_manager.read.side_effect = ["Content 1", "Content 2"]
         mock_manager.get.side_effect = [mock_skill_obj1, mock_skill_obj2]
-        router._manager = mock_manager
+        router.manager = mock_manager
 
         # Mock scope matcher
         from aiskills.core.scoping import ScopeMatchResult
@@ -196,7 +227,7 @@ class TestSkillRouter:
             (mock_skill1, 0.9),
             (mock_skill2, 0.8),
         ]
-        router._scope_matcher = mock_scope_matcher
+        router.scope_matcher = mock_scope_matcher
 
         results = router.use("query", limit=2)
 
@@ -214,7 +245,7 @@ class TestSkillRouter:
         mock_manager = MagicMock()
         mock_manager.read.return_value = "# Skill Content"
         mock_manager.get.return_value = mock_skill
-        router._manager = mock_manager
+        router.manager = mock_manager
         
         result = router.use_by_name("my-skill")
         
@@ -228,7 +259,7 @@ class TestSkillRouter:
         
         mock_manager = MagicMock()
         mock_manager.read.side_effect = Exception("Skill not found")
-        router._manager = mock_manager
+        router.manager = mock_manager
         
         result = router.use_by_name("nonexistent")
         
@@ -250,7 +281,7 @@ class TestSkillRouter:
             (mock_skill1, 0.9),
             (mock_skill2, 0.8),
         ]
-        router._registry = mock_registry
+        router.registry = mock_registry
 
         mock_skill_obj = MagicMock()
         mock_skill_obj.list_resources.return_value = []
@@ -260,7 +291,7 @@ class TestSkillRouter:
         # First skill fails to load, second works
         mock_manager.get.side_effect = [MagicMock(), mock_skill_obj]
         mock_manager.read.side_effect = [Exception("Load error"), "Working content"]
-        router._manager = mock_manager
+        router.manager = mock_manager
 
         # Mock scope matcher
         from aiskills.core.scoping import ScopeMatchResult
@@ -273,7 +304,7 @@ class TestSkillRouter:
             (mock_skill1, 0.9),
             (mock_skill2, 0.8),
         ]
-        router._scope_matcher = mock_scope_matcher
+        router.scope_matcher = mock_scope_matcher
 
         # Use limit=2 to process both skills (first fails, second works)
         results = router.use("query", limit=2)
@@ -291,9 +322,8 @@ class TestGetRouter:
     def test_returns_router_instance(self):
         """Test get_router returns a SkillRouter."""
         # Reset singleton for test
-        import aiskills.core.router as router_module
-        router_module._router = None
-        
+        get_router.cache_clear()
+
         router = get_router()
         assert isinstance(router, SkillRouter)
 
@@ -302,3 +332,12 @@ class TestGetRouter:
         router1 = get_router()
         router2 = get_router()
         assert router1 is router2
+
+    def test_module_attribute_is_singleton(self):
+        """Test the module-level router is the get_router instance."""
+        get_router.cache_clear()
+
+        from aiskills.core.router import router
+
+        assert isinstance(router, SkillRouter)
+        assert get_router() is router
@@ -591,7 +591,7 @@ def multi_llm_setup(tmp_path, multi_llm_skill_content, simple_skill_content, ski
 
     # Reset singletons
     manager_module._manager = None
-    paths_module._resolver = None
+    paths_module.get_path_resolver.cache_clear()
     if hasattr(registry_module, '_registry'):
         registry_module._registry = None
 
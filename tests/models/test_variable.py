@@ -146,6 +146,25 @@ class TestSkillVariable:
         assert var.validate_value(2)[0] is True
         assert var.validate_value(5)[0] is False
 
+    def test_validate_enum_unhashable_values(self):
+        var = SkillVariable(type="array", enum=[[1], [2]])
+        assert var.validate_value([2])[0] is True
+        assert var.validate_value([3])[0] is False
+
+    def test_validate_enum_lookup_follows_replaced_enum(self):
+        var = SkillVariable(type="string", enum=["python"])
+        assert var.validate_value("rust")[0] is False
+        copy = var.model_copy(update={"enum": ["rust"]})
+        assert copy.validate_value("rust")[0] is True
+
+    def test_validate_enum_lookup_not_part_of_model(self):
+        var = SkillVariable(type="string", enum=["python"])
+        var.validate_value("python")
+        assert var == SkillVariable(type="string", enum=["python"])
+        assert "_enum_lookup" not in var.model_dump()
+        assert "_enum_lookup" not in vars(var)
+        assert var.model_copy() == var
+
     # Range validation
     def test_validate_integer_min(self):
         var = SkillVariable(type="integer", min=0)
@@ -0,0 +1,112 @@
+"""Tests for the registry source."""
+
+from __future__ import annotations
+
+import json
+import sys
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from aiskills.sources.base import FetchError
+from aiskills.sources.registry import RegistryClient, RegistrySource
+from aiskills.utils.version import SemanticVersion
+
+
+class TestRegistryClient:
+    """Tests for RegistryClient."""
+
+    @pytest.fixture
+    def client(self):
+        client = RegistryClient(base_url="https://registry.test")
+        client.get_versions = MagicMock(
+            return_value=["1.0.0", "not-a-version", "2.1.0", "2.0.0-beta.1", "v1.5.0"]
+        )
+        return client
+
+    def test_get_parsed_versions_sorted_desc(self, client):
+        parsed = client.get_parsed_versions("demo")
+        assert [v for _, v in parsed] == ["2.1.0", "2.0.0-beta.1", "v1.5.0", "1.0.0"]
+        assert parsed[0][0] == SemanticVersion(2, 1, 0)
+
+    def test_get_parsed_versions_memoized(self, client):
+        first = client.get_parsed_versions("demo")
+        second = client.get_parsed_versions("demo")
+        assert first is second
+        client.get_versions.assert_called_once_with("demo")
+
+
+class TestRegistryClientSearch:
+    """Tests for RegistryClient search methods."""
+
+    PAYLOAD = {
+        "skills": [
+            {"name": f"skill-{i}", "slug": f"skill-{i}", "downloads": i, "tags": ["a"]}
+            for i in range(5)
+        ],
+        "total": 42,
+        "page": 1,
+        "per_page": 5,
+    }
+
+    @pytest.fixture
+    def client(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/skills/search"
+            return httpx.Response(200, content=json.dumps(self.PAYLOAD).encode())
+
+        client = RegistryClient(base_url="https://registry.test")
+        client._http_client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_search(self, client):
+        result = client.search("skill", limit=5)
+        assert [s.slug for s in result.skills] == [f"skill-{i}" for i in range(5)]
+        assert result.total == 42
+
+    def test_search_iter(self, client):
+        pytest.importorskip("ijson")
+        skills = list(client.search_iter("skill", limit=5))
+        assert [s.slug for s in skills] == [f"skill-{i}" for i in range(5)]
+        assert skills[3].downloads == 3
+
+    def test_search_iter_without_ijson(self, client, monkeypatch):
+        monkeypatch.setitem(sys.modules, "ijson", None)
+        skills = list(client.search_iter("skill", limit=3))
+        assert [s.slug for s in skills] == ["skill-0", "skill-1", "skill-2"]
+
+    def test_search_iter_respects_limit(self, client):
+        assert len(list(client.search_iter("skill", limit=2))) == 2
+
+    def test_search_iter_http_error(self):
+        client = RegistryClient(base_url="https://registry.test")
+        client._http_client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500))
+        )
+        with pytest.raises(FetchError):
+            list(client.search_iter("skill"))
+
+
+class TestRegistrySource:
+    """Tests for RegistrySource."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        client = RegistryClient(base_url="https://registry.test")
+        client.get_versions = MagicMock(return_value=["1.0.0", "1.4.2", "2.0.0", "1.4.10"])
+        client.download = MagicMock(return_value=tmp_path / "demo")
+        cache = MagicMock()
+        cache.get.return_value = None
+        cache.set.return_value = tmp_path
+        cache.store_object.side_effect = lambda path: path
+        return RegistrySource(client=client, loader=MagicMock(), cache=cache)
+
+    def test_fetch_picks_newest_matching_version(self, source):
+        fetched = source.fetch("registry:demo@^1.0.0")
+        assert fetched[0].source_string == "registry:demo@1.4.10"
+        source.client.download.assert_called_once()
+
+    def test_fetch_no_matching_version(self, source):
+        with pytest.raises(FetchError):
+            source.fetch("registry:demo@^3.0.0")
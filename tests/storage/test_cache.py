@@ -0,0 +1,143 @@
+"""Tests for cache management."""
+
+from __future__ import annotations
+
+import pytest
+
+from aiskills.storage.cache import CacheManager
+from aiskills.storage.paths import PathResolver
+
+
+class TestCacheManager:
+    """Tests for CacheManager class."""
+
+    @pytest.fixture
+    def cache(self, mock_config, tmp_path):
+        return CacheManager(PathResolver(config=mock_config, cwd=tmp_path))
+
+    @pytest.fixture
+    def make_entry(self, cache, simple_skill_content):
+        """Create a cache entry containing one skill directory."""
+
+        def _make(source: str, content: str = simple_skill_content):
+            entry = cache.set("registry", source)
+            skill_dir = entry / "simple-skill"
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(content)
+            return skill_dir
+
+        return _make
+
+    def test_set_and_get(self, cache):
+        path = cache.set("github", "owner/repo")
+        assert path.exists()
+        assert cache.get("github", "owner/repo") == path
+
+    def test_store_object_deduplicates(self, cache, make_entry):
+        first = cache.store_object(make_entry("simple@1.0.0"))
+        second = cache.store_object(make_entry("simple@latest"))
+
+        assert first.is_symlink()
+        assert second.is_symlink()
+        assert first.resolve() == second.resolve()
+        assert len(list(cache.objects_dir.iterdir())) == 1
+        assert (second / "SKILL.md").exists()
+
+    def test_store_object_distinct_content(self, cache, make_entry, simple_skill_content):
+        cache.store_object(make_entry("a"))
+        cache.store_object(make_entry("b", simple_skill_content + "\nMore.\n"))
+        assert len(list(cache.objects_dir.iterdir())) == 2
+
+    def test_store_object_distinct_extra_files(self, cache, make_entry):
+        """Skills with the same SKILL.md but different files are not merged."""
+        first_dir = make_entry("a")
+        (first_dir / "scripts").mkdir()
+        (first_dir / "scripts" / "run.sh").write_bytes(b"echo a\n")
+        second_dir = make_entry("b")
+        (second_dir / "scripts").mkdir()
+        (second_dir / "scripts" / "run.sh").write_bytes(b"echo b\n")
+
+        first = cache.store_object(first_dir)
+        second = cache.store_object(second_dir)
+
+        assert first.resolve() != second.resolve()
+        assert len(list(cache.objects_dir.iterdir())) == 2
+        assert (first / "scripts" / "run.sh").read_bytes() == b"echo a\n"
+        assert (second / "scripts" / "run.sh").read_bytes() == b"echo b\n"
+
+    def test_invalidate_keeps_shared_object(self, cache, make_entry):
+        cache.store_object(make_entry("a"))
+        kept = cache.store_object(make_entry("b"))
+
+        assert cache.invalidate("registry", "a")
+        assert cache.prune_objects() == 0
+        assert (kept / "SKILL.md").exists()
+
+    def test_prune_objects_unreferenced(self, cache, make_entry):
+        cache.store_object(make_entry("a"))
+        cache.invalidate("registry", "a")
+        assert cache.prune_objects() == 1
+        assert list(cache.objects_dir.iterdir()) == []
+
+    def test_prune_objects_ignores_clone_contents(self, cache, make_entry):
+        """Only registry/<hash>/<slug> links keep objects alive."""
+        obj = cache.store_object(make_entry("a")).resolve()
+        cache.invalidate("registry", "a")
+        clone = cache.set("github", "owner/repo") / "repo" / "nested"
+        clone.mkdir(parents=True)
+        (clone / "link").symlink_to(obj, target_is_directory=True)
+
+        assert cache.prune_objects() == 1
+        assert not obj.exists()
+
+    def test_clear_skips_objects(self, cache, make_entry):
+        cache.store_object(make_entry("a"))
+        cache.store_object(make_entry("b"))
+        assert cache.clear() == 2
+        assert list(cache.objects_dir.iterdir()) == []
+
+    def test_prune_expired_keeps_objects(self, cache, make_entry):
+        cache.store_object(make_entry("a"))
+        assert cache.prune_expired() == 0
+        assert len(list(cache.objects_dir.iterdir())) == 1
+
+    def test_stats_count_entries_not_objects(self, cache, make_entry):
+        cache.store_object(make_entry("a"))
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 1
+        assert stats["total_size_bytes"] > 0
+
+    def test_clear_many_entries(self, cache):
+        for i in range(10):
+            cache.set("github", f"owner/repo-{i}")
+        cache.set("git", "https://example.com/repo.git")
+        assert cache.clear("github") == 10
+        assert cache.clear() == 1
+
+    def test_prune_expired_many_entries(self, cache):
+        for i in range(5):
+            (cache.set("github", f"owner/repo-{i}") / ".timestamp").write_text("0")
+        cache.set("github", "owner/fresh")
+        assert cache.prune_expired() == 5
+        assert cache.get("github", "owner/fresh") is not None
+
+    def test_maintenance_prunes_and_reports(self, cache, make_entry):
+        cache.store_object(make_entry("a"))
+        (cache.set("github", "owner/old") / ".timestamp").write_text("0")
+
+        stats = cache.maintenance()
+        assert stats["pruned_entries"] == 1
+        assert stats["total_entries"] == 1
+        assert stats["expired_entries"] == 0
+        assert stats["total_size_bytes"] > 0
+        assert cache.get_stats()["total_entries"] == 1
+
+    def test_get_stats_counts_expired(self, cache):
+        (cache.set("github", "owner/old") / ".timestamp").write_text("0")
+        cache.set("github", "owner/new")
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["expired_entries"] == 1
+        assert stats["valid_entries"] == 1
+        assert "pruned_entries" not in stats
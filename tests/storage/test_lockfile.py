@@ -0,0 +1,104 @@
+"""Tests for lock file management."""
+
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from aiskills.storage.lockfile import LockFileManager
+from aiskills.storage.paths import PathResolver
+
+
+class TestLockFileManager:
+    """Tests for LockFileManager class."""
+
+    @pytest.fixture
+    def resolver(self, mock_config, tmp_path):
+        return PathResolver(config=mock_config, cwd=tmp_path)
+
+    @pytest.fixture
+    def lock_path(self, resolver):
+        path = resolver.get_lock_file_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": "1",
+            "generated_at": 100.0,
+            "aiskills_version": "0.1.0",
+            "skills": {
+                "alpha": {
+                    "name": "alpha",
+                    "version": "1.0.0",
+                    "content_hash": "aaa",
+                    "source": "local:/alpha",
+                },
+                "beta": {
+                    "name": "beta",
+                    "version": "2.1.0",
+                    "content_hash": "bbb",
+                    "source": "github:owner/beta",
+                },
+            },
+        }
+        path.write_text(yaml.dump(data))
+        return path
+
+    @pytest.fixture
+    def manager(self, resolver):
+        return LockFileManager(resolver)
+
+    def test_has_skill_does_not_materialize(self, manager, lock_path):
+        assert manager.has_skill("alpha")
+        assert manager.has_skill("beta", "2.1.0")
+        assert not manager.has_skill("beta", "1.0.0")
+        assert not manager.has_skill("missing")
+        assert manager._skills_cache == {}
+
+    def test_get_locked_skill_is_cached(self, manager, lock_path):
+        locked = manager.get_locked_skill("alpha")
+        assert locked is not None
+        assert locked.content_hash == "aaa"
+        assert manager.get_locked_skill("alpha") is locked
+        assert "beta" not in manager._skills_cache
+
+    def test_get_locked_skill_missing(self, manager, lock_path):
+        assert manager.get_locked_skill("missing") is None
+
+    def test_list_locked(self, manager, lock_path):
+        assert manager.list_locked() == [("alpha", "1.0.0"), ("beta", "2.1.0")]
+        assert manager._skills_cache == {}
+
+    def test_no_lock_file(self, manager):
+        assert not manager.has_skill("alpha")
+        assert manager.get_locked_skill("alpha") is None
+        assert manager.list_locked() == []
+
+    def test_load_returns_lock_file(self, manager, lock_path):
+        lock = manager.load()
+        assert sorted(lock.skills) == ["alpha", "beta"]
+        assert lock.skills["alpha"].content_hash == "aaa"
+        assert lock.generated_at == 100.0
+
+    def test_open_does_not_materialize(self, manager, lock_path):
+        manager.open(create=False)
+        assert manager._skills_cache == {}
+        assert manager.get_locked_skill("beta").version == "2.1.0"
+        assert list(manager._skills_cache) == ["beta"]
+
+    def test_open_missing_without_create(self, manager):
+        with pytest.raises(FileNotFoundError):
+            manager.open(create=False)
+
+    def test_load_missing_without_create(self, manager):
+        with pytest.raises(FileNotFoundError):
+            manager.load(create=False)
+
+    def test_remove_and_save_roundtrip(self, manager, lock_path, resolver):
+        assert manager.remove_skill("alpha")
+        assert not manager.remove_skill("alpha")
+        manager.save()
+
+        reloaded = LockFileManager(resolver)
+        assert reloaded.list_locked() == [("beta", "2.1.0")]
+        lock = reloaded.to_lock_file()
+        assert lock.generated_at == 100.0
+        assert lock.skills["beta"].source == "github:owner/beta"
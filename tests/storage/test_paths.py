@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -57,15 +59,13 @@ class TestPathResolver:
         dirs = resolver.get_search_dirs()
         # Project should be first
         assert len(dirs) >= 1
-        assert dirs[0][0] == project_skills
-        assert dirs[0][1] == ".aiskills"
+        assert dirs[0] == (project_skills, "project", ".aiskills")
 
     def test_get_search_dirs_with_global(self, resolver, tmp_global_dir):
         # Global dir already has skills/ created
         dirs = resolver.get_search_dirs()
         # Only global should be present (no project dirs)
-        assert len(dirs) == 1
-        assert "global" in str(dirs[0][0])
+        assert dirs == [(tmp_global_dir / "skills", "global", ".aiskills")]
 
     def test_get_search_dirs_priority(self, resolver, tmp_path, tmp_global_dir):
         """Project dirs should come before global."""
@@ -76,8 +76,8 @@ class TestPathResolver:
         dirs = resolver.get_search_dirs()
         # Project should be first
         assert len(dirs) == 2
-        assert dirs[0][0] == project_skills
-        assert "global" in str(dirs[1][0])
+        assert dirs[0][:2] == (project_skills, "project")
+        assert dirs[1][:2] == (tmp_global_dir / "skills", "global")
 
     def test_get_search_dirs_multiple_project_dirs(self, resolver, tmp_path, tmp_global_dir):
         """All project directory types are searched."""
@@ -87,7 +87,7 @@ class TestPathResolver:
         (tmp_path / ".agent" / "skills").mkdir(parents=True)
 
         dirs = resolver.get_search_dirs()
-        location_types = [d[1] for d in dirs]
+        location_types = [d[2] for d in dirs]
 
         assert ".aiskills" in location_types
         assert ".claude" in location_types
@@ -100,6 +100,45 @@ class TestPathResolver:
         paths = resolver.get_all_search_paths()
         assert project_skills in paths
 
+    def test_get_search_dirs_cached(self, resolver, tmp_path):
+        first = resolver.get_search_dirs()
+        assert resolver._search_dirs_cache is not None
+        assert resolver.get_search_dirs() == first
+
+    def test_get_search_dirs_invalidated_by_new_project_dir(self, resolver, tmp_path):
+        assert len(resolver.get_search_dirs()) == 1
+        (tmp_path / ".claude" / "skills").mkdir(parents=True)
+        dirs = resolver.get_search_dirs()
+        assert [d[2] for d in dirs][0] == ".claude"
+
+    def test_get_search_dirs_invalidated_by_skills_in_existing_dir(self, resolver, tmp_path):
+        (tmp_path / ".claude").mkdir()
+        assert len(resolver.get_search_dirs()) == 1
+        (tmp_path / ".claude" / "skills").mkdir()
+        assert resolver.get_search_dirs()[0][0] == tmp_path / ".claude" / "skills"
+
+    def test_get_search_dirs_cached_stats_project_root_only(
+        self, resolver, tmp_path, tmp_global_dir, monkeypatch
+    ):
+        (tmp_path / ".claude" / "skills").mkdir(parents=True)
+        first = resolver.get_search_dirs()
+
+        stat = MagicMock(wraps=os.stat)
+        monkeypatch.setattr(os, "stat", stat)
+        assert resolver.get_search_dirs() == first
+        stat.assert_called_once_with(str(tmp_path))
+
+    def test_get_search_dirs_invalidated_by_ensure_dirs(self, resolver, tmp_path):
+        (tmp_path / ".aiskills").mkdir()
+        assert len(resolver.get_search_dirs()) == 1
+        resolver.ensure_dirs()
+        assert resolver.get_search_dirs()[0][0] == tmp_path / ".aiskills" / "skills"
+
+    def test_clear_cache(self, resolver):
+        resolver.get_search_dirs()
+        resolver.clear_cache()
+        assert resolver._search_dirs_cache is None
+
     # find_skill tests
     def test_find_skill_not_found(self, resolver):
         result = resolver.find_skill("nonexistent")
@@ -174,6 +213,48 @@ class TestPathResolver:
         result = resolver.find_skill("empty-dir")
         assert result is None
 
+    def test_find_skill_negative_cache(self, resolver, tmp_path, simple_skill_content):
+        assert resolver.find_skill("late-skill") is None
+        assert "late-skill" in resolver._neg_cache
+
+        skill_dir = tmp_path / ".aiskills" / "skills" / "late-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(simple_skill_content)
+
+        # Cached miss until invalidated
+        assert resolver.find_skill("late-skill") is None
+        resolver.clear_cache()
+        assert resolver.find_skill("late-skill") is not None
+
+    def test_find_skill_negative_cache_expires(
+        self, resolver, tmp_path, simple_skill_content, monkeypatch
+    ):
+        monkeypatch.setattr(PathResolver, "LISTING_TTL", 0.0)
+        assert resolver.find_skill("late-skill") is None
+
+        skill_dir = tmp_path / ".aiskills" / "skills" / "late-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(simple_skill_content)
+
+        assert resolver.find_skill("late-skill") is not None
+
+    def test_find_skills_bulk(self, resolver, tmp_path, tmp_global_dir, simple_skill_content):
+        project_skill = tmp_path / ".aiskills" / "skills" / "shared-skill"
+        global_skill = tmp_global_dir / "skills" / "global-skill"
+        for skill_dir in (project_skill, global_skill, tmp_global_dir / "skills" / "shared-skill"):
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(simple_skill_content)
+
+        found = resolver.find_skills(["shared-skill", "global-skill", "missing"])
+        assert found == {
+            "shared-skill": (project_skill, "project", ".aiskills"),
+            "global-skill": (global_skill, "global", ".aiskills"),
+            "missing": None,
+        }
+        assert "missing" in resolver._neg_cache
+        for name in ("shared-skill", "global-skill"):
+            assert found[name] == resolver.find_skill(name)
+
     # get_install_path tests
     def test_get_install_path_project(self, resolver, tmp_path):
         path = resolver.get_install_path("new-skill")
@@ -223,6 +304,11 @@ class TestPathResolver:
         assert cache_dir.exists()
         assert cache_dir == tmp_global_dir / "cache"
 
+    def test_get_cache_dir_mkdir_once(self, resolver, monkeypatch):
+        resolver.get_cache_dir()
+        monkeypatch.setattr(Path, "mkdir", lambda *a, **k: pytest.fail("mkdir called"))
+        assert resolver.get_cache_dir().exists()
+
     # get_registry_dir tests
     def test_get_registry_dir(self, resolver, tmp_global_dir):
         registry_dir = resolver.get_registry_dir()
@@ -281,6 +367,21 @@ class TestPathResolver:
         # Note: is_local_path uses Path without cwd, so this test might not work
         # as expected. The function checks if path exists relative to cwd.
 
+    def test_is_local_path_existing_relative(self, resolver, tmp_path, monkeypatch):
+        (tmp_path / "owner" / "repo").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+        assert resolver.is_local_path("owner/repo") is True
+
+    def test_is_local_path_no_stat_for_explicit(self, resolver, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected filesystem access")
+
+        monkeypatch.setattr(Path, "exists", fail)
+        assert resolver.is_local_path("/abs") is True
+        assert resolver.is_local_path("~/x") is True
+        assert resolver.is_local_path("./x") is True
+        assert resolver.is_local_path("https://github.com/o/r") is False
+
 
 class TestGetPathResolver:
     """Tests for get_path_resolver singleton."""
@@ -293,3 +394,10 @@ class TestGetPathResolver:
         r1 = get_path_resolver()
         r2 = get_path_resolver()
         assert r1 is r2
+
+    def test_cache_clear_resets_singleton(self):
+        r1 = get_path_resolver()
+        get_path_resolver.cache_clear()
+        r2 = get_path_resolver()
+        assert r1 is not r2
+        assert get_path_resolver() is r2
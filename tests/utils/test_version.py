@@ -0,0 +1,210 @@
+"""Tests for semantic versioning utilities."""
+
+from __future__ import annotations
+
+import json
+from typing import get_args
+
+import pytest
+
+from aiskills.utils.version import (
+    ConstraintOperator,
+    SemanticVersion,
+    VersionBump,
+    VersionConstraint,
+    compare_versions,
+    find_latest,
+    is_newer,
+    satisfies_constraint,
+)
+
+
+class TestSemanticVersion:
+    """Tests for SemanticVersion."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("1.2.3", (1, 2, 3, None, None)),
+            ("v1.2.3", (1, 2, 3, None, None)),
+            ("0.0.0", (0, 0, 0, None, None)),
+            ("1.2.3-alpha.1", (1, 2, 3, "alpha.1", None)),
+            ("1.2.3+build.5", (1, 2, 3, None, "build.5")),
+            ("2.0.0-beta+exp.sha", (2, 0, 0, "beta", "exp.sha")),
+        ],
+    )
+    def test_parse(self, text, expected):
+        v = SemanticVersion.parse(text)
+        assert (v.major, v.minor, v.patch, v.prerelease, v.build) == expected
+
+    @pytest.mark.parametrize("text", ["", "1", "1.2", "1.2.3.4", "01.2.3", "a.b.c", "1.2.3-", "1.2.3-01"])
+    def test_parse_invalid(self, text):
+        with pytest.raises(ValueError):
+            SemanticVersion.parse(text)
+
+    def test_try_parse(self):
+        assert SemanticVersion.try_parse("1.0.0") == SemanticVersion(1, 0, 0)
+        assert SemanticVersion.try_parse("nope") is None
+
+    def test_str(self):
+        assert str(SemanticVersion.parse("1.2.3-rc.1+b.2")) == "1.2.3-rc.1+b.2"
+
+    def test_equality_ignores_build(self):
+        assert SemanticVersion.parse("1.0.0+a") == SemanticVersion.parse("1.0.0+b")
+        assert hash(SemanticVersion.parse("1.0.0+a")) == hash(SemanticVersion.parse("1.0.0"))
+
+    def test_ordering_spec_example(self):
+        ordered = [
+            "1.0.0-alpha",
+            "1.0.0-alpha.1",
+            "1.0.0-alpha.beta",
+            "1.0.0-beta",
+            "1.0.0-beta.2",
+            "1.0.0-beta.11",
+            "1.0.0-rc.1",
+            "1.0.0",
+            "1.0.1",
+            "1.1.0",
+            "2.0.0",
+        ]
+        parsed = [SemanticVersion.parse(v) for v in ordered]
+        for lower, higher in zip(parsed, parsed[1:]):
+            assert lower < higher
+            assert higher > lower
+            assert not higher < lower
+        assert sorted(reversed(parsed)) == parsed
+
+    def test_sort_key_cached(self):
+        v = SemanticVersion.parse("1.0.0-rc.1")
+        assert v.sort_key is v.sort_key
+        assert "_sort_key" not in repr(v)
+
+    def test_parse_interns_labels(self):
+        a = SemanticVersion.parse("1.0.0-" + "".join(["rc", ".1"]))
+        b = SemanticVersion.parse("2.0.0-rc.1+build.5")
+        assert a.prerelease is b.prerelease
+        assert b.build == "build.5"
+
+    def test_slots(self):
+        assert not hasattr(SemanticVersion(1, 0, 0), "__dict__")
+        assert not hasattr(VersionConstraint.parse("^1.0.0"), "__dict__")
+
+    def test_bump(self):
+        v = SemanticVersion(1, 2, 3)
+        assert v.bump(VersionBump.MAJOR) == SemanticVersion(2, 0, 0)
+        assert v.bump(VersionBump.MINOR) == SemanticVersion(1, 3, 0)
+        assert v.bump(VersionBump.PATCH) == SemanticVersion(1, 2, 4)
+        assert v.bump(VersionBump.PRERELEASE) == SemanticVersion(1, 2, 4, "alpha.1")
+
+    def test_bump_accepts_names(self):
+        v = SemanticVersion(1, 2, 3)
+        assert v.bump("minor") == SemanticVersion(1, 3, 0)
+        assert VersionBump("PATCH") is VersionBump.PATCH
+        with pytest.raises(ValueError):
+            v.bump("huge")
+
+    def test_bump_values_are_strings(self):
+        assert VersionBump.MAJOR == "major"
+        assert VersionBump.PRERELEASE.value == "prerelease"
+        assert [VersionBump(b.value) for b in VersionBump] == list(VersionBump)
+        assert json.loads(json.dumps({"bump": VersionBump.MINOR})) == {"bump": "minor"}
+
+    def test_bump_prerelease(self):
+        assert SemanticVersion(1, 0, 0, "rc.1").bump(VersionBump.PRERELEASE).prerelease == "rc.2"
+        assert SemanticVersion(1, 0, 0, "beta").bump(VersionBump.PRERELEASE).prerelease == "beta.1"
+
+    def test_flags(self):
+        assert SemanticVersion.parse("1.0.0-rc.1").is_prerelease
+        assert SemanticVersion.parse("1.0.0").is_stable
+        assert not SemanticVersion.parse("0.9.0").is_stable
+
+
+class TestVersionConstraint:
+    """Tests for VersionConstraint."""
+
+    @pytest.mark.parametrize(
+        "text,operator,version",
+        [
+            ("*", "*", None),
+            ("latest", "*", None),
+            ("", "*", None),
+            ("^1.2.3", "^", "1.2.3"),
+            ("~1.2.3", "~", "1.2.3"),
+            (">=1.0.0", ">=", "1.0.0"),
+            ("<=1.0.0", "<=", "1.0.0"),
+            (">1.0.0", ">", "1.0.0"),
+            ("<1.0.0", "<", "1.0.0"),
+            ("=1.0.0", "=", "1.0.0"),
+            ("1.0.0", "=", "1.0.0"),
+            ("1.2.*", "~", "1.2.0"),
+            ("  ^2.0.0 ", "^", "2.0.0"),
+        ],
+    )
+    def test_parse(self, text, operator, version):
+        c = VersionConstraint.parse(text)
+        assert c.operator == operator
+        assert (str(c.version) if c.version else None) == version
+
+    def test_parse_invalid(self):
+        with pytest.raises(ValueError):
+            VersionConstraint.parse(">=nope")
+
+    @pytest.mark.parametrize(
+        "constraint,version,expected",
+        [
+            ("*", "0.0.1", True),
+            ("=1.0.0", "1.0.0", True),
+            ("=1.0.0", "1.0.1", False),
+            (">=1.0.0", "1.0.0", True),
+            (">=1.0.0", "0.9.9", False),
+            ("<=1.0.0", "1.0.0", True),
+            ("<=1.0.0", "1.0.1", False),
+            (">1.0.0", "1.0.0", False),
+            (">1.0.0", "1.0.1", True),
+            ("<1.0.0", "1.0.0-rc.1", True),
+            ("<1.0.0", "1.0.0", False),
+            ("^1.2.3", "1.9.0", True),
+            ("^1.2.3", "2.0.0", False),
+            ("^1.2.3", "1.2.2", False),
+            ("^0.2.3", "0.2.9", True),
+            ("^0.2.3", "0.3.0", False),
+            ("~1.2.3", "1.2.9", True),
+            ("~1.2.3", "1.3.0", False),
+            ("1.2.*", "1.2.7", True),
+            ("1.2.*", "1.3.0", False),
+        ],
+    )
+    def test_satisfies(self, constraint, version, expected):
+        assert satisfies_constraint(version, constraint) is expected
+
+    def test_every_operator_dispatches(self):
+        assert set(VersionConstraint._SATISFIES) == set(get_args(ConstraintOperator))
+
+    def test_str(self):
+        assert str(VersionConstraint.parse("^1.2.3")) == "^1.2.3"
+        assert str(VersionConstraint.parse("latest")) == "*"
+
+
+class TestHelpers:
+    """Tests for module-level helpers."""
+
+    def test_compare_versions(self):
+        assert compare_versions("1.0.0", "2.0.0") == -1
+        assert compare_versions("2.0.0", "1.0.0") == 1
+        assert compare_versions("1.0.0", "1.0.0+build") == 0
+
+    def test_is_newer(self):
+        assert is_newer("1.0.0", "1.0.1")
+        assert not is_newer("1.0.1", "1.0.0")
+
+    def test_find_latest(self):
+        versions = ["1.0.0", "2.0.0-beta.1", "1.5.0", "garbage", "v1.10.0"]
+        assert find_latest(versions) == "v1.10.0"
+        assert find_latest(versions, include_prerelease=True) == "2.0.0-beta.1"
+
+    def test_find_latest_tie_keeps_first(self):
+        assert find_latest(["1.0.0+a", "1.0.0+b", "v1.0.0"]) == "1.0.0+a"
+
+    def test_find_latest_empty(self):
+        assert find_latest([]) is None
+        assert find_latest(["garbage", "2.0.0-rc.1"]) is None
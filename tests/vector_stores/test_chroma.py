@@ -0,0 +1,393 @@
+"""Tests for the ChromaDB vector store."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Skip all tests if ChromaDB is not installed
+pytest.importorskip("chromadb")
+
+import numpy as np
+
+from aiskills.vector_stores import chroma
+from aiskills.vector_stores.base import VectorStoreError
+from aiskills.vector_stores.chroma import (
+    SQLITE_FILE,
+    ChromaVectorStore,
+    configure_hnsw_params,
+    get_chroma_store,
+)
+
+
+class TestChromaVectorStore:
+    """Tests for ChromaVectorStore class."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return ChromaVectorStore(persist_dir=tmp_path / "vectors", batch_size=2)
+
+    @pytest.fixture
+    def mock_collection(self, store):
+        collection = MagicMock()
+        store._collection = collection
+        store.brute_force_limit = 0
+        return collection
+
+    def test_add_and_query(self, store):
+        store.add(
+            ids=["a", "b", "c"],
+            embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+            documents=["A", "B", "C"],
+            metadatas=[{"tags": ["x", "y"]}, {"n": 1}, {"n": 2}],
+        )
+        assert store.count() == 3
+
+        results = store.query([1.0, 0.1, 0.0], n_results=2)
+        assert [r.id for r in results] == ["a", "b"]
+        assert results[0].metadata == {"tags": "x,y"}
+        assert results[0].score > results[1].score
+
+    def test_persistent_store_uses_wal(self, store, tmp_path):
+        store.count()
+        conn = sqlite3.connect(tmp_path / "vectors" / SQLITE_FILE)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_query_batch(self, store):
+        store.add(
+            ids=["a", "b"],
+            embeddings=[[1.0, 0.0], [0.0, 1.0]],
+            documents=["A", "B"],
+            metadatas=[{"n": 1}, {"n": 2}],
+        )
+        batch = store.query_batch([[0.0, 1.0], [1.0, 0.1], [0.9, 0.0]], n_results=1)
+        assert [[r.id for r in results] for results in batch] == [["b"], ["a"], ["a"]]
+        assert batch[1][0] == store.query([1.0, 0.1], n_results=1)[0]
+
+    def test_brute_force_matches_index(self, store, tmp_path):
+        vectors = [[1.0, 0.0, 0.2], [0.3, 1.0, 0.0], [0.0, 0.4, 1.0], [-1.0, 0.0, 0.0]]
+        store.add(
+            ids=["a", "b", "c", "d"],
+            embeddings=vectors,
+            documents=list("ABCD"),
+            metadatas=[{"n": i} for i in range(4)],
+        )
+        indexed = ChromaVectorStore(persist_dir=tmp_path / "vectors", brute_force_limit=0)
+
+        query = [0.5, 0.5, 0.1]
+        brute = store.query(query, n_results=3)
+        assert store._matrix is not None
+        expected = indexed.query(query, n_results=3)
+        assert [r.id for r in brute] == [r.id for r in expected]
+        for got, want in zip(brute, expected):
+            assert got.score == pytest.approx(want.score, abs=1e-5)
+            assert got.metadata == want.metadata
+
+        # Opposite vector clamps to a score of 0
+        assert store.query([1.0, 0.0, 0.0], n_results=4)[-1].score == 0.0
+
+    def test_brute_force_invalidated_on_write(self, store):
+        store.add(ids=["a"], embeddings=[[1.0, 0.0]], documents=["A"], metadatas=[{"n": 1}])
+        assert [r.id for r in store.query([0.0, 1.0])] == ["a"]
+        store.add(ids=["b"], embeddings=[[0.0, 1.0]], documents=["B"], metadatas=[{"n": 2}])
+        assert store.query([0.0, 1.0])[0].id == "b"
+        store.delete(["b"])
+        assert [r.id for r in store.query([0.0, 1.0])] == ["a"]
+
+    def test_count_cached_until_write(self, store, mock_collection):
+        mock_collection.count.return_value = 5
+        assert store.count() == 5
+        assert store.count() == 5
+        mock_collection.count.assert_called_once()
+
+        for write in (
+            lambda: store.add(ids=["a"], embeddings=[[1.0]], documents=["A"]),
+            lambda: store.delete(["a"]),
+            store.clear,
+        ):
+            write()
+            store._collection = mock_collection
+            mock_collection.count.return_value += 1
+            assert store.count() == mock_collection.count.return_value
+
+    def test_write_through_other_store_visible(self, store, tmp_path):
+        store.add(ids=["a"], embeddings=[[1.0, 0.0]], documents=["A"], metadatas=[{"n": 1}])
+        assert [r.id for r in store.query([0.0, 1.0])] == ["a"]
+        assert store.count() == 1
+
+        other = ChromaVectorStore(persist_dir=tmp_path / "vectors")
+        other.add(ids=["b"], embeddings=[[0.0, 1.0]], documents=["B"], metadatas=[{"n": 2}])
+        assert store.query([0.0, 1.0])[0].id == "b"
+        assert store.count() == 2
+
+        other.delete(["b"])
+        assert [r.id for r in store.query([0.0, 1.0])] == ["a"]
+        assert store.count() == 1
+
+    def test_snapshot_reloaded_after_external_write(self, store, mock_collection, tmp_path):
+        """Another process writing the SQLite file invalidates the snapshot."""
+        store.brute_force_limit = 10
+        mock_collection.count.return_value = 1
+        mock_collection.get.return_value = {
+            "ids": ["a"], "embeddings": [[1.0, 0.0]], "documents": ["A"], "metadatas": [{}],
+        }
+        db = tmp_path / "vectors" / SQLITE_FILE
+        db.parent.mkdir(parents=True, exist_ok=True)
+        db.write_bytes(b"")
+
+        store.query([1.0, 0.0])
+        store.query([1.0, 0.0])
+        assert store.count() == 1
+        mock_collection.get.assert_called_once()
+
+        stat = db.stat()
+        os.utime(db, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        mock_collection.get.return_value = {
+            "ids": ["a", "b"],
+            "embeddings": [[1.0, 0.0], [0.0, 1.0]],
+            "documents": ["A", "B"],
+            "metadatas": [{}, {}],
+        }
+        assert [r.id for r in store.query([0.0, 1.0])] == ["b", "a"]
+        assert mock_collection.get.call_count == 2
+        assert store.count() == 2
+
+    def test_query_batch_empty(self, store):
+        assert store.query_batch([]) == []
+
+    def test_collection_shared_between_stores(self, store, tmp_path):
+        other = ChromaVectorStore(persist_dir=tmp_path / "vectors")
+        assert other._get_collection() is store._get_collection()
+
+    def test_clear_then_add(self, store):
+        store.add(ids=["a"], embeddings=[[1.0, 0.0]], documents=["A"], metadatas=[{"n": 1}])
+        store.clear()
+        store.add(ids=["b"], embeddings=[[0.0, 1.0]], documents=["B"], metadatas=[{"n": 2}])
+        assert store.count() == 1
+
+    def test_clear_missing_collection(self, store):
+        client = MagicMock()
+        client.list_collections.return_value = []
+        store._client = client
+        store.clear()
+        client.delete_collection.assert_not_called()
+
+    def test_clear_logs_failure(self, store, caplog):
+        client = MagicMock()
+        client.list_collections.side_effect = RuntimeError("unavailable")
+        client.delete_collection.side_effect = RuntimeError("locked")
+        store._client = client
+        with caplog.at_level("DEBUG", logger="aiskills.vector_stores.chroma"):
+            store.clear()
+        client.delete_collection.assert_called_once_with(store.collection_name)
+        assert "locked" in caplog.text
+        assert store._collection is None
+
+    def test_add_batches_upserts(self, store, mock_collection):
+        store.add(
+            ids=["a", "b", "c", "d", "e"],
+            embeddings=[[float(i), 1.0] for i in range(5)],
+            documents=list("ABCDE"),
+            metadatas=[{"n": i} for i in range(5)],
+        )
+        calls = mock_collection.upsert.call_args_list
+        assert [c.kwargs["ids"] for c in calls] == [["a", "b"], ["c", "d"], ["e"]]
+        assert calls[2].kwargs["embeddings"].shape == (1, 2)
+
+    def test_add_error_reports_batch(self, store, mock_collection):
+        mock_collection.upsert.side_effect = [None, RuntimeError("boom")]
+        with pytest.raises(VectorStoreError, match="batch 1"):
+            store.add(
+                ids=["a", "b", "c"],
+                embeddings=[[1.0], [2.0], [3.0]],
+                documents=["A", "B", "C"],
+                metadatas=[{"n": 1}] * 3,
+            )
+
+    def test_delete_batches(self, store, mock_collection):
+        store.delete_batch_size = 2
+        store.delete(["a", "b", "c"])
+        calls = mock_collection.delete.call_args_list
+        assert [c.kwargs["ids"] for c in calls] == [["a", "b"], ["c"]]
+
+    def test_delete_error_reports_batch(self, store, mock_collection):
+        store.delete_batch_size = 1
+        mock_collection.delete.side_effect = [None, RuntimeError("boom")]
+        with pytest.raises(VectorStoreError, match="batch 1"):
+            store.delete(["a", "b"])
+
+    def test_add_pipelined_error_reports_batch(self, store, mock_collection):
+        mock_collection.upsert.side_effect = [None, RuntimeError("boom"), None]
+        with pytest.raises(VectorStoreError, match="batch 1"):
+            store.add(
+                ids=list("abcde"),
+                embeddings=[[1.0]] * 5,
+                documents=list("ABCDE"),
+            )
+
+    def test_add_pipelined_roundtrip(self, store):
+        ids = [f"doc-{i}" for i in range(9)]
+        store.add(
+            ids=ids,
+            embeddings=[[1.0, float(i)] for i in range(9)],
+            documents=ids,
+            metadatas=[{"n": i} for i in range(9)],
+        )
+        assert store.count() == 9
+        assert [d["metadata"] for d in store.get(["doc-8"])] == [{"n": 8}]
+
+    def test_add_cleans_metadata(self, store, mock_collection):
+        store.add(
+            ids=["a"],
+            embeddings=[[1.0]],
+            documents=["A"],
+            metadatas=[
+                {"s": "x", "i": 1, "f": 0.5, "b": True, "l": [1, "y"], "n": None, "p": {"k": 1}}
+            ],
+        )
+        assert mock_collection.upsert.call_args.kwargs["metadatas"] == [
+            {"s": "x", "i": 1, "f": 0.5, "b": True, "l": "1,y", "p": "{'k': 1}"}
+        ]
+
+    def test_add_normalizes_embeddings(self, store, mock_collection):
+        embeddings = np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+        store.add(ids=["a", "b"], embeddings=embeddings, documents=["A", "B"])
+
+        stored = mock_collection.upsert.call_args.kwargs["embeddings"]
+        np.testing.assert_allclose(stored, [[0.6, 0.8], [0.0, 0.0]])
+        # Caller's array is left untouched
+        np.testing.assert_array_equal(embeddings[0], [3.0, 4.0])
+
+    def test_list_embeddings_sent_as_float32_arrays(self, store, mock_collection):
+        store.add(ids=["a", "b"], embeddings=[[1.0, 0.0], [0.0, 2.0]], documents=["A", "B"])
+        stored = mock_collection.upsert.call_args.kwargs["embeddings"]
+        assert isinstance(stored, np.ndarray)
+        assert stored.dtype == np.float32 and stored.flags.c_contiguous
+
+        mock_collection.query.return_value = {
+            "ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]
+        }
+        store.query([1.0, 0.0])
+        sent = mock_collection.query.call_args.kwargs["query_embeddings"]
+        assert sent.dtype == np.float32 and sent.shape == (1, 2)
+
+    def test_add_without_metadata(self, store):
+        store.add(ids=["a", "b", "c"], embeddings=[[1.0, 0.0]] * 3, documents=list("ABC"))
+        assert [d["metadata"] for d in store.get(["a", "c"])] == [{}, {}]
+        assert store.query([1.0, 0.0], n_results=1)[0].metadata == {}
+
+    def test_normalize_disabled(self, tmp_path):
+        store = ChromaVectorStore(persist_dir=tmp_path, normalize=False)
+        store._collection = MagicMock()
+        store.add(ids=["a"], embeddings=[[3.0, 4.0]], documents=["A"])
+        stored = store._collection.upsert.call_args.kwargs["embeddings"]
+        np.testing.assert_array_equal(stored, [[3.0, 4.0]])
+
+    def test_float16_rounds_embeddings(self, tmp_path):
+        store = ChromaVectorStore(persist_dir=tmp_path, normalize=False, dtype="float16")
+        store._collection = MagicMock()
+        store.add(ids=["a"], embeddings=[[0.1, 1 / 3]], documents=["A"])
+
+        stored = store._collection.upsert.call_args.kwargs["embeddings"]
+        assert stored.dtype == np.float32
+        expected = np.array([[0.1, 1 / 3]], dtype=np.float16).astype(np.float32)
+        np.testing.assert_array_equal(stored, expected)
+
+    def test_invalid_dtype(self):
+        with pytest.raises(ValueError):
+            ChromaVectorStore(dtype="int4")
+
+    def test_query_missing_fields(self, store, mock_collection):
+        mock_collection.query.return_value = {
+            "ids": [["a", "b"]],
+            "documents": None,
+            "metadatas": [[None, {"n": 1}]],
+            "distances": [[0.25, 1.5]],
+        }
+        results = store.query([1.0, 0.0])
+        assert [(r.id, r.document, r.metadata) for r in results] == [
+            ("a", "", {}),
+            ("b", "", {"n": 1}),
+        ]
+        assert [r.score for r in results] == [0.75, 0.0]
+
+    def test_query_without_documents(self, store, tmp_path):
+        store.add(ids=["a"], embeddings=[[1.0, 0.0]], documents=["A"], metadatas=[{"n": 1}])
+        indexed = ChromaVectorStore(persist_dir=tmp_path / "vectors", brute_force_limit=0)
+        for source in (store, indexed):
+            results = source.query([1.0, 0.0], include_documents=False)
+            assert [(r.id, r.document, r.metadata) for r in results] == [("a", "", {"n": 1})]
+        assert store.query_batch([[1.0, 0.0]], include_documents=False)[0][0].document == ""
+
+    def test_query_no_results(self, store, mock_collection):
+        mock_collection.query.return_value = {
+            "ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]
+        }
+        assert store.query([1.0, 0.0]) == []
+
+    def test_get_missing_fields(self, store, mock_collection):
+        mock_collection.get.return_value = {
+            "ids": ["a", "b"],
+            "documents": ["A", "B"],
+            "metadatas": None,
+        }
+        docs = store.get(["a", "b"])
+        assert docs == [
+            {"id": "a", "document": "A", "metadata": {}},
+            {"id": "b", "document": "B", "metadata": {}},
+        ]
+        assert docs[0]["metadata"] is not docs[1]["metadata"]
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            ChromaVectorStore(batch_size=0)
+        with pytest.raises(ValueError):
+            ChromaVectorStore(delete_batch_size=0)
+
+    def test_client_shared_between_stores(self, store, tmp_path):
+        other = ChromaVectorStore(persist_dir=tmp_path / "vectors")
+        assert other._get_client() is store._get_client()
+        assert ChromaVectorStore()._get_client() is ChromaVectorStore()._get_client()
+
+    def test_chromadb_loaded_once(self):
+        module, settings = chroma._ensure_chromadb()
+        assert chroma._chromadb is module
+        assert chroma._ensure_chromadb() == (module, settings)
+
+    def test_chromadb_missing(self, monkeypatch):
+        monkeypatch.setattr(chroma, "_chromadb", None)
+        monkeypatch.setitem(sys.modules, "chromadb", None)
+        with pytest.raises(VectorStoreError, match="not installed"):
+            chroma._create_client(None)
+
+
+class TestHnswConfig:
+    """Tests for HNSW parameter configuration."""
+
+    @pytest.mark.parametrize(
+        "count,m",
+        [(0, 16), (99_999, 16), (100_000, 24), (999_999, 24), (1_000_000, 32)],
+    )
+    def test_configure_hnsw_params(self, count, m):
+        assert configure_hnsw_params(count)["M"] == m
+
+    def test_hnsw_config_applied_on_create(self, tmp_path):
+        store = ChromaVectorStore(
+            persist_dir=tmp_path, hnsw_config={"M": 24, "search_ef": 80}
+        )
+        metadata = store._get_collection().metadata
+        assert metadata["hnsw:space"] == "cosine"
+        assert metadata["hnsw:M"] == 24
+        assert metadata["hnsw:search_ef"] == 80
+
+    def test_factory_expected_count(self, tmp_path):
+        store = get_chroma_store(tmp_path, expected_count=500_000)
+        assert store.hnsw_config == configure_hnsw_params(500_000)
+        assert get_chroma_store(tmp_path).hnsw_config == {}